@@ -0,0 +1,128 @@
+"""Count the terminal bytes written while paging through a book.
+
+Usage: python benchmarks/bench_bandwidth.py [book.txt] [--steps N] [--size 100x30]
+
+Runs the app in a pseudo-terminal with a throwaway library, opens the book,
+presses PageDown ``--steps`` times and reports what the app wrote, once in
+normal mode and once in low-bandwidth mode.  Without a book the bundled
+test sample's paragraphs are repeated into long chapters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import os
+import pty
+import select
+import signal
+import struct
+import sys
+import tempfile
+import termios
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT / "src"))
+
+from novel_tui.core.parser import parse_book  # noqa: E402
+from novel_tui.db import connection, repository  # noqa: E402
+from novel_tui.db.models import UserSettings  # noqa: E402
+
+_SAMPLE = _ROOT / "tests" / "sample_novel.txt"
+_PAGE_DOWN = b"\x1b[6~"
+
+
+def sample_book(directory: Path) -> Path:
+    """A book of long chapters built from the test sample's paragraphs."""
+    paragraphs = [
+        line
+        for line in _SAMPLE.read_text(encoding="utf-8").splitlines()
+        if line.startswith("\u3000")
+    ]
+    path = directory / "sample.txt"
+    path.write_text(
+        "".join(
+            f"第{i}章 样章\n\n" + "\n".join(paragraphs * 10) + "\n\n" for i in range(1, 4)
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def make_library(data_home: Path, book_path: Path, low_bandwidth: bool) -> None:
+    db = data_home / "novel-tui" / "library.db"
+    db.parent.mkdir(parents=True, exist_ok=True)
+    connection.reset_connection()
+    connection.get_connection(db)
+    book, chapters = parse_book(book_path)
+    repository.import_book(book, chapters)
+    repository.save_settings(UserSettings(low_bandwidth=low_bandwidth))
+    connection.reset_connection()
+
+
+def drain(fd: int, quiet: float, timeout: float = 10.0) -> int:
+    """Read until nothing arrives for ``quiet`` seconds; returns bytes read."""
+    total = 0
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready, _, _ = select.select([fd], [], [], quiet)
+        if not ready:
+            break
+        try:
+            data = os.read(fd, 65536)
+        except OSError:
+            break
+        if not data:
+            break
+        total += len(data)
+    return total
+
+
+def run_session(book_path: Path, steps: int, cols: int, rows: int, low_bandwidth: bool) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_home = Path(tmp)
+        make_library(data_home, book_path, low_bandwidth)
+        pid, fd = pty.fork()
+        if pid == 0:
+            os.environ["XDG_DATA_HOME"] = str(data_home)
+            os.environ["TERM"] = "xterm-256color"
+            os.environ["PYTHONPATH"] = str(_ROOT / "src")
+            os.execv(sys.executable, [sys.executable, "-m", "novel_tui"])
+        try:
+            fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+            drain(fd, quiet=1.0)
+            os.write(fd, b"\r")  # open the first book
+            drain(fd, quiet=1.0)
+            written = 0
+            for _ in range(steps):
+                os.write(fd, _PAGE_DOWN)
+                written += drain(fd, quiet=0.15)
+            return written
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+            os.close(fd)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("book", nargs="?", type=Path, default=None)
+    parser.add_argument("--steps", type=int, default=20, help="PageDown presses")
+    parser.add_argument("--size", default="100x30", help="terminal COLSxROWS")
+    args = parser.parse_args()
+    cols, rows = map(int, args.size.split("x"))
+
+    scratch = tempfile.TemporaryDirectory()
+    book = args.book or sample_book(Path(scratch.name))
+    results = {}
+    for name, low in (("normal", False), ("low-bw", True)):
+        written = run_session(book, args.steps, cols, rows, low)
+        results[name] = written
+        print(f"{name:>8}: {written:9,} bytes, {written / args.steps:9,.0f} bytes/page")
+    print(f"{'saving':>8}: {1 - results['low-bw'] / results['normal']:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Time the launch of the app up to its first painted screen.
+
+Usage: python benchmarks/bench_startup.py [book.txt] [--runs N] [--shelf]
+
+Runs ``novel-tui --resume --timings`` (or, with ``--shelf``, without
+``--resume``) in a pseudo-terminal against a throwaway library holding the
+book, quits once the screen settles and reports the median of each startup
+milestone over ``--runs`` launches, against the target.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pty
+import re
+import select
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT / "src"))
+
+from bench_bandwidth import make_library, sample_book  # noqa: E402
+
+from novel_tui.core.perf import STARTUP_TARGET  # noqa: E402
+from novel_tui.db import connection, repository  # noqa: E402
+
+_CTRL_Q = b"\x11"
+_MARK = re.compile(r"^(\w[\w ]*?)\s+([\d.]+) ms  \(", re.MULTILINE)
+_ESCAPE = re.compile(r"\x1b(?:\[[0-9;?<>=]*[ -/]*[@-~]|[@-Z\\-_])")
+
+
+def read_until_quiet(fd: int, quiet: float, timeout: float = 10.0) -> bytes:
+    out = bytearray()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready, _, _ = select.select([fd], [], [], quiet)
+        if not ready:
+            break
+        try:
+            data = os.read(fd, 65536)
+        except OSError:
+            break
+        if not data:
+            break
+        out += data
+    return bytes(out)
+
+
+def launch(data_home: Path, args: list[str]) -> dict[str, float]:
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.environ["XDG_DATA_HOME"] = str(data_home)
+        os.environ["TERM"] = "xterm-256color"
+        os.environ["PYTHONPATH"] = str(_ROOT / "src")
+        os.execv(sys.executable, [sys.executable, "-m", "novel_tui", "--timings", *args])
+    try:
+        read_until_quiet(fd, quiet=1.0)
+        os.write(fd, _CTRL_Q)
+        output = read_until_quiet(fd, quiet=1.0).decode("utf-8", "replace")
+    finally:
+        os.waitpid(pid, 0)
+        os.close(fd)
+    report = _ESCAPE.sub("", output).replace("\r", "")
+    return {name: float(ms) for name, ms in _MARK.findall(report)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("book", nargs="?", type=Path, default=None)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--shelf", action="store_true", help="time the shelf, not --resume")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_home = Path(tmp)
+        book = args.book or sample_book(data_home)
+        make_library(data_home, book, low_bandwidth=False)
+        connection.get_connection(data_home / "novel-tui" / "library.db")
+        repository.update_read_progress(repository.get_all_books()[0].id, 0, 0)
+        connection.reset_connection()
+
+        runs = [launch(data_home, [] if args.shelf else ["--resume"]) for _ in range(args.runs)]
+    names = list(runs[0])
+    for name in names:
+        ms = statistics.median(run[name] for run in runs if name in run)
+        print(f"{name:>12}: {ms:7.1f} ms")
+    total = statistics.median(run.get("first paint", float("inf")) for run in runs)
+    verdict = "ok" if total <= STARTUP_TARGET * 1000 else "over"
+    print(f"{'target':>12}: {STARTUP_TARGET * 1000:7.1f} ms  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the CJK wrapper against textwrap on real chapters.
+
+Usage: python benchmarks/bench_wrap.py [book.txt] [--width N]
+
+Without a book the bundled test sample is repeated to chapter size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from novel_tui.core.parser import parse_book  # noqa: E402
+from novel_tui.core.reader import BookReader  # noqa: E402
+from novel_tui.core.wrap import cell_width, wrap  # noqa: E402
+
+_SAMPLE = Path(__file__).resolve().parents[1] / "tests" / "sample_novel.txt"
+
+
+def load_paragraphs(path: Path) -> list[str]:
+    book, chapters = parse_book(path)
+    reader = BookReader(path, book.encoding)
+    paragraphs: list[str] = []
+    for chapter in chapters:
+        text = reader.read_chapter(chapter)
+        paragraphs.extend(p.strip() for p in text.split("\n") if p.strip())
+    return paragraphs
+
+
+def bench(name: str, func, paragraphs: list[str], width: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for p in paragraphs:
+            func(p, width)
+        best = min(best, time.perf_counter() - t0)
+    print(f"{name:>10}: {best * 1000:8.2f} ms")
+    return best
+
+
+def textwrap_wrap(line: str, width: int) -> list[str]:
+    return textwrap.wrap(line, width=width) or [""]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("book", nargs="?", type=Path, default=None)
+    parser.add_argument("--width", type=int, default=80, help="wrap width in cells")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paragraphs = load_paragraphs(args.book or _SAMPLE)
+    if args.book is None:
+        paragraphs *= 200
+    chars = sum(map(len, paragraphs))
+    print(f"{len(paragraphs)} paragraphs, {chars} chars, width {args.width}")
+
+    # textwrap counts characters, so give it the same budget in CJK terms
+    slow = bench("textwrap", textwrap_wrap, paragraphs, args.width // 2, args.repeat)
+    fast = bench("wrap", wrap, paragraphs, args.width, args.repeat)
+    print(f"{'speedup':>10}: {slow / fast:8.1f}x")
+
+    overflow = sum(
+        1
+        for p in paragraphs
+        for row in textwrap_wrap(p, args.width)
+        if cell_width(row) > args.width
+    )
+    print(f"textwrap rows wider than {args.width} cells at width={args.width}: {overflow}")
+
+
+if __name__ == "__main__":
+    main()
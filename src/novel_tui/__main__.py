@@ -1,11 +1,28 @@
 """Entry point: python -m novel_tui."""
 
-from novel_tui.app import NovelApp
+from novel_tui.core.perf import StartupTimes
+
+# Before anything heavy is imported
+_startup = StartupTimes()
+
+import argparse  # noqa: E402
+import sys  # noqa: E402
 
 
 def main() -> None:
-    app = NovelApp()
+    parser = argparse.ArgumentParser(prog="novel-tui", description="终端小说阅读器")
+    parser.add_argument("--resume", action="store_true", help="直接打开上次阅读的书")
+    parser.add_argument("--timings", action="store_true", help="退出后打印启动耗时")
+    args = parser.parse_args()
+
+    # Textual is most of the startup time; --help does not need it
+    from novel_tui.app import NovelApp
+
+    _startup.mark("imports")
+    app = NovelApp(resume=args.resume, startup=_startup)
     app.run()
+    if args.timings:
+        print(_startup.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
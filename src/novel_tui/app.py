@@ -5,8 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from textual.app import App
+from textual.driver import Driver
 
-from novel_tui.db.connection import get_connection
+from novel_tui.core.perf import OutputMeter, StartupTimes
+from novel_tui.db.connection import get_connection, reset_connection
+from novel_tui.db.progress import ProgressWriter
 
 
 class NovelApp(App):
@@ -20,9 +23,63 @@ class NovelApp(App):
         Path("styles/reading.tcss"),
     ]
 
+    progress: ProgressWriter
+
+    def __init__(self, *, resume: bool = False, startup: StartupTimes | None = None) -> None:
+        super().__init__()
+        self._resume = resume
+        self.startup = startup or StartupTimes()
+        self.output = OutputMeter()
+
+    def get_driver_class(self) -> type[Driver]:
+        # Count the bytes that reach the terminal (see OutputMeter)
+        driver_class = super().get_driver_class()
+        app = self
+
+        class MeteredDriver(driver_class):
+            def write(self, data: str) -> None:
+                app.output.add(data)
+                super().write(data)
+
+        return MeteredDriver
+
+    def post_display_hook(self) -> None:
+        self.output.end_frame()
+
     def on_mount(self) -> None:
+        self.startup.mark("mount")
         # Initialize database
         get_connection()
+        self.startup.mark("database")
+        self.progress = ProgressWriter()
+        if self._resume and self._resume_last_book():
+            return
         # Push the book list screen
         from novel_tui.screens.book_list import BookListScreen
         self.push_screen(BookListScreen())
+
+    def _resume_last_book(self) -> bool:
+        """Open the book read last, on its own: the shelf waits for :meth:`close_book`."""
+        from novel_tui.db import repository
+
+        book = repository.get_last_read_book()
+        if book is None:
+            self.notify("还没有读过的书")
+            return False
+        from novel_tui.screens.reading import ReadingScreen
+        self.push_screen(ReadingScreen(book))
+        return True
+
+    def close_book(self) -> None:
+        """Go back from the reading screen to the shelf."""
+        if len(self.screen_stack) > 2:
+            self.pop_screen()
+        else:
+            # Opened by --resume, with no shelf underneath yet
+            from novel_tui.screens.book_list import BookListScreen
+            self.switch_screen(BookListScreen())
+
+    def on_unmount(self) -> None:
+        # Screens saved their positions as they unmounted; write them out
+        self.progress.close()
+        reset_connection()
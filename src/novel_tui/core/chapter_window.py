@@ -0,0 +1,64 @@
+"""Sliding window of loaded chapters for continuous reading."""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ChapterWindow(Generic[T]):
+    """Keeps the chapters around the reading position and nothing else.
+
+    ``behind`` chapters before and ``ahead`` chapters after the current one
+    are wanted; everything else is evicted, so memory is bounded by the
+    window size no matter how far the reader scrolls.
+    """
+
+    def __init__(self, count: int = 0, *, behind: int = 1, ahead: int = 2) -> None:
+        self.count = count
+        self.behind = behind
+        self.ahead = ahead
+        self._items: dict[int, T] = {}
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, idx: int) -> T | None:
+        return self._items.get(idx)
+
+    def put(self, idx: int, item: T) -> None:
+        self._items[idx] = item
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def span(self, center: int) -> range:
+        """Chapter indexes the window covers around ``center``."""
+        return range(max(0, center - self.behind), min(self.count, center + self.ahead + 1))
+
+    def missing(self, center: int) -> list[int]:
+        """Wanted chapters not loaded yet, the most urgent first.
+
+        The next chapter comes first since readers mostly scroll forward,
+        then alternate outwards.
+        """
+        order = [center]
+        for d in range(1, max(self.behind, self.ahead) + 1):
+            if d <= self.ahead:
+                order.append(center + d)
+            if d <= self.behind:
+                order.append(center - d)
+        wanted = self.span(center)
+        return [i for i in order if i in wanted and i not in self._items]
+
+    def evict(self, center: int) -> list[int]:
+        """Drop chapters outside the window; returns their indexes."""
+        wanted = self.span(center)
+        gone = [i for i in self._items if i not in wanted]
+        for i in gone:
+            del self._items[i]
+        return gone
@@ -0,0 +1,83 @@
+"""Checking that the library's book files are still as they were added."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import Enum
+
+# (book_id, file_path, file_size, file_mtime) as stored; mtime 0 if unknown
+FileEntry = tuple[int, str, int, int]
+
+
+class FileStatus(Enum):
+    OK = "ok"
+    MISSING = "missing"
+    MODIFIED = "modified"  # rewritten: chapter offsets may be wrong
+    APPENDED = "appended"  # grown, as a serial gains chapters
+
+
+@dataclass(slots=True, frozen=True)
+class FileCheck:
+    book_id: int
+    status: FileStatus
+    mtime: int = 0  # st_mtime_ns found, 0 if missing
+
+
+def check_file(entry: FileEntry) -> FileCheck:
+    """Compare one book file's size and mtime with the stored ones.
+
+    Only the file's metadata is read.  With no stored mtime the size alone
+    decides.
+    """
+    book_id, path, size, mtime = entry
+    try:
+        st = os.stat(path)
+    except OSError:
+        return FileCheck(book_id, FileStatus.MISSING)
+    if st.st_size == size and (not mtime or st.st_mtime_ns == mtime):
+        status = FileStatus.OK
+    elif st.st_size > size:
+        status = FileStatus.APPENDED
+    else:
+        status = FileStatus.MODIFIED
+    return FileCheck(book_id, status, st.st_mtime_ns)
+
+
+# Stats in flight at once: each mostly waits on the disk or the network
+_MAX_WORKERS = 32
+_BATCH_SIZE = 256
+
+
+def scan_files(
+    entries: Iterable[FileEntry],
+    on_batch: Callable[[list[FileCheck]], None],
+    *,
+    max_workers: int = _MAX_WORKERS,
+    batch_size: int = _BATCH_SIZE,
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> None:
+    """Check many book files concurrently.
+
+    ``on_batch`` gets the checks in completion order, ``batch_size`` at a
+    time, from the thread that runs ``scan_files``, so one slow mount does
+    not hold back the rest.
+    """
+    batch: list[FileCheck] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(check_file, entry) for entry in entries]
+        try:
+            for future in as_completed(futures):
+                if is_cancelled():
+                    return
+                batch.append(future.result())
+                if len(batch) >= batch_size:
+                    on_batch(batch)
+                    batch = []
+        finally:
+            for future in futures:
+                future.cancel()
+    if batch:
+        on_batch(batch)
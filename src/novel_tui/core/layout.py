@@ -0,0 +1,119 @@
+"""Visual-line layout index for wrapped chapter text."""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+WrapFunc = Callable[[str, int], list[str]]
+
+# Paragraphs whose wrapped rows are kept around for repainting
+_ROW_CACHE_SIZE = 512
+
+
+class LayoutIndex:
+    """Wrapped row counts and their prefix sums for one chapter layout.
+
+    An index belongs to a single (chapter, wrap width, line spacing).  Each
+    paragraph's height counts its wrapped rows plus the blank spacing rows
+    after it (none after the last paragraph).  Heights are computed lazily
+    the first time they are needed, and ``offsets`` holds the prefix sums
+    of the leading run of known heights, which background layout extends
+    with :meth:`ensure`.
+    """
+
+    def __init__(
+        self,
+        paragraphs: Sequence[str],
+        width: int,
+        spacing: int,
+        wrap: WrapFunc,
+    ) -> None:
+        self.paragraphs = paragraphs
+        self.width = width
+        self.spacing = spacing
+        self._wrap = wrap
+        n = len(paragraphs)
+        # 0 = not laid out yet (every paragraph has at least one row)
+        self.heights = array("I", bytes(4 * n))
+        # offsets[i] = first row of paragraph i, for i < len(offsets)
+        self.offsets = array("I", [0])
+        # Wrapped rows of recently used paragraphs, with each row's offset
+        self._rows: OrderedDict[int, tuple[list[str], array[int]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.paragraphs)
+
+    @property
+    def complete(self) -> bool:
+        """True once every paragraph has been laid out."""
+        return len(self.offsets) > len(self.paragraphs)
+
+    @property
+    def laid_out(self) -> int:
+        """Number of leading paragraphs covered by the prefix sums."""
+        return len(self.offsets) - 1
+
+    def rows(self, idx: int) -> list[str]:
+        """Wrapped rows of paragraph ``idx`` (without spacing rows)."""
+        return self._wrapped(idx)[0]
+
+    def row_start(self, idx: int, sub: int) -> int:
+        """Offset of wrapped row ``sub`` within paragraph ``idx``."""
+        return self._wrapped(idx)[1][sub]
+
+    def _wrapped(self, idx: int) -> tuple[list[str], array[int]]:
+        entry = self._rows.get(idx)
+        if entry is not None:
+            self._rows.move_to_end(idx)
+            return entry
+        paragraph = self.paragraphs[idx]
+        rows = self._wrap(paragraph, self.width)
+        entry = (rows, _row_starts(paragraph, rows))
+        self._rows[idx] = entry
+        if len(self._rows) > _ROW_CACHE_SIZE:
+            self._rows.popitem(last=False)
+        if not self.heights[idx]:
+            self.heights[idx] = len(rows) + self._spacing_after(idx)
+        return entry
+
+    def height(self, idx: int) -> int:
+        """Rows taken by paragraph ``idx``, including trailing spacing."""
+        h = self.heights[idx]
+        if not h:
+            rows = self._wrap(self.paragraphs[idx], self.width)
+            h = len(rows) + self._spacing_after(idx)
+            self.heights[idx] = h
+        return h
+
+    def text_rows(self, idx: int) -> int:
+        """Wrapped rows of paragraph ``idx``, not counting its spacing."""
+        return self.height(idx) - self._spacing_after(idx)
+
+    def ensure(self, count: int) -> None:
+        """Extend the prefix sums to cover the first ``count`` paragraphs."""
+        count = min(count, len(self.paragraphs))
+        offsets = self.offsets
+        total = offsets[-1]
+        for idx in range(len(offsets) - 1, count):
+            total += self.height(idx)
+            offsets.append(total)
+
+    def _spacing_after(self, idx: int) -> int:
+        return self.spacing if idx < len(self.paragraphs) - 1 else 0
+
+
+def _row_starts(paragraph: str, rows: list[str]) -> array[int]:
+    """Offset of each wrapped row within its paragraph, in one pass.
+
+    Rows are consecutive slices of the paragraph, apart from the spaces
+    dropped at Latin word breaks.
+    """
+    starts = array("I")
+    pos = 0
+    for row in rows:
+        pos = paragraph.index(row, pos)
+        starts.append(pos)
+        pos += len(row)
+    return starts
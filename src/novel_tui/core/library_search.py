@@ -0,0 +1,130 @@
+"""Library-wide search across every book on the shelf."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from novel_tui.core.reader import BookReader
+from novel_tui.core.search import BookSearcher, SearchResult
+from novel_tui.db.models import Book, Chapter
+
+ChapterLoader = Callable[[Book], Sequence[Chapter]]
+
+
+@dataclass
+class BookHits:
+    """Search results for one book, delivered as soon as that book is done."""
+
+    book: Book
+    results: list[SearchResult]
+    truncated: bool  # True if the book had more hits than were kept
+
+
+def _default_workers() -> int:
+    # Scanning is mostly read + decode; a few threads keep the disk busy
+    # without starving the UI thread of the GIL.
+    return min(4, os.cpu_count() or 1)
+
+
+class LibrarySearcher:
+    """Searches many books concurrently with bounded parallelism.
+
+    Books are scheduled smallest file first so that results start streaming
+    back quickly, and each book is read one chapter at a time so memory use
+    is bounded by the largest chapter, not the largest book.
+    """
+
+    def __init__(
+        self,
+        books: Sequence[Book],
+        load_chapters: ChapterLoader,
+        *,
+        max_workers: int | None = None,
+        max_hits_per_book: int = 50,
+    ) -> None:
+        self.books = sorted(books, key=lambda b: b.file_size)
+        self.load_chapters = load_chapters
+        self.max_workers = max_workers or _default_workers()
+        self.max_hits_per_book = max_hits_per_book
+
+    def search(
+        self,
+        query: str,
+        on_book: Callable[[BookHits], None],
+        *,
+        case_sensitive: bool = False,
+        normalize: bool = False,
+        is_cancelled: Callable[[], bool] = lambda: False,
+    ) -> int:
+        """Search every book, calling ``on_book`` for each book with hits.
+
+        ``on_book`` is called from the thread that runs ``search`` in
+        completion order.  Returns the number of books that matched.
+        """
+        matched = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self._search_book, book, query, case_sensitive, normalize, is_cancelled
+                )
+                for book in self.books
+            ]
+            try:
+                for future in as_completed(futures):
+                    if is_cancelled():
+                        break
+                    hits = future.result()
+                    if hits is not None and hits.results:
+                        matched += 1
+                        on_book(hits)
+            finally:
+                for future in futures:
+                    future.cancel()
+        return matched
+
+    def _search_book(
+        self,
+        book: Book,
+        query: str,
+        case_sensitive: bool,
+        normalize: bool,
+        is_cancelled: Callable[[], bool],
+    ) -> BookHits | None:
+        if is_cancelled():
+            return None
+        try:
+            return self._scan_book(book, query, case_sensitive, normalize, is_cancelled)
+        except OSError:
+            # Missing, unreadable or gone mid-scan: skip it, not the search
+            return None
+
+    def _scan_book(
+        self,
+        book: Book,
+        query: str,
+        case_sensitive: bool,
+        normalize: bool,
+        is_cancelled: Callable[[], bool],
+    ) -> BookHits | None:
+        chapters = self.load_chapters(book)
+        searcher = BookSearcher(BookReader(book.file_path, book.encoding), chapters)
+        results: list[SearchResult] = []
+        limit = self.max_hits_per_book
+        for chapter in chapters:
+            if is_cancelled():
+                return None
+            results.extend(
+                searcher.search_chapter(
+                    chapter,
+                    query,
+                    case_sensitive=case_sensitive,
+                    normalize=normalize,
+                    limit=limit - len(results) + 1,
+                )
+            )
+            if len(results) > limit:
+                return BookHits(book, results[:limit], truncated=True)
+        return BookHits(book, results, truncated=False)
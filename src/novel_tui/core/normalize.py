@@ -0,0 +1,104 @@
+"""Character folding for traditional/simplified and width-insensitive search.
+
+Every mapping below is one character to one character, so a folded string
+has exactly the same length as the original: an offset found in
+``fold(text)`` is also the offset of the match in ``text``.  That makes the
+offset map between folded and original text the identity, and hits can be
+highlighted in the original chapter without any translation step.
+"""
+
+from __future__ import annotations
+
+# Traditional → simplified pairs, two characters per pair.  Covers the
+# characters that commonly differ in Big5-era web novels; anything not
+# listed is left untouched (and therefore still matches itself).
+_TRAD_SIMP_PAIRS = (
+    "萬万與与專专業业叢丛東东絲丝丟丢兩两嚴严喪丧個个豐丰臨临為为麗丽舉举麼么義义烏乌樂乐喬乔習习鄉乡書书買买亂乱爭争於于虧亏雲云亞亚"
+    "產产畝亩親亲褻亵億亿僅仅從从侖仑倉仓儀仪們们價价眾众優优夥伙會会傘伞偉伟傳传傷伤倫伦偽伪佇伫體体餘余傭佣僉佥俠侠侶侣僥侥偵侦側侧"
+    "僑侨儈侩儕侪儂侬俁俣係系儔俦儼俨倆俩儷俪儉俭債债傾倾僂偻僕仆僱雇儲储兒儿兌兑黨党蘭兰關关興兴茲兹養养獸兽內内岡冈冊册寫写軍军農农"
+    "馮冯沖冲決决況况凍冻淨净涼凉減减湊凑凜凛幾几鳳凤憑凭凱凯擊击鑿凿芻刍劃划劉刘則则剛刚創创刪删別别剗刬劊刽劌刿劍剑劑剂剮剐勸劝辦办"
+    "務务勵励動动勁劲勞劳勢势勳勋勻匀匭匦匯汇匱匮區区醫医華华協协單单賣卖盧卢滷卤臥卧衛卫卻却廠厂廳厅曆历厲厉壓压厭厌厙厍廁厕廂厢厴厣"
+    "廈厦廚厨廄厩廝厮縣县參参雙双發发變变敘叙疊叠葉叶號号嘆叹嘰叽嚇吓呂吕嗎吗噸吨聽听啟启吳吴嘸呒囈呓嘔呕嚦呖唄呗員员咼呙嗆呛嗚呜詠咏"
+    "嚨咙嚀咛噝咝響响啞哑噠哒嘵哓嗶哔噦哕嘩哗噲哙喲哟嘮唠喚唤嘖啧嗇啬囀啭齧啮嘯啸噴喷嘍喽嚳喾囁嗫噯嗳噓嘘嚶嘤囑嘱嚕噜團团園园囪囱圍围"
+    "圇囵國国圖图圓圆聖圣壙圹場场壞坏塊块堅坚壇坛壢坜壩坝塢坞墳坟墜坠壟垄壚垆壘垒墾垦堊垩墊垫埡垭塏垲塒埘堝埚塹堑墮堕聲声殼壳壺壶處处"
+    "備备復复夠够頭头誇夸夾夹奪夺奩奁奐奂奮奋獎奖奧奥妝妆婦妇媽妈嫵妩嫗妪媯妫姍姗薑姜婁娄婭娅嬈娆嬌娇孌娈娛娱媧娲嫻娴嬰婴嬋婵嬸婶媼媪"
+    "嬡嫒嬪嫔嬙嫱嬤嬷孫孙學学孿孪寧宁寶宝實实寵宠審审憲宪宮宫寬宽賓宾寢寝對对尋寻導导壽寿將将爾尔塵尘嘗尝堯尧尷尴屍尸盡尽層层屜屉屆届"
+    "屬属屢屡屨屦嶼屿歲岁豈岂嶇岖崗岗峴岘嶴岙嵐岚島岛嶺岭崠岽崢峥嶠峤嶗崂崍崃嶮崄嶄崭嶸嵘嶔嵚嶁嵝巔巅鞏巩帥帅師师帳帐幟帜帶带幀帧幫帮"
+    "幬帱幗帼冪幂庫库廬庐廟庙應应廢废廣广慶庆廡庑開开異异棄弃張张彌弥彎弯彈弹強强歸归當当錄录彥彦徹彻徑径徠徕憶忆懺忏憂忧愾忾懷怀態态"
+    "慫怂憮怃慪怄悵怅愴怆憐怜總总懟怼懌怿戀恋懇恳惡恶慟恸懨恹愷恺惻恻惱恼惲恽悅悦懸悬慳悭憫悯驚惊懼惧慘惨懲惩憊惫愜惬慚惭憚惮慣惯慍愠"
+    "憤愤憒愦願愿懾慑懣懑懶懒戇戆戔戋戲戏戧戗戰战戩戬戶户撲扑執执擴扩捫扪掃扫揚扬擾扰撫抚拋抛摶抟摳抠掄抡搶抢護护報报擔担擬拟攏拢揀拣"
+    "擁拥攔拦擰拧撥拨擇择掛挂摯挚攣挛撾挝撻挞挾挟撓挠擋挡撟挢掙挣擠挤揮挥撈捞損损撿捡換换搗捣據据擄掳摑掴擲掷撣掸摻掺摜掼攬揽搵揾攙搀"
+    "擱搁摟搂攪搅攜携攝摄攄摅擺摆搖摇擯摈攤摊攖撄撐撑攆撵擷撷擼撸攛撺擻擞攢攒敵敌斂敛數数齋斋斕斓鬥斗斬斩斷断無无舊旧時时曠旷暘旸曇昙"
+    "晝昼曬晒晉晋曉晓暈晕暉晖暫暂曖暧機机殺杀雜杂權权條条來来楊杨榪杩傑杰極极構构樅枞樞枢棗枣櫪枥梘枧棖枨槍枪楓枫梟枭櫃柜檸柠檉柽梔栀"
+    "柵栅標标棧栈櫛栉櫳栊棟栋櫨栌櫟栎欄栏樹树棲栖樣样欒栾椏桠橈桡楨桢檔档榿桤橋桥樺桦檜桧槳桨樁桩夢梦檢检欞棂槨椁櫝椟槧椠槓杠樓楼欖榄"
+    "櫸榉櫬榇欏椤橢椭歡欢歐欧殲歼歿殁殤殇殘残殞殒殮殓殫殚殯殡毆殴毀毁轂毂畢毕斃毙氈毡毿毵氣气氫氢氬氩漢汉湯汤溝沟沒没灃沣漚沤瀝沥淪沦"
+    "滄沧潙沩滬沪濘泞淚泪瀧泷瀘泸濼泺潑泼澤泽涇泾潔洁灑洒窪洼浹浃淺浅漿浆澆浇湞浈濁浊測测澮浍濟济瀏浏渾浑滸浒濃浓潯浔濤涛澇涝澗涧漣涟"
+    "渦涡渙涣滌涤潤润漲涨澀涩淵渊漁渔瀋沈滲渗溫温遊游灣湾濕湿潰溃濺溅漵溆滾滚滯滞灩滟灄滠滿满瀅滢濾滤濫滥灤滦濱滨灘滩澦滪瀠潆瀟潇瀲潋"
+    "濰潍潛潜瀾澜瀨濑瀕濒灝灏滅灭燈灯靈灵災灾燦灿煬炀爐炉燉炖煒炜熗炝點点煉炼熾炽爍烁爛烂烴烃燭烛煙烟煩烦燒烧燁烨燴烩燙烫燼烬熱热煥焕"
+    "燜焖燾焘愛爱爺爷牘牍犛牦牽牵犧牺犢犊狀状獷犷獁犸猶犹狽狈猙狰獨独狹狭獅狮獪狯獄狱猻狲獲获獵猎獼猕玀猡豬猪貓猫蝟猬獻献獺獭璣玑瑪玛"
+    "瑋玮環环現现璽玺琺珐瓏珑璫珰琿珲璉琏瑣琐瓊琼瑤瑶瓔璎甌瓯甕瓮電电畫画暢畅疇畴癤疖療疗瘧疟癘疠瘍疡瘋疯皰疱痾疴癰痈痙痉癢痒瘂痖癆痨"
+    "瘓痪癇痫癡痴瘞瘗瘡疮癟瘪癮瘾癱瘫癲癫皚皑皺皱盞盏鹽盐監监蓋盖盜盗盤盘眥眦睜睁睞睐瞼睑瞞瞒矚瞩矯矫磯矶礬矾礦矿碭砀碼码磚砖硨砗硯砚"
+    "碸砜礪砺礱砻礫砾礎础碩硕硤硖磽硗確确鹼碱礙碍磧碛磣碜禮礼禕祎禰祢禍祸禎祯祿禄禪禅離离禿秃稈秆種种積积稱称穢秽穩稳穡穑窮穷竊窃竅窍"
+    "窯窑竄窜窩窝窺窥竇窦豎竖競竞筆笔筍笋箋笺籠笼築筑篳筚篩筛簽签簡简籌筹籃篮篤笃簀箦籜箨簍篓籬篱簞箪簫箫簷檐籤签籲吁糴籴類类秈籼糧粮"
+    "糲粝糶粜糝糁緊紧紅红紀纪紉纫約约級级紈纨紡纺紋纹紗纱純纯紕纰納纳紙纸紛纷紐纽紓纾線线紺绀紲绁紱绂練练組组紳绅細细織织終终縐绉絆绊"
+    "紼绋絀绌紹绍繹绎經经紿绐綁绑絨绒結结絝绔繞绕絰绖絎绗繪绘給给絢绚絳绛絡络絕绝絞绞統统綆绠綃绡絹绢繡绣綏绥絛绦繼继綈绨績绩緒绪綾绫"
+    "續续綺绮緋绯綽绰緄绲繩绳維维綿绵綬绶繃绷綢绸綹绺綸纶綜综綻绽綠绿綴缀緇缁緙缂緗缃緘缄緬缅纜缆緹缇緲缈緝缉縕缊繢缋緦缌綞缍緞缎緶缏"
+    "緱缑縋缒緩缓締缔編编緡缗緣缘縉缙縛缚縟缛縝缜縫缝縗缞縞缟纏缠縭缡縊缢縑缣繽缤縹缥縵缦縲缧纓缨縮缩繆缪繅缫纈缬繚缭繕缮繒缯韁缰繾缱"
+    "繰缲繯缳纘缵罌罂網网羅罗罰罚罷罢羆罴羈羁羥羟翹翘耬耧聳耸恥耻聶聂聾聋職职聹聍聯联聵聩聰聪肅肃腸肠膚肤骯肮餚肴腎肾腫肿脹胀脅胁膽胆"
+    "勝胜朧胧臚胪脛胫膠胶脈脉膾脍髒脏臍脐腦脑膿脓臠脔腳脚脫脱腡脶臉脸臘腊醃腌膕腘齶腭膩腻靦腼膃腽騰腾臏膑艤舣艦舰艙舱艫舻艱艰豔艳藝艺"
+    "節节羋芈薌芗蕪芜蘆芦蓯苁葦苇藶苈莧苋萇苌蒼苍苧苎蘋苹莖茎蘢茏蔦茑塋茔煢茕荊荆薦荐莢荚蕘荛蓽荜蕎荞薈荟薺荠蕩荡榮荣葷荤滎荥犖荦熒荧"
+    "蕁荨藎荩蓀荪蔭荫蕒荬葒荭葤荮藥药蒞莅萊莱蓮莲蒔莳萵莴薟莶鶯莺蓴莼蘀萚蘿萝螢萤營营縈萦蕭萧薩萨蔥葱蕆蒇蕢蒉蔣蒋蔞蒌藍蓝薊蓟蘺蓠驀蓦"
+    "蔔卜蘞蔹藺蔺蘄蕲蘊蕴藪薮蘚藓虜虏慮虑虛虚蟲虫虯虬蟣虮雖虽蝦虾蠆虿蝕蚀蟻蚁螞蚂蠶蚕蠔蚝蜆蚬蠱蛊蠣蛎蟶蛏蠻蛮蟄蛰蛺蛱蟯蛲螄蛳蠐蛴蛻蜕"
+    "蝸蜗蠟蜡蠅蝇蟈蝈蟬蝉蠍蝎螻蝼蠑蝾螿螀蟎螨蠨蟏釁衅銜衔補补襯衬袞衮襖袄嫋袅褘袆襪袜襲袭襏袯裝装襠裆褌裈褳裢襝裣褲裤襇裥褸褛襤褴見见"
+    "觀观覎觃規规覓觅視视覘觇覽览覺觉覬觊覡觋覿觌覥觍覦觎覯觏覲觐覷觑觴觞觸触觶觯讋詟譽誉謄誊計计訂订訃讣認认譏讥訐讦訌讧討讨讓让訕讪"
+    "訖讫訓训議议訊讯記记講讲諱讳謳讴詎讵訝讶訥讷許许訛讹論论訩讻訟讼諷讽設设訪访訣诀證证詁诂訶诃評评詛诅識识詗诇詐诈訴诉診诊詆诋謅诌"
+    "詞词詘诎詔诏詖诐譯译詒诒誆诓誄诔試试詿诖詩诗詰诘詼诙誠诚誅诛詵诜話话誕诞詬诟詮诠詭诡詢询詣诣諍诤該该詳详詫诧諢诨詡诩譸诪誡诫誣诬"
+    "語语誚诮誤误誥诰誘诱誨诲誑诳說说誦诵誒诶請请諸诸諏诹諾诺讀读諑诼誹诽課课諉诿諛谀誰谁諗谂調调諂谄諒谅諄谆誶谇談谈誼谊謀谋諶谌諜谍"
+    "謊谎諫谏諧谐謔谑謁谒謂谓諤谔諭谕諼谖讒谗諮谘諳谙諺谚諦谛謎谜諞谝謨谟讜谠謖谡謝谢謠谣謗谤謚谥謙谦謐谧謹谨謾谩謫谪譾谫謬谬譚谭譖谮"
+    "譙谯讕谰譜谱譎谲讞谳譴谴譫谵讖谶穀谷豶豮貝贝貞贞負负貢贡財财責责賢贤敗败賬账貨货質质販贩貪贪貧贫貶贬購购貯贮貫贯貳贰賤贱賁贲貰贳"
+    "貼贴貴贵貺贶貸贷貿贸費费賀贺貽贻賊贼贄贽賈贾賄贿貲赀賃赁賂赂贓赃資资賅赅贐赆賕赇賑赈賚赉賒赊賦赋賭赌齎赍贖赎賞赏賜赐贗赝賡赓賠赔"
+    "賧赕賴赖賵赗贅赘賻赙賺赚賽赛贊赞贇赟贈赠贍赡贏赢贛赣趙赵趕赶趨趋趲趱躉趸躍跃蹌跄蹠跖躒跞踐践躂跶蹺跷蹕跸躚跹躋跻踴踊躊踌蹤踪躓踬"
+    "躑踯躡蹑蹣蹒躕蹰躥蹿躪躏躦躜軀躯車车軋轧軌轨軒轩軔轫轉转軛轭輪轮軟软轟轰軲轱軻轲轤轳軸轴軹轵軼轶軤轷軫轸轢轹軺轺輕轻軾轼載载輊轾"
+    "轎轿輈辀輇辁輅辂較较輒辄輔辅輛辆輦辇輩辈輝辉輥辊輞辋輬辌輟辍輜辎輳辏輸输轀辒輻辐輯辑輾辗轅辕轄辖輿舆轆辘轍辙轔辚辭辞辯辩邊边遼辽"
+    "達达遷迁過过邁迈運运還还這这進进遠远違违連连遲迟邇迩逕迳跡迹適适選选遜逊遞递邐逦邏逻遺遗遙遥鄧邓鄺邝鄔邬郵邮鄒邹鄴邺鄰邻鬱郁郟郏"
+    "鄶郐鄭郑鄆郓酈郦鄖郧鄲郸醞酝醜丑醬酱釅酽釃酾釀酿釋释裏里鑒鉴鑾銮鏨錾釓钆釔钇針针釘钉釗钊釙钋釕钌釷钍釹钕釵钗鈣钙鈦钛鈍钝鈔钞鈉钠"
+    "鋇钡鋼钢鈞钧鈕钮鈀钯鈷钴鈸钹鈽钚鈴铃鉛铅鉑铂鈾铀鉀钾鈹铍鉸铰鋁铝銅铜銑铣銓铨銖铢鉻铬銘铭鋪铺銷销鎖锁鋤锄鍋锅鏽锈銳锐錯错錨锚鍵键"
+    "鋸锯錦锦鍛锻鎮镇鏡镜鐘钟鐵铁鑄铸鑰钥鑲镶長长門门閂闩閃闪閆闫閉闭問问闖闯閏闰閑闲間间閔闵閘闸閡阂閣阁閥阀閨闺聞闻闥闼閩闽閭闾閱阅"
+    "閻阎閹阉闊阔闋阕闈闱闌阑闃阒闆板闔阖闐阗闕阙闡阐闢辟隊队陽阳陰阴陣阵階阶際际陸陆隴陇陳陈陘陉險险隨随隱隐隸隶難难雛雏讎雠靂雳霧雾"
+    "霽霁靄霭靚靓靜静韃鞑韉鞯韋韦韌韧韓韩韙韪韜韬韻韵頁页頂顶頃顷項项順顺須须頊顼頑顽顧顾頓顿頎颀頒颁頌颂頏颃預预顱颅領领頗颇頸颈頡颉"
+    "頰颊頜颌潁颍頦颏頤颐頻频頹颓頷颔穎颖顆颗題题顏颜額额顎颚顓颛顛颠顢颟顥颢顫颤顯显顰颦顴颧風风颯飒颱台颳刮颶飓飄飘飆飙飛飞饑饥飣饤"
+    "飪饪飫饫飭饬飯饭飲饮餞饯飾饰飽饱飼饲飴饴餌饵饒饶餉饷餃饺餅饼餑饽餓饿餒馁餛馄餡馅館馆餷馇饋馈餿馊饞馋饅馒饌馔饉馑饈馐饗飨馬马馭驭"
+    "馱驮馳驰馴驯駁驳駐驻駒驹駕驾駛驶駝驼駭骇駱骆駿骏騎骑騙骗騷骚驅驱驕骄驗验驟骤驢驴驥骥驪骊驍骁驊骅騾骡驁骜驃骠髏髅髖髋鬆松鬍胡鬚须"
+    "鬢鬓鬧闹鬨哄鬩阋鬮阄魎魉魘魇魚鱼魯鲁鮑鲍鯉鲤鯨鲸鱗鳞鱷鳄鳥鸟鳩鸠鳴鸣鴉鸦鴨鸭鴛鸳鴦鸯鴻鸿鵝鹅鵬鹏鶴鹤鷹鹰鸚鹦鸞鸾鹵卤鹹咸麥麦麩麸"
+    "黃黄黌黉黷黩黽黾鼉鼍鼴鼹齊齐齏齑齒齿齡龄齣出齙龅齜龇齟龃齠龆齦龈齪龊齬龉齲龋齷龌龍龙龐庞龔龚龕龛龜龟後后裡里麵面髮发並并佔占佈布"
+    "啓启嶽岳併并彙汇徵征慾欲捨舍採采擡抬氾泛痲麻睏困祕秘綑捆衝冲註注讚赞鍾钟閒闲隻只雞鸡餵喂鬪斗擣捣範范製制複复誌志嚮向瞭了週周檯台"
+    "臺台劄札衆众爲为僞伪囘回迴回裊袅喫吃牀床竪竖歎叹絃弦鍊炼燄焰菸烟"
+)
+
+
+def _build_table(*, case_sensitive: bool) -> dict[int, int]:
+    table: dict[int, int] = {}
+    pairs = _TRAD_SIMP_PAIRS
+    for i in range(0, len(pairs), 2):
+        table[ord(pairs[i])] = ord(pairs[i + 1])
+    # Full-width ASCII variants (！ .. ～) → half-width, ideographic space → space
+    for cp in range(0xFF01, 0xFF5F):
+        table[cp] = cp - 0xFEE0
+    table[0x3000] = 0x20
+    if not case_sensitive:
+        # The one character whose lowercase is two characters long; every
+        # other letter is left to str.lower(), which keeps the length
+        table[0x130] = ord("i")  # İ
+    return table
+
+
+FOLD_TABLE = _build_table(case_sensitive=False)
+FOLD_TABLE_CASE_SENSITIVE = _build_table(case_sensitive=True)
+
+
+def fold(text: str, *, case_sensitive: bool = False) -> str:
+    """Fold ``text`` for normalized matching: one ``str.translate``, then
+    ``str.lower()`` unless ``case_sensitive``."""
+    if case_sensitive:
+        return text.translate(FOLD_TABLE_CASE_SENSITIVE)
+    return text.translate(FOLD_TABLE).lower()
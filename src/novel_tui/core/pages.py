@@ -0,0 +1,149 @@
+"""Page tables for paginated reading."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+from novel_tui.core.layout import LayoutIndex
+from novel_tui.core.reader import FileIdentity
+
+# (wrap width, line spacing, page height) — page numbers are only stable
+# for one geometry
+PageGeometry = tuple[int, int, int]
+
+# Bumped whenever wrapping or pagination changes, so that page tables
+# cached by an older version are recomputed
+PAGINATION_VERSION = 1
+
+
+def page_source(identity: FileIdentity) -> str:
+    """What a book's page tables were computed from: the file, and the rules."""
+    _, size, mtime = identity
+    return f"{size}:{mtime}:{PAGINATION_VERSION}"
+
+
+class PageIndex:
+    """Where each page of one chapter layout starts.
+
+    A page starts at a paragraph and takes the following paragraphs for as
+    long as their text fits in ``height`` rows, which is what a page-down in
+    scrolling mode moves past.  A paragraph taller than a page gets a page
+    of its own.  Pages are found lazily, front to back, and every chapter
+    has at least one page.
+    """
+
+    def __init__(
+        self, layout: LayoutIndex, height: int, starts: array[int] | None = None
+    ) -> None:
+        self.layout = layout
+        self.height = max(height, 1)
+        if starts is not None:
+            # A complete table computed earlier for the same geometry
+            self.starts = starts
+            self._next = len(layout)
+            self._used = 0
+        else:
+            # starts[i] = first paragraph of page i
+            self.starts = array("I", [0])
+            self._next = 0  # first paragraph not assigned to a page yet
+            self._used = 0  # rows taken on the last page so far
+
+    def __len__(self) -> int:
+        """Number of pages (lays out the whole chapter)."""
+        self._scan(len(self.layout))
+        return len(self.starts)
+
+    @property
+    def complete(self) -> bool:
+        return self._next >= len(self.layout)
+
+    def page_of(self, idx: int) -> int:
+        """Page showing paragraph ``idx``."""
+        self._scan(idx + 1)
+        return bisect_right(self.starts, idx) - 1
+
+    def start(self, page: int) -> int | None:
+        """First paragraph of ``page``, or None past the last page."""
+        while len(self.starts) <= page and not self.complete:
+            self._scan(self._next + 1)
+        return self.starts[page] if 0 <= page < len(self.starts) else None
+
+    def end(self, page: int) -> int:
+        """One past the last paragraph of ``page``."""
+        nxt = self.start(page + 1)
+        return len(self.layout) if nxt is None else nxt
+
+    def _scan(self, count: int) -> None:
+        """Assign the first ``count`` paragraphs to pages."""
+        layout = self.layout
+        count = min(count, len(layout))
+        idx, used = self._next, self._used
+        while idx < count:
+            rows = layout.text_rows(idx)
+            if used and used + rows > self.height:
+                self.starts.append(idx)
+                used = 0
+            used += layout.height(idx)
+            idx += 1
+        self._next, self._used = idx, used
+
+
+def paginate(layout: LayoutIndex, height: int) -> array[int]:
+    """Page starts of a whole chapter."""
+    pages = PageIndex(layout, height)
+    len(pages)
+    return pages.starts
+
+
+class PageTable:
+    """Page starts of every chapter of a book, for one geometry.
+
+    Chapters are filled in any order as they are paginated; book-wide page
+    numbers are known for every chapter in the leading run of filled ones,
+    like the prefix sums of :class:`LayoutIndex`.
+    """
+
+    def __init__(self, geometry: PageGeometry, chapter_count: int) -> None:
+        self.geometry = geometry
+        # 0 = not paginated yet (every chapter has at least one page)
+        self.counts = array("I", bytes(4 * chapter_count))
+        # offsets[i] = pages before chapter i, for i < len(offsets)
+        self.offsets = array("I", [0])
+        self.known = 0  # chapters paginated
+        self._starts: dict[int, array[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def complete(self) -> bool:
+        return self.known == len(self.counts)
+
+    @property
+    def total(self) -> int | None:
+        """Pages in the whole book, once every chapter is paginated."""
+        return self.offsets[-1] if self.complete else None
+
+    def put(self, chapter_idx: int, starts: array[int]) -> None:
+        if self.counts[chapter_idx]:
+            return
+        self._starts[chapter_idx] = starts
+        self.counts[chapter_idx] = len(starts)
+        self.known += 1
+        offsets = self.offsets
+        while len(offsets) <= len(self.counts) and self.counts[len(offsets) - 1]:
+            offsets.append(offsets[-1] + self.counts[len(offsets) - 1])
+
+    def get(self, chapter_idx: int) -> array[int] | None:
+        return self._starts.get(chapter_idx)
+
+    def count(self, chapter_idx: int) -> int | None:
+        """Pages in a chapter, if it has been paginated."""
+        return self.counts[chapter_idx] or None
+
+    def book_page(self, chapter_idx: int, page: int) -> int | None:
+        """Book-wide number (from 0) of a chapter's page, if known yet."""
+        if chapter_idx < len(self.offsets):
+            return self.offsets[chapter_idx] + page
+        return None
@@ -0,0 +1,44 @@
+"""Array-backed paragraph index over a chapter's text."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+from typing import overload
+
+# A paragraph: one line from its first to its last non-whitespace character.
+# \s matches the same characters as str.strip(), including U+3000 (the
+# full-width space that indents Chinese paragraphs).
+_PARAGRAPH = re.compile(r"\S(?:[^\n]*\S)?")
+
+
+class ParagraphStore(Sequence[str]):
+    """The non-blank, trimmed lines of a chapter, sliced out on demand.
+
+    Only the chapter string and two ``array('I')`` offset tables are kept,
+    instead of a copy of every paragraph plus a Python list of offsets.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        bounds = array(
+            "I", chain.from_iterable(m.span() for m in _PARAGRAPH.finditer(text))
+        )
+        self.starts: array[int] = bounds[0::2]  # char offset of each paragraph
+        self.ends: array[int] = bounds[1::2]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, idx: int) -> str: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[str]: ...
+
+    def __getitem__(self, idx: int | slice) -> str | list[str]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self.text[self.starts[idx] : self.ends[idx]]
@@ -85,6 +85,8 @@ def parse_book(
 
     # ── Step 1: Read file once ──
     _report("读取文件...")
+    # Taken first: a write during the read then shows up in the next scan
+    file_mtime = path.stat().st_mtime_ns
     raw_bytes = path.read_bytes()
     file_size = len(raw_bytes)
 
@@ -170,6 +172,7 @@ def parse_book(
         title=title,
         file_path=str(path),
         file_size=file_size,
+        file_mtime=file_mtime,
         encoding=encoding,
         word_count=word_count,
         chapter_count=len(chapters),
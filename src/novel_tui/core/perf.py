@@ -0,0 +1,111 @@
+"""Frame and startup timing instrumentation."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Callable
+
+# Launch to first paint (shelf, or the page with --resume)
+STARTUP_TARGET = 0.300
+
+
+class FrameStats:
+    """Durations of the most recent frames, measured against a budget.
+
+    Keeps a ring buffer of the last ``size`` durations (seconds) for the
+    percentiles, and running counts of all frames and of late ones.
+    """
+
+    def __init__(self, budget: float, size: int = 120) -> None:
+        self.budget = budget
+        self.size = size
+        self.frames = 0
+        self.late = 0  # frames that took longer than the budget
+        self._times = array("d")
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def add(self, seconds: float) -> None:
+        if len(self._times) < self.size:
+            self._times.append(seconds)
+        else:
+            self._times[self._next] = seconds
+            self._next = (self._next + 1) % self.size
+        self.frames += 1
+        if seconds > self.budget:
+            self.late += 1
+
+    def reset(self) -> None:
+        self.frames = self.late = self._next = 0
+        self._times = array("d")
+
+    @property
+    def late_ratio(self) -> float:
+        return self.late / self.frames if self.frames else 0.0
+
+    def percentile(self, p: float) -> float:
+        """The ``p``-th percentile of the recent durations (0 if none)."""
+        if not self._times:
+            return 0.0
+        ordered = sorted(self._times)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class OutputMeter:
+    """Bytes written to the terminal, counted where the driver writes them.
+
+    Counting only runs while someone waits on :meth:`measure_next_frame`;
+    the app calls :meth:`end_frame` after every display.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._waiting: list[Callable[[int], None]] = []
+
+    def add(self, data: str) -> None:
+        if self._waiting:
+            self._count += len(data.encode("utf-8"))
+
+    def measure_next_frame(self, callback: Callable[[int], None]) -> None:
+        """Call ``callback`` with the size of the next frame written out."""
+        if callback not in self._waiting:
+            self._waiting.append(callback)
+
+    def end_frame(self) -> None:
+        if not self._count:
+            return  # nothing was written, the frame is still to come
+        count, self._count = self._count, 0
+        waiting, self._waiting = self._waiting, []
+        for callback in waiting:
+            callback(count)
+
+
+class StartupTimes:
+    """Milestones of one launch, in seconds since the entry point started.
+
+    Only the first :meth:`mark` of each name counts, so screens can mark
+    "first paint" without knowing which of them came up first.
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        self.start = time.perf_counter() if start is None else start
+        self.marks: dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        self.marks.setdefault(name, time.perf_counter() - self.start)
+
+    def report(self, target: float = STARTUP_TARGET) -> str:
+        """One line per milestone with its share, then the total against ``target``."""
+        lines = []
+        previous = 0.0
+        for name, at in self.marks.items():
+            lines.append(f"{name:<12} {at * 1000:7.1f} ms  (+{(at - previous) * 1000:.1f})")
+            previous = at
+        total = self.marks.get("first paint")
+        if total is not None:
+            verdict = "ok" if total <= target else "over"
+            lines.append(f"target       {target * 1000:7.1f} ms  {verdict}")
+        return "\n".join(lines)
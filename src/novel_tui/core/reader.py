@@ -6,6 +6,9 @@ from pathlib import Path
 
 from novel_tui.db.models import Chapter
 
+# (resolved path, size in bytes, mtime in ns) — changes whenever the file does
+FileIdentity = tuple[str, int, int]
+
 
 class BookReader:
     """Reads chapter content from a book file using byte offsets."""
@@ -14,6 +17,11 @@ class BookReader:
         self.file_path = Path(file_path)
         self.encoding = encoding
 
+    def identity(self) -> FileIdentity:
+        """Return a cheap fingerprint of the file for cache invalidation."""
+        st = self.file_path.stat()
+        return (str(self.file_path), st.st_size, st.st_mtime_ns)
+
     def read_chapter(self, chapter: Chapter) -> str:
         """Read a single chapter's content by its byte offset and length."""
         if not self.file_path.exists():
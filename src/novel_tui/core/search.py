@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from itertools import chain, groupby
+from typing import NamedTuple
 
-from novel_tui.core.reader import BookReader
+from novel_tui.core.normalize import fold
+from novel_tui.core.reader import BookReader, FileIdentity
 from novel_tui.db.models import Chapter
 
+# Characters of context kept on each side of a match
+_CONTEXT_CHARS = 40
+
 
 @dataclass
 class SearchResult:
@@ -16,46 +28,442 @@ class SearchResult:
     context: str      # surrounding text snippet
 
 
+class SearchKey(NamedTuple):
+    query: str
+    case_sensitive: bool
+    normalize: bool  # traditional/simplified and full/half-width insensitive
+    identity: FileIdentity
+
+# Receives the hits of each chapter as soon as it has been scanned
+ProgressCallback = Callable[[list[SearchResult]], None]
+
+
+def _never() -> bool:
+    return False
+
+
+class SearchCache:
+    """Per-book LRU cache of search result sets.
+
+    Entries are keyed by (query, case mode, file identity), so editing the
+    book file on disk silently invalidates everything cached for it.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[SearchKey, list[SearchResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SearchKey) -> list[SearchResult] | None:
+        with self._lock:
+            results = self._entries.get(key)
+            if results is not None:
+                self._entries.move_to_end(key)
+            return results
+
+    def put(self, key: SearchKey, results: list[SearchResult]) -> None:
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def find_base(self, key: SearchKey) -> tuple[str, list[SearchResult]] | None:
+        """Find the longest cached query that ``key``'s query extends.
+
+        Every hit of "萧炎" starts where a hit of "萧" starts, so the cached
+        positions of a prefix are a complete candidate set for the longer query.
+        """
+        query = key.query
+        best: tuple[str, list[SearchResult]] | None = None
+        with self._lock:
+            for (q, *mode), results in self._entries.items():
+                if mode != list(key[1:]):
+                    continue
+                if len(q) < len(query) and query.startswith(q):
+                    if best is None or len(q) > len(best[0]):
+                        best = (q, results)
+        return best
+
+
+# (chapter index, case sensitive, normalize)
+FoldKey = tuple[int, bool, bool]
+
+
+class FoldCache:
+    """Per-book LRU of chapter texts next to the form queries match against.
+
+    Folding a chapter costs about as much as searching it, so searches, find
+    steps and refinements over the same chapters share the folded text.
+    Everything is dropped once the book file's identity changes.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self._identity: FileIdentity | None = None
+        self._entries: OrderedDict[FoldKey, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, identity: FileIdentity) -> None:
+        """Forget every entry if the file is no longer ``identity``."""
+        with self._lock:
+            if identity != self._identity:
+                self._identity = identity
+                self._entries.clear()
+
+    def get(self, key: FoldKey) -> tuple[str, str] | None:
+        with self._lock:
+            texts = self._entries.get(key)
+            if texts is not None:
+                self._entries.move_to_end(key)
+            return texts
+
+    def put(self, key: FoldKey, texts: tuple[str, str]) -> None:
+        with self._lock:
+            self._entries[key] = texts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class BookSearcher:
     """Searches through book chapters for text matches."""
 
-    def __init__(self, reader: BookReader, chapters: list[Chapter]) -> None:
+    def __init__(
+        self,
+        reader: BookReader,
+        chapters: Sequence[Chapter],
+        cache: SearchCache | None = None,
+        folds: FoldCache | None = None,
+    ) -> None:
         self.reader = reader
         self.chapters = chapters
+        self.cache = cache
+        self.folds = folds
 
-    def search(self, query: str, *, case_sensitive: bool = False) -> list[SearchResult]:
-        """Search all chapters for the given query string."""
-        results: list[SearchResult] = []
-        for chapter in self.chapters:
+    def search(
+        self,
+        query: str,
+        *,
+        case_sensitive: bool = False,
+        normalize: bool = False,
+        start_chapter: int = 0,
+        on_progress: ProgressCallback | None = None,
+        is_cancelled: Callable[[], bool] = _never,
+    ) -> list[SearchResult]:
+        """Search all chapters for the given query string.
+
+        ``start_chapter`` is scanned first so the caller can show its hits
+        right away; results are still returned in book order.
+        ``on_progress`` receives each scanned chapter's hits as they are
+        found.  If ``is_cancelled`` returns True the scan stops early and
+        the partial result set is returned without being cached.
+        With ``normalize`` traditional/simplified and full/half-width forms
+        match each other (see :mod:`novel_tui.core.normalize`).
+        """
+        scan = functools.partial(
+            self._scan,
+            normalize=normalize,
+            start_chapter=start_chapter,
+            on_progress=on_progress,
+            is_cancelled=is_cancelled,
+        )
+        if self.cache is None and self.folds is None:
+            return scan(query, case_sensitive)
+        try:
+            identity = self.reader.identity()
+        except FileNotFoundError:
+            return []
+        if self.folds is not None:
+            self.folds.sync(identity)
+        if self.cache is None:
+            return scan(query, case_sensitive)
+        key = SearchKey(query, case_sensitive, normalize, identity)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            if on_progress is not None:
+                on_progress(cached)
+            return list(cached)
+
+        base = self.cache.find_base(key)
+        if base is not None:
+            results = self._refine(
+                base[1], query, case_sensitive, normalize, on_progress, is_cancelled
+            )
+        else:
+            results = scan(query, case_sensitive)
+        if not is_cancelled():
+            self.cache.put(key, results)
+        return list(results)
+
+    def search_chapter(
+        self,
+        chapter: Chapter,
+        query: str,
+        *,
+        case_sensitive: bool = False,
+        normalize: bool = False,
+        limit: int | None = None,
+    ) -> list[SearchResult]:
+        """Search a single chapter, returning at most ``limit`` results."""
+        try:
+            self._sync_folds()
+        except FileNotFoundError:
+            return []
+        return self._search_chapter(chapter, query, case_sensitive, normalize, limit)
+
+    def find_next(
+        self,
+        query: str,
+        chapter_idx: int,
+        char_offset: int,
+        *,
+        backward: bool = False,
+        case_sensitive: bool = False,
+        normalize: bool = False,
+    ) -> SearchResult | None:
+        """Find the nearest match from a position, wrapping around the book.
+
+        Forward search returns the first match starting at or after
+        ``char_offset`` in ``chapter_idx``; backward search returns the last
+        match starting strictly before it.  Chapters are read one at a time
+        and the scan stops at the first hit, so the cost is proportional to
+        the distance to the match rather than the size of the book.
+        """
+        n = len(self.chapters)
+        if n == 0 or not query:
+            return None
+        chapter_idx = max(0, min(chapter_idx, n - 1))
+        try:
+            self._sync_folds()
+        except FileNotFoundError:
+            return None
+        search_query = match_form(query, case_sensitive, normalize)
+        step = -1 if backward else 1
+
+        # Visit the starting chapter twice: once from the cursor onwards and,
+        # after wrapping around, once for the part before the cursor.
+        for i in range(n + 1):
+            idx = (chapter_idx + step * i) % n
+            chapter = self.chapters[idx]
             try:
-                text = self.reader.read_chapter(chapter)
+                text, search_text = self._read(chapter, case_sensitive, normalize)
             except FileNotFoundError:
-                continue
+                return None
 
-            search_text = text if case_sensitive else text.lower()
-            search_query = query if case_sensitive else query.lower()
-
-            start = 0
-            while True:
-                pos = search_text.find(search_query, start)
-                if pos == -1:
-                    break
-                # Extract context (40 chars before and after)
-                ctx_start = max(0, pos - 40)
-                ctx_end = min(len(text), pos + len(query) + 40)
-                context = text[ctx_start:ctx_end].replace("\n", " ")
-                if ctx_start > 0:
-                    context = "..." + context
-                if ctx_end < len(text):
-                    context = context + "..."
-
-                results.append(
-                    SearchResult(
-                        chapter_idx=chapter.index,
-                        chapter_title=chapter.title,
-                        char_offset=pos,
-                        context=context,
+            if i == 0:
+                if backward:
+                    end = max(0, char_offset - 1 + len(search_query))
+                    pos = search_text.rfind(search_query, 0, end)
+                else:
+                    pos = search_text.find(search_query, char_offset)
+            elif i == n:
+                if backward:
+                    pos = search_text.rfind(search_query, char_offset)
+                else:
+                    pos = search_text.find(
+                        search_query, 0, char_offset - 1 + len(search_query)
                     )
-                )
-                start = pos + 1
+            else:
+                pos = search_text.rfind(search_query) if backward else search_text.find(search_query)
+
+            if pos != -1:
+                return _make_result(chapter, text, pos, len(query))
+        return None
+
+    def _scan(
+        self,
+        query: str,
+        case_sensitive: bool,
+        *,
+        normalize: bool = False,
+        start_chapter: int = 0,
+        on_progress: ProgressCallback | None = None,
+        is_cancelled: Callable[[], bool] = _never,
+    ) -> list[SearchResult]:
+        """Scan every chapter of the book, ``start_chapter`` first."""
+        n = len(self.chapters)
+        if n == 0:
+            return []
+        start = max(0, min(start_chapter, n - 1))
+        found: dict[int, list[SearchResult]] = {}
+        for idx in chain((start,), range(start), range(start + 1, n)):
+            if is_cancelled():
+                break
+            hits = self._search_chapter(self.chapters[idx], query, case_sensitive, normalize)
+            if hits:
+                found[idx] = hits
+            if on_progress is not None:
+                on_progress(hits)
+        return [r for idx in sorted(found) for r in found[idx]]
+
+    def _refine(
+        self,
+        candidates: list[SearchResult],
+        query: str,
+        case_sensitive: bool,
+        normalize: bool,
+        on_progress: ProgressCallback | None = None,
+        is_cancelled: Callable[[], bool] = _never,
+    ) -> list[SearchResult]:
+        """Re-check the hits of a shorter query instead of rescanning.
+
+        Only chapters that contain a candidate are read, once each.
+        """
+        results: list[SearchResult] = []
+        search_query = match_form(query, case_sensitive, normalize)
+        for chapter_idx, group in groupby(candidates, key=lambda r: r.chapter_idx):
+            if is_cancelled():
+                break
+            chapter = self.chapters[chapter_idx]
+            try:
+                text, search_text = self._read(chapter, case_sensitive, normalize)
+            except FileNotFoundError:
+                continue
+            hits = [
+                _make_result(chapter, text, candidate.char_offset, len(query))
+                for candidate in group
+                if search_text.startswith(search_query, candidate.char_offset)
+            ]
+            results.extend(hits)
+            if on_progress is not None:
+                on_progress(hits)
         return results
+
+    def _search_chapter(
+        self,
+        chapter: Chapter,
+        query: str,
+        case_sensitive: bool,
+        normalize: bool,
+        limit: int | None = None,
+    ) -> list[SearchResult]:
+        try:
+            text, search_text = self._read(chapter, case_sensitive, normalize)
+        except FileNotFoundError:
+            return []
+        positions = find_all(
+            text,
+            query,
+            case_sensitive=case_sensitive,
+            normalize=normalize,
+            limit=limit,
+            search_text=search_text,
+        )
+        return [_make_result(chapter, text, pos, len(query)) for pos in positions]
+
+    def _sync_folds(self) -> None:
+        if self.folds is not None:
+            self.folds.sync(self.reader.identity())
+
+    def _read(self, chapter: Chapter, case_sensitive: bool, normalize: bool) -> tuple[str, str]:
+        """A chapter's text and its match form, from the fold cache if possible."""
+        key = (chapter.index, case_sensitive, normalize)
+        if self.folds is not None:
+            texts = self.folds.get(key)
+            if texts is not None:
+                return texts
+        text = self.reader.read_chapter(chapter)
+        texts = (text, match_form(text, case_sensitive, normalize))
+        if self.folds is not None:
+            self.folds.put(key, texts)
+        return texts
+
+
+def find_all(
+    text: str,
+    query: str,
+    *,
+    case_sensitive: bool = False,
+    normalize: bool = False,
+    limit: int | None = None,
+    search_text: str | None = None,
+) -> array[int]:
+    """Sorted start offsets of every (possibly overlapping) match in ``text``.
+
+    ``search_text`` is :func:`match_form` of ``text``, for callers that keep
+    it around between queries.
+    """
+    positions: array[int] = array("I")
+    if not query:
+        return positions
+    if search_text is None:
+        search_text = match_form(text, case_sensitive, normalize)
+    search_query = match_form(query, case_sensitive, normalize)
+    pos = search_text.find(search_query)
+    while pos != -1 and (limit is None or len(positions) < limit):
+        positions.append(pos)
+        pos = search_text.find(search_query, pos + 1)
+    return positions
+
+
+def match_form(text: str, case_sensitive: bool = False, normalize: bool = False) -> str:
+    """Return the form of ``text`` that queries are matched against."""
+    if normalize:
+        # Length-preserving, so offsets into the result are offsets into text
+        return fold(text, case_sensitive=case_sensitive)
+    return text if case_sensitive else text.lower()
+
+
+def _make_result(chapter: Chapter, text: str, pos: int, length: int) -> SearchResult:
+    """Build a SearchResult with a one-line context snippet around ``pos``."""
+    ctx_start = max(0, pos - _CONTEXT_CHARS)
+    ctx_end = min(len(text), pos + length + _CONTEXT_CHARS)
+    context = text[ctx_start:ctx_end].replace("\n", " ")
+    if ctx_start > 0:
+        context = "..." + context
+    if ctx_end < len(text):
+        context = context + "..."
+    return SearchResult(
+        chapter_idx=chapter.index,
+        chapter_title=chapter.title,
+        char_offset=pos,
+        context=context,
+    )
+
+
+# Result sets larger than this are not worth persisting between sessions
+_MAX_PERSISTED_RESULTS = 5000
+
+
+def dump_results(key: SearchKey, results: list[SearchResult]) -> str | None:
+    """Serialize a result set for the settings DB, or None if it is too large."""
+    if len(results) > _MAX_PERSISTED_RESULTS:
+        return None
+    return json.dumps(
+        {
+            "query": key.query,
+            "case_sensitive": key.case_sensitive,
+            "normalize": key.normalize,
+            "identity": list(key.identity),
+            "hits": [
+                [r.chapter_idx, r.chapter_title, r.char_offset, r.context]
+                for r in results
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def load_results(payload: str) -> tuple[SearchKey, list[SearchResult]] | None:
+    """Inverse of :func:`dump_results`; returns None for malformed payloads."""
+    try:
+        data = json.loads(payload)
+        path, size, mtime = data["identity"]
+        key = SearchKey(
+            data["query"],
+            bool(data["case_sensitive"]),
+            bool(data.get("normalize", False)),
+            (path, size, mtime),
+        )
+        results = [SearchResult(*hit) for hit in data["hits"]]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return key, results
@@ -0,0 +1,189 @@
+"""Display-width line wrapping for CJK text."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# East Asian Wide (W) and Fullwidth (F) ranges, inclusive
+_WIDE_RANGES = (
+    (0x1100, 0x115F),
+    (0x231A, 0x231B),
+    (0x2329, 0x232A),
+    (0x23E9, 0x23EC),
+    (0x23F0, 0x23F0),
+    (0x23F3, 0x23F3),
+    (0x25FD, 0x25FE),
+    (0x2614, 0x2615),
+    (0x2648, 0x2653),
+    (0x267F, 0x267F),
+    (0x2693, 0x2693),
+    (0x26A1, 0x26A1),
+    (0x26AA, 0x26AB),
+    (0x26BD, 0x26BE),
+    (0x26C4, 0x26C5),
+    (0x26CE, 0x26CE),
+    (0x26D4, 0x26D4),
+    (0x26EA, 0x26EA),
+    (0x26F2, 0x26F3),
+    (0x26F5, 0x26F5),
+    (0x26FA, 0x26FA),
+    (0x26FD, 0x26FD),
+    (0x2705, 0x2705),
+    (0x270A, 0x270B),
+    (0x2728, 0x2728),
+    (0x274C, 0x274C),
+    (0x274E, 0x274E),
+    (0x2753, 0x2755),
+    (0x2757, 0x2757),
+    (0x2795, 0x2797),
+    (0x27B0, 0x27B0),
+    (0x27BF, 0x27BF),
+    (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50),
+    (0x2B55, 0x2B55),
+    (0x2E80, 0x303E),    # CJK radicals, Kangxi, CJK symbols and punctuation
+    (0x3041, 0x33FF),    # kana, bopomofo, Hangul compatibility, CJK compatibility
+    (0x3400, 0x4DBF),    # CJK extension A
+    (0x4E00, 0x9FFF),    # CJK unified ideographs
+    (0xA000, 0xA4CF),    # Yi
+    (0xA960, 0xA97F),
+    (0xAC00, 0xD7A3),    # Hangul syllables
+    (0xF900, 0xFAFF),    # CJK compatibility ideographs
+    (0xFE10, 0xFE19),    # vertical forms
+    (0xFE30, 0xFE6F),    # CJK compatibility forms, small form variants
+    (0xFF00, 0xFF60),    # fullwidth forms
+    (0xFFE0, 0xFFE6),
+    (0x16FE0, 0x16FE4),
+    (0x17000, 0x18AFF),  # Tangut
+    (0x1B000, 0x1B2FF),  # kana supplement
+    (0x1F004, 0x1F004),
+    (0x1F0CF, 0x1F0CF),
+    (0x1F18E, 0x1F18E),
+    (0x1F191, 0x1F19A),
+    (0x1F200, 0x1F251),
+    (0x1F260, 0x1F265),
+    (0x1F300, 0x1F64F),  # emoji
+    (0x1F680, 0x1F6FF),
+    (0x1F7E0, 0x1F7EB),
+    (0x1F90C, 0x1F9FF),
+    (0x1FA70, 0x1FAFF),
+    (0x20000, 0x2FFFD),  # CJK extensions B–F
+    (0x30000, 0x3FFFD),  # CJK extension G
+)
+
+# Everything outside the wide ranges takes one cell.  Combining marks are
+# counted as one cell too, which can only make a row shorter, never overflow.
+_NARROW = re.compile(
+    "[^" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _WIDE_RANGES) + "]"
+)
+
+# Kinsoku shori: characters that may not start a line ...
+_NO_START = frozenset(
+    "，。、；：？！）」』】〕〉》〗〙〛”’…—～·ー々ゝゞ"
+    "ぁぃぅぇぉっゃゅょゎァィゥェォッャュョヮヵヶ"
+    "．］｝｡｣､"
+    ",.;:?!)]}%"
+)
+# ... and characters that may not end one
+_NO_END = frozenset("（「『【〔〈《〖〘〚“‘［｛｢([{")
+
+# How many characters a line may give up to satisfy the kinsoku rules
+_MAX_PUSHBACK = 3
+
+
+def char_width(ch: str) -> int:
+    """Terminal cell width of a single character."""
+    return 1 if _NARROW.match(ch) else 2
+
+
+def narrow_positions(text: str) -> Sequence[int]:
+    """Sorted indexes of the one-cell characters in ``text``.
+
+    Chinese prose is almost entirely wide, so this is a short list found by
+    a single regex scan; the width of any slice follows from two bisects.
+    """
+    if text.isascii():
+        return range(len(text))
+    return [m.start() for m in _NARROW.finditer(text)]
+
+
+def cell_width(text: str) -> int:
+    """Terminal cell width of ``text``."""
+    return 2 * len(text) - len(narrow_positions(text))
+
+
+def wrap(text: str, width: int) -> list[str]:
+    """Wrap a paragraph into rows of at most ``width`` terminal cells.
+
+    Rows are measured in bulk from the positions of narrow characters, so
+    the Python-level work is a few bisects per row rather than a step per
+    character.  Rows never start with closing punctuation or end with
+    opening punctuation (characters are pushed to the next row instead),
+    and runs of Latin letters and digits are broken at the preceding space
+    when there is one.  Always returns at least one row.
+    """
+    n = len(text)
+    if 2 * n <= width:
+        # Fits even if every character is wide
+        return [text]
+    narrow = narrow_positions(text)
+    if 2 * n - len(narrow) <= width:
+        return [text]
+
+    rows: list[str] = []
+    start = 0
+    while start < n:
+        end = _fit(narrow, n, start, width)
+        if end < n:
+            end = _adjust_break(text, start, end)
+        rows.append(text[start:end].rstrip(" "))
+        start = end
+        while start < n and text[start] == " ":
+            start += 1
+    return rows or [""]
+
+
+def _fit(narrow: Sequence[int], n: int, start: int, width: int) -> int:
+    """End of the longest run from ``start`` that fits in ``width`` cells.
+
+    Always takes at least one character.
+    """
+    lo = bisect_left(narrow, start)
+    # Half the width in characters always fits; then keep filling the room
+    # that is left, which at least halves on every step
+    end = min(n, start + width // 2)
+    k = bisect_left(narrow, end, lo)
+    room = width - 2 * (end - start) + (k - lo)
+    while room > 0 and end < n:
+        if room == 1:
+            if k < len(narrow) and narrow[k] == end:
+                end += 1
+            break
+        step = min(room // 2, n - end)
+        k2 = bisect_left(narrow, end + step, k)
+        room -= 2 * step - (k2 - k)
+        end, k = end + step, k2
+    return max(end, start + 1)
+
+
+def _adjust_break(text: str, start: int, end: int) -> int:
+    """Move a break at ``end`` back to satisfy kinsoku and word rules."""
+    if _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+        space = text.rfind(" ", start, end)
+        if space > start:
+            return space + 1
+
+    lo = max(start + 1, end - _MAX_PUSHBACK)
+    pos = end
+    while pos > lo and (text[pos] in _NO_START or text[pos - 1] in _NO_END):
+        pos -= 1
+    if text[pos] in _NO_START or text[pos - 1] in _NO_END:
+        # Could not fix it within the pushback limit; keep the hard break
+        return end
+    return pos
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
@@ -3,14 +3,40 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
-from platformdirs import user_data_dir
+_pool: _Pool | None = None
+_path: str | None = None  # the library opened last
+_open_lock = threading.Lock()
 
-_connection: sqlite3.Connection | None = None
+# Readers of finished threads kept for the next ones, beyond which they
+# are closed
+_MAX_IDLE_READERS = 4
+# Prepared statements kept per connection
+_STATEMENT_CACHE = 256
 
-SCHEMA = """\
-CREATE TABLE IF NOT EXISTS books (
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    # With WAL a commit survives an app crash without an fsync; only a
+    # power cut can lose the last few
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-16000",  # KiB, per connection
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Bumped whenever an existing library needs migrating (see _migrate)
+SCHEMA_VERSION = 4
+
+_BOOKS_COLUMNS = """(
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     title TEXT NOT NULL,
     file_path TEXT NOT NULL UNIQUE,
@@ -18,51 +44,280 @@ CREATE TABLE IF NOT EXISTS books (
     encoding TEXT NOT NULL DEFAULT 'utf-8',
     word_count INTEGER NOT NULL DEFAULT 0,
     chapter_count INTEGER NOT NULL DEFAULT 0,
-    added_at TEXT NOT NULL DEFAULT (datetime('now','localtime')),
-    last_read_at TEXT,
+    added_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    last_read_at INTEGER,  -- seconds since the epoch, like added_at
     read_position INTEGER NOT NULL DEFAULT 0,
-    read_chapter_idx INTEGER NOT NULL DEFAULT 0
-);
+    read_chapter_idx INTEGER NOT NULL DEFAULT 0,
+    file_mtime INTEGER NOT NULL DEFAULT 0  -- st_mtime_ns when added, 0 if unknown
+)"""
 
-CREATE TABLE IF NOT EXISTS chapters (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
-    idx INTEGER NOT NULL,
-    title TEXT NOT NULL,
-    level INTEGER NOT NULL DEFAULT 2,
-    byte_offset INTEGER NOT NULL,
-    length INTEGER NOT NULL DEFAULT 0
+SCHEMA = f"""\
+CREATE TABLE IF NOT EXISTS books {_BOOKS_COLUMNS};
+-- The shelf order (NULLs, never read, sort last when descending), and the
+-- title filter: a LIKE prefix, which can only use a NOCASE index
+CREATE INDEX IF NOT EXISTS idx_books_shelf ON books(last_read_at DESC, added_at DESC);
+CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE);
+
+-- One row per book: the chapter columns as packed arrays (native byte
+-- order), and the titles as one UTF-8 blob cut up by title_ends
+CREATE TABLE IF NOT EXISTS chapter_index (
+    book_id INTEGER PRIMARY KEY REFERENCES books(id) ON DELETE CASCADE,
+    byte_offsets BLOB NOT NULL,  -- array('Q')
+    lengths BLOB NOT NULL,       -- array('I'), bytes
+    levels BLOB NOT NULL,        -- array('B')
+    title_ends BLOB NOT NULL,    -- array('I'), end of each title in titles
+    titles BLOB NOT NULL
 );
-CREATE INDEX IF NOT EXISTS idx_chapters_book ON chapters(book_id, idx);
 
 CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+
+-- Paginated mode: first paragraph of each page, as a packed array('I'),
+-- for the book's most recent page geometry and the file and pagination
+-- rules they were computed from
+CREATE TABLE IF NOT EXISTS page_tables (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    width INTEGER NOT NULL,
+    spacing INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    chapter_idx INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    starts BLOB NOT NULL,
+    PRIMARY KEY (book_id, width, spacing, height, chapter_idx)
+) WITHOUT ROWID;
 """
 
 
 def _db_path() -> Path:
+    from platformdirs import user_data_dir
+
     data_dir = Path(user_data_dir("novel-tui", ensure_exists=True))
     return data_dir / "library.db"
 
 
 def get_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
-    """Get or create singleton SQLite connection."""
-    global _connection
-    if _connection is not None:
-        return _connection
-
-    path = str(db_path) if db_path else str(_db_path())
-    conn = sqlite3.connect(path)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    """The calling thread's read connection, opening the library on first use.
+
+    Every thread gets a connection of its own, so workers read while the UI
+    thread does; readers are query-only, and writes go through
+    :func:`writing`.
+    """
+    pool = _open(db_path)
+    lease = getattr(pool.local, "lease", None)
+    if lease is None:
+        lease = pool.local.lease = _Lease(pool, pool.acquire())
+    return lease.conn
+
+
+@contextmanager
+def writing() -> Iterator[sqlite3.Connection]:
+    """The writer connection, in a transaction that commits on leaving.
+
+    There is one writer for all threads and it is used by one at a time,
+    which is all SQLite allows anyway; readers are not blocked meanwhile.
+    """
+    pool = _open(None)
+    with pool.write_lock, pool.writer:
+        yield pool.writer
+
+
+def db_file() -> str:
+    """Path of the open library."""
+    return _open(None).path
+
+
+def reset_connection() -> None:
+    """Close every connection (at exit, or before opening another library)."""
+    global _pool
+    with _open_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def _open(db_path: str | Path | None) -> _Pool:
+    global _pool, _path
+    if _pool is not None:
+        return _pool
+    with _open_lock:
+        if _pool is None:
+            # Reopening after a reset keeps to the same library
+            path = str(db_path) if db_path else _path or str(_db_path())
+            _pool = _Pool(path)
+            _path = path
+        return _pool
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    # Each connection is only used by one thread at a time, but may be
+    # closed from another one at shutdown
+    conn = sqlite3.connect(
+        path, check_same_thread=False, cached_statements=_STATEMENT_CACHE
+    )
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     conn.row_factory = sqlite3.Row
-    conn.executescript(SCHEMA)
-    _connection = conn
     return conn
 
 
-def reset_connection() -> None:
-    """Close and reset the singleton connection."""
-    global _connection
-    if _connection is not None:
-        _connection.close()
-        _connection = None
+class _Pool:
+    """The writer plus the readers handed out to threads."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.writer = _connect(path)
+        # A current library has all of SCHEMA already; only a new or older
+        # one is worth the script on every launch
+        version = self.writer.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            self.writer.executescript(SCHEMA)
+            _migrate(self.writer)
+        self.write_lock = threading.RLock()
+        self.local = threading.local()
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._leased: list[sqlite3.Connection] = []
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = _connect(self.path)
+                conn.execute("PRAGMA query_only=ON")
+            self._leased.append(conn)
+            return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Take back the reader of a thread that ended."""
+        with self._lock:
+            if self._closed:
+                return
+            self._leased.remove(conn)
+            if len(self._idle) < _MAX_IDLE_READERS:
+                self._idle.append(conn)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        with self.write_lock, self._lock:
+            self._closed = True
+            for conn in self._idle + self._leased:
+                conn.close()
+            self._idle.clear()
+            self._leased.clear()
+            self.writer.execute("PRAGMA optimize")
+            self.writer.close()
+
+
+class _Lease:
+    """A thread's reader; goes back to the pool when the thread ends and
+    its thread-local data is dropped."""
+
+    def __init__(self, pool: _Pool, conn: sqlite3.Connection) -> None:
+        self.pool = pool
+        self.conn = conn
+
+    def __del__(self) -> None:
+        self.pool.release(self.conn)
+
+
+def pack_chapters(
+    chapters: Iterable[tuple[str, int, int, int]],
+) -> tuple[bytes, bytes, bytes, bytes, bytes]:
+    """Columns of a chapter_index row from (title, level, byte_offset, length)."""
+    offsets, lengths, levels, ends = array("Q"), array("I"), array("B"), array("I")
+    titles = bytearray()
+    for title, level, byte_offset, length in chapters:
+        titles += title.encode("utf-8")
+        offsets.append(byte_offset)
+        lengths.append(length)
+        levels.append(level)
+        ends.append(len(titles))
+    return (
+        offsets.tobytes(),
+        lengths.tobytes(),
+        levels.tobytes(),
+        ends.tobytes(),
+        bytes(titles),
+    )
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring a library written by an older version up to SCHEMA_VERSION."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+    if version < 1:
+        _migrate_chapters(conn)
+    if version < 2:
+        _migrate_timestamps(conn)
+    if version < 3:
+        _migrate_mtime(conn)
+    if version < 4:
+        _migrate_page_tables(conn)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _migrate_chapters(conn: sqlite3.Connection) -> None:
+    """Pack the one-row-per-chapter table of older libraries into chapter_index."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chapters'"
+    ).fetchone()
+    if exists is None:
+        return
+    rows = conn.execute(
+        "SELECT book_id, title, level, byte_offset, length FROM chapters ORDER BY book_id, idx"
+    ).fetchall()
+    with conn:
+        for book_id, group in groupby(rows, key=itemgetter(0)):
+            conn.execute(
+                "INSERT OR REPLACE INTO chapter_index VALUES (?, ?, ?, ?, ?, ?)",
+                (book_id, *pack_chapters(tuple(r)[1:] for r in group)),
+            )
+        conn.execute("DROP TABLE chapters")
+
+
+def _migrate_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild a books table that kept its times as local-time text."""
+    columns = {r["name"]: r["type"] for r in conn.execute("PRAGMA table_info(books)")}
+    if columns.get("added_at") != "TEXT":
+        return
+    # Dropping the old table must not cascade to the chapter indexes
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute(f"CREATE TABLE books_new {_BOOKS_COLUMNS}")
+            conn.execute(
+                """INSERT INTO books_new (id, title, file_path, file_size, encoding,
+                       word_count, chapter_count, added_at, last_read_at,
+                       read_position, read_chapter_idx)
+                   SELECT id, title, file_path, file_size, encoding, word_count,
+                          chapter_count,
+                          CAST(strftime('%s', added_at, 'utc') AS INTEGER),
+                          CAST(strftime('%s', last_read_at, 'utc') AS INTEGER),
+                          read_position, read_chapter_idx
+                   FROM books"""
+            )
+            conn.execute("DROP TABLE books")
+            conn.execute("ALTER TABLE books_new RENAME TO books")
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
+    # The indexes went with the old table
+    conn.executescript(SCHEMA)
+
+
+def _migrate_mtime(conn: sqlite3.Connection) -> None:
+    """Add the file_mtime column; the integrity scan fills it in later."""
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(books)")}
+    if "file_mtime" not in columns:
+        conn.execute("ALTER TABLE books ADD COLUMN file_mtime INTEGER NOT NULL DEFAULT 0")
+
+
+def _migrate_page_tables(conn: sqlite3.Connection) -> None:
+    """Drop page tables cached without their source; they are recomputed."""
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(page_tables)")}
+    if "source" not in columns:
+        conn.execute("DROP TABLE page_tables")
+        conn.executescript(SCHEMA)
@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import overload
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     title: str
     file_path: str
     file_size: int = 0
+    file_mtime: int = 0  # st_mtime_ns when added, 0 if unknown
     encoding: str = "utf-8"
     word_count: int = 0
     chapter_count: int = 0
     added_at: datetime = field(default_factory=datetime.now)
     last_read_at: datetime | None = None
-    read_position: int = 0
+    read_position: int = 0  # char offset of the top paragraph in the chapter
     read_chapter_idx: int = 0
     id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     book_id: int
     index: int
@@ -29,10 +34,75 @@ class Chapter:
     byte_offset: int
     length: int = 0
     level: int = 2
-    id: int | None = None
+
+
+class ChapterTable(Sequence[Chapter]):
+    """A book's chapters as packed columns.
+
+    Indexing builds a :class:`Chapter` on demand, so callers written for a
+    list of chapters keep working, while the table itself costs a few bytes
+    per chapter: three arrays, plus the titles as one UTF-8 blob that is
+    only decoded title by title.
+    """
+
+    def __init__(
+        self,
+        book_id: int,
+        byte_offsets: array[int] | None = None,
+        lengths: array[int] | None = None,
+        levels: array[int] | None = None,
+        title_ends: array[int] | None = None,
+        titles: bytes = b"",
+    ) -> None:
+        self.book_id = book_id
+        self.byte_offsets = byte_offsets if byte_offsets is not None else array("Q")
+        self.lengths = lengths if lengths is not None else array("I")
+        self.levels = levels if levels is not None else array("B")
+        # title i is titles[title_ends[i - 1]:title_ends[i]]
+        self.title_ends = title_ends if title_ends is not None else array("I")
+        self.titles = titles
+
+    def __len__(self) -> int:
+        return len(self.byte_offsets)
+
+    @overload
+    def __getitem__(self, idx: int) -> Chapter: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Chapter]: ...
+
+    def __getitem__(self, idx: int | slice) -> Chapter | list[Chapter]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = range(len(self))[idx]
+        return Chapter(
+            book_id=self.book_id,
+            index=idx,
+            title=self.title(idx),
+            byte_offset=self.byte_offsets[idx],
+            length=self.lengths[idx],
+            level=self.levels[idx],
+        )
+
+    def title(self, idx: int) -> str:
+        start = self.title_ends[idx - 1] if idx > 0 else 0
+        return self.titles[start : self.title_ends[idx]].decode("utf-8")
+
+    def chapter_at(self, byte_offset: int) -> int:
+        """Index of the chapter containing ``byte_offset`` in the book file."""
+        return max(bisect_right(self.byte_offsets, byte_offset) - 1, 0)
 
 
 @dataclass
 class UserSettings:
     line_spacing: int = 1
     max_width: int = 80
+    live_search: bool = False  # search as you type
+    normalize_search: bool = False  # 繁简 / 全半角 insensitive search
+    continuous_scroll: bool = False  # scroll on across chapter boundaries
+    scroll_fps: int = 60  # cap on line-scroll repaints per second
+    wheel_acceleration: bool = False  # fast wheel spins scroll further
+    paginated: bool = False  # flip whole pages instead of scrolling
+    auto_scroll_speed: int = 10  # characters (or rows) per second
+    auto_scroll_by_rows: bool = False
+    low_bandwidth: bool = False  # fewer bytes per repaint, e.g. over SSH
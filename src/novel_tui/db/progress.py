@@ -0,0 +1,105 @@
+"""Write-behind saving of reading progress."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+from novel_tui.db.connection import writing
+
+# How long the first unsaved position waits for more to join its write
+_COALESCE_SECONDS = 1.0
+
+
+class ProgressWriter:
+    """Saves reading progress on a thread of its own.
+
+    :meth:`save` only records the position.  The thread writes the latest
+    position of every book saved since its last write, in one transaction,
+    a moment after the first of them came in; positions equal to the last
+    one written for a book are dropped without a write.
+    """
+
+    def __init__(self, delay: float = _COALESCE_SECONDS) -> None:
+        self._delay = delay
+        self._cond = threading.Condition()
+        # book_id -> (chapter_idx, position, read_at)
+        self._pending: dict[int, tuple[int, int, int]] = {}
+        self._written: dict[int, tuple[int, int]] = {}
+        self._writing = False
+        self._urgent = False  # skip the coalescing wait
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, book_id: int, chapter_idx: int, position: int) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            if book_id not in self._pending and self._written.get(book_id) == (
+                chapter_idx,
+                position,
+            ):
+                return
+            self._pending[book_id] = (chapter_idx, position, int(time.time()))
+            self._cond.notify_all()
+
+    @property
+    def idle(self) -> bool:
+        """True if everything saved so far has been written."""
+        with self._cond:
+            return not self._pending and not self._writing
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write what is pending now and wait for it; False on timeout."""
+        with self._cond:
+            if self._pending:
+                # Otherwise the flag would outlive this call and rush the
+                # next ordinary save
+                self._urgent = True
+                self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Write what is pending and stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return  # closed, nothing left
+                self._cond.wait_for(lambda: self._urgent or self._closed, self._delay)
+                batch, self._pending = self._pending, {}
+                self._urgent = False
+                self._writing = True
+            ok = self._write(batch)
+            with self._cond:
+                self._writing = False
+                if ok:
+                    for book_id, (chapter_idx, position, _) in batch.items():
+                        self._written[book_id] = (chapter_idx, position)
+                elif not self._closed:
+                    # Retry with the next write, unless saved again since
+                    self._pending = batch | self._pending
+                self._cond.notify_all()
+
+    @staticmethod
+    def _write(batch: dict[int, tuple[int, int, int]]) -> bool:
+        try:
+            with writing() as conn:
+                conn.executemany(
+                    """UPDATE books SET read_chapter_idx = ?, read_position = ?,
+                       last_read_at = ? WHERE id = ?""",
+                    [(c, p, t, book_id) for book_id, (c, p, t) in batch.items()],
+                )
+        except sqlite3.Error:
+            return False
+        return True
@@ -2,65 +2,159 @@
 
 from __future__ import annotations
 
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields, replace
 from datetime import datetime
 
-from novel_tui.db.connection import get_connection
-from novel_tui.db.models import Book, Chapter, UserSettings
+from novel_tui.db.connection import get_connection, pack_chapters, writing
+from novel_tui.db.models import Book, Chapter, ChapterTable, UserSettings
+
+# Bytes per entry of the packed title_ends column
+_END_SIZE = array("I").itemsize
 
 
 # ── Book CRUD ──
 
 
+_INSERT_BOOK = """INSERT INTO books (title, file_path, file_size, encoding, word_count,
+    chapter_count, added_at, last_read_at, read_position, read_chapter_idx, file_mtime)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) RETURNING id"""
+
+# Chapters packed between two import progress reports
+_IMPORT_BATCH = 5000
+
+
 def add_book(book: Book) -> Book:
-    conn = get_connection()
-    cur = conn.execute(
-        """INSERT INTO books (title, file_path, file_size, encoding, word_count,
-           chapter_count, added_at, last_read_at, read_position, read_chapter_idx)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            book.title,
-            book.file_path,
-            book.file_size,
-            book.encoding,
-            book.word_count,
-            book.chapter_count,
-            book.added_at.strftime("%Y-%m-%d %H:%M:%S"),
-            book.last_read_at.strftime("%Y-%m-%d %H:%M:%S") if book.last_read_at else None,
-            book.read_position,
-            book.read_chapter_idx,
-        ),
-    )
-    conn.commit()
-    book.id = cur.lastrowid
+    with writing() as conn:
+        book.id = conn.execute(_INSERT_BOOK, _book_params(book)).fetchone()[0]
     return book
 
 
+def import_book(
+    book: Book,
+    chapters: Iterable[Chapter],
+    progress: Callable[[str], None] | None = None,
+) -> Book:
+    """Store a parsed book and its chapter index in a single transaction.
+
+    Chapters are packed as they come, without touching their ``book_id``;
+    either both rows are written or neither is.
+    """
+    report = progress or (lambda _s: None)
+
+    def rows() -> Iterator[tuple[str, int, int, int]]:
+        for i, c in enumerate(chapters, 1):
+            yield c.title, c.level, c.byte_offset, c.length
+            if i % _IMPORT_BATCH == 0:
+                report(f"保存章节 {i}/{book.chapter_count}...")
+
+    packed = pack_chapters(rows())
+    report("写入数据库...")
+    with writing() as conn:
+        book.id = conn.execute(_INSERT_BOOK, _book_params(book)).fetchone()[0]
+        if packed[0]:
+            conn.execute(
+                "INSERT INTO chapter_index VALUES (?, ?, ?, ?, ?, ?)", (book.id, *packed)
+            )
+    return book
+
+
+def _book_params(book: Book) -> tuple[object, ...]:
+    return (
+        book.title,
+        book.file_path,
+        book.file_size,
+        book.encoding,
+        book.word_count,
+        book.chapter_count,
+        int(book.added_at.timestamp()),
+        int(book.last_read_at.timestamp()) if book.last_read_at else None,
+        book.read_position,
+        book.read_chapter_idx,
+        book.file_mtime,
+    )
+
+
 def get_all_books() -> list[Book]:
+    return get_books(0, -1)
+
+
+def get_books(offset: int, limit: int, title_prefix: str = "") -> list[Book]:
+    """``limit`` books (-1 for all) from ``offset`` in shelf order: the most
+    recently read first, then the most recently added.
+
+    With ``title_prefix`` only books whose title starts with it (ignoring
+    ASCII case) are included.
+    """
     conn = get_connection()
-    rows = conn.execute("SELECT * FROM books ORDER BY last_read_at DESC NULLS LAST, added_at DESC").fetchall()
+    where, params = _title_filter(title_prefix)
+    rows = conn.execute(
+        f"""SELECT * FROM books {where}
+            ORDER BY last_read_at DESC, added_at DESC LIMIT ? OFFSET ?""",
+        (*params, limit, offset),
+    ).fetchall()
     return [_row_to_book(r) for r in rows]
 
 
+def count_books(title_prefix: str = "") -> int:
+    conn = get_connection()
+    where, params = _title_filter(title_prefix)
+    return conn.execute(f"SELECT count(*) FROM books {where}", params).fetchone()[0]
+
+
+def _title_filter(title_prefix: str) -> tuple[str, tuple[str, ...]]:
+    if not title_prefix:
+        return "", ()
+    escaped = title_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return "WHERE title LIKE ? ESCAPE '\\'", (escaped + "%",)
+
+
 def get_book(book_id: int) -> Book | None:
     conn = get_connection()
     row = conn.execute("SELECT * FROM books WHERE id = ?", (book_id,)).fetchone()
     return _row_to_book(row) if row else None
 
 
-def delete_book(book_id: int) -> None:
+def get_last_read_book() -> Book | None:
     conn = get_connection()
-    conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
-    conn.commit()
+    row = conn.execute(
+        """SELECT * FROM books WHERE last_read_at IS NOT NULL
+           ORDER BY last_read_at DESC LIMIT 1"""
+    ).fetchone()
+    return _row_to_book(row) if row else None
+
+
+def delete_book(book_id: int) -> None:
+    with writing() as conn:
+        conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        conn.execute("DELETE FROM settings WHERE key = ?", (_last_search_key(book_id),))
 
 
 def update_read_progress(book_id: int, chapter_idx: int, position: int) -> None:
+    with writing() as conn:
+        conn.execute(
+            """UPDATE books SET read_chapter_idx = ?, read_position = ?,
+               last_read_at = ? WHERE id = ?""",
+            (chapter_idx, position, int(time.time()), book_id),
+        )
+
+
+def get_file_stats() -> list[tuple[int, str, int, int]]:
+    """(id, file_path, file_size, file_mtime) of every book."""
     conn = get_connection()
-    conn.execute(
-        """UPDATE books SET read_chapter_idx = ?, read_position = ?,
-           last_read_at = datetime('now','localtime') WHERE id = ?""",
-        (chapter_idx, position, book_id),
-    )
-    conn.commit()
+    rows = conn.execute("SELECT id, file_path, file_size, file_mtime FROM books")
+    return [tuple(r) for r in rows]
+
+
+def set_file_mtimes(mtimes: dict[int, int]) -> None:
+    """Record the file mtimes of books added before they were kept."""
+    with writing() as conn:
+        conn.executemany(
+            "UPDATE books SET file_mtime = ? WHERE id = ?",
+            [(mtime, book_id) for book_id, mtime in mtimes.items()],
+        )
 
 
 def _row_to_book(row: object) -> Book:
@@ -69,13 +163,14 @@ def _row_to_book(row: object) -> Book:
         title=row["title"],
         file_path=row["file_path"],
         file_size=row["file_size"],
+        file_mtime=row["file_mtime"],
         encoding=row["encoding"],
         word_count=row["word_count"],
         chapter_count=row["chapter_count"],
-        added_at=datetime.strptime(row["added_at"], "%Y-%m-%d %H:%M:%S"),
+        added_at=datetime.fromtimestamp(row["added_at"]),
         last_read_at=(
-            datetime.strptime(row["last_read_at"], "%Y-%m-%d %H:%M:%S")
-            if row["last_read_at"]
+            datetime.fromtimestamp(row["last_read_at"])
+            if row["last_read_at"] is not None
             else None
         ),
         read_position=row["read_position"],
@@ -87,32 +182,109 @@ def _row_to_book(row: object) -> Book:
 
 
 def add_chapters(chapters: list[Chapter]) -> None:
+    """Store a book's chapters (all of one book, in order) as its chapter index."""
+    if not chapters:
+        return
+    with writing() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO chapter_index VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                chapters[0].book_id,
+                *pack_chapters((c.title, c.level, c.byte_offset, c.length) for c in chapters),
+            ),
+        )
+
+
+def get_chapters(book_id: int) -> ChapterTable:
+    """A book's chapter table, read from a single row."""
     conn = get_connection()
-    conn.executemany(
-        """INSERT INTO chapters (book_id, idx, title, level, byte_offset, length)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        [(c.book_id, c.index, c.title, c.level, c.byte_offset, c.length) for c in chapters],
+    row = conn.execute(
+        "SELECT * FROM chapter_index WHERE book_id = ?", (book_id,)
+    ).fetchone()
+    if row is None:
+        return ChapterTable(book_id)
+    return ChapterTable(
+        book_id,
+        array("Q", row["byte_offsets"]),
+        array("I", row["lengths"]),
+        array("B", row["levels"]),
+        array("I", row["title_ends"]),
+        row["titles"],
     )
-    conn.commit()
 
 
-def get_chapters(book_id: int) -> list[Chapter]:
+def get_chapter_titles(book_id: int, start: int = 0, stop: int | None = None) -> list[str]:
+    """Titles of chapters ``start`` to ``stop`` (exclusive, default the last).
+
+    Only the ends of those titles and their slice of the titles blob are read.
+    """
+    conn = get_connection()
+    # The end of the title before the window is where the window starts
+    first = max(start - 1, 0)
+    size = None if stop is None else max(stop - first, 0) * _END_SIZE
+    row = conn.execute(
+        """SELECT substr(title_ends, ?, coalesce(?, length(title_ends)))
+           FROM chapter_index WHERE book_id = ?""",
+        (first * _END_SIZE + 1, size, book_id),
+    ).fetchone()
+    ends = array("I", row[0] if row is not None else b"")
+    base = ends.pop(0) if start > 0 and ends else 0
+    if not ends:
+        return []
+    blob = conn.execute(
+        "SELECT substr(titles, ?, ?) FROM chapter_index WHERE book_id = ?",
+        (base + 1, ends[-1] - base, book_id),
+    ).fetchone()[0]
+    titles = []
+    prev = 0
+    for end in ends:
+        titles.append(blob[prev : end - base].decode("utf-8"))
+        prev = end - base
+    return titles
+
+
+# ── Page tables ──
+
+
+def get_page_tables(
+    book_id: int, geometry: tuple[int, int, int], source: str
+) -> dict[int, array[int]]:
+    """Cached page starts of a book's chapters for (width, spacing, height),
+    computed from ``source`` (the file and pagination rules)."""
     conn = get_connection()
     rows = conn.execute(
-        "SELECT * FROM chapters WHERE book_id = ? ORDER BY idx", (book_id,)
+        """SELECT chapter_idx, starts FROM page_tables
+           WHERE book_id = ? AND width = ? AND spacing = ? AND height = ?
+           AND source = ?""",
+        (book_id, *geometry, source),
     ).fetchall()
-    return [
-        Chapter(
-            id=r["id"],
-            book_id=r["book_id"],
-            index=r["idx"],
-            title=r["title"],
-            level=r["level"],
-            byte_offset=r["byte_offset"],
-            length=r["length"],
+    tables = {}
+    for r in rows:
+        starts = array("I")
+        starts.frombytes(r["starts"])
+        tables[r["chapter_idx"]] = starts
+    return tables
+
+
+def save_page_tables(
+    book_id: int, geometry: tuple[int, int, int], source: str, tables: dict[int, array[int]]
+) -> None:
+    """Cache page starts, replacing those of any other geometry or source."""
+    with writing() as conn:
+        conn.execute(
+            """DELETE FROM page_tables WHERE book_id = ?
+               AND (width, spacing, height, source) != (?, ?, ?, ?)""",
+            (book_id, *geometry, source),
+        )
+        conn.executemany(
+            """INSERT OR REPLACE INTO page_tables
+               (book_id, width, spacing, height, chapter_idx, source, starts)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (book_id, *geometry, idx, source, starts.tobytes())
+                for idx, starts in tables.items()
+            ],
         )
-        for r in rows
-    ]
 
 
 # ── Settings ──
@@ -120,22 +292,63 @@ def get_chapters(book_id: int) -> list[Chapter]:
 
 def get_settings() -> UserSettings:
     conn = get_connection()
-    rows = conn.execute("SELECT key, value FROM settings").fetchall()
-    data = {r["key"]: r["value"] for r in rows}
-    return UserSettings(
-        line_spacing=int(data.get("line_spacing", "1")),
-        max_width=int(data.get("max_width", "80")),
-    )
+    defaults = UserSettings()
+    names = [f.name for f in fields(UserSettings)]
+    placeholders = ", ".join("?" * len(names))
+    rows = conn.execute(
+        f"SELECT key, value FROM settings WHERE key IN ({placeholders})", names
+    ).fetchall()
+    data = {}
+    for r in rows:
+        default, value = getattr(defaults, r["key"]), r["value"]
+        try:
+            # bool first: bool("0") would be True
+            data[r["key"]] = value == "1" if isinstance(default, bool) else type(default)(value)
+        except ValueError:
+            continue
+    return replace(defaults, **data)
 
 
 def save_settings(settings: UserSettings) -> None:
+    with writing() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [
+                (f.name, _format_setting(getattr(settings, f.name)))
+                for f in fields(UserSettings)
+            ],
+        )
+
+
+def _format_setting(value: object) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+# ── Search ──
+
+
+def _last_search_key(book_id: int) -> str:
+    return f"last_search:{book_id}"
+
+
+def get_last_search(book_id: int) -> str | None:
+    """Return the serialized result set of the book's last search, if any."""
     conn = get_connection()
-    conn.execute(
-        "INSERT OR REPLACE INTO settings (key, value) VALUES ('line_spacing', ?)",
-        (str(settings.line_spacing),),
-    )
-    conn.execute(
-        "INSERT OR REPLACE INTO settings (key, value) VALUES ('max_width', ?)",
-        (str(settings.max_width),),
-    )
-    conn.commit()
+    row = conn.execute(
+        "SELECT value FROM settings WHERE key = ?", (_last_search_key(book_id),)
+    ).fetchone()
+    return row["value"] if row else None
+
+
+def save_last_search(book_id: int, payload: str | None) -> None:
+    """Keep the book's last result set; None forgets the previous one."""
+    with writing() as conn:
+        if payload is None:
+            conn.execute("DELETE FROM settings WHERE key = ?", (_last_search_key(book_id),))
+            return
+        conn.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            (_last_search_key(book_id), payload),
+        )
@@ -45,25 +45,20 @@ class AddBookModal(ModalScreen[Book | None]):
 
     @work(thread=True)
     def _parse_and_save(self, file_path: str) -> None:
-        try:
-            def on_progress(msg: str) -> None:
-                self.app.call_from_thread(self._set_status, msg)
+        def on_progress(msg: str) -> None:
+            self.app.call_from_thread(self._set_status, msg)
 
+        try:
             book, chapters = parse_book(file_path, progress=on_progress)
-            self.app.call_from_thread(self._save_to_db, book, chapters)
         except Exception as e:
             self.app.call_from_thread(self._on_parse_error, str(e))
-
-    def _save_to_db(self, book: Book, chapters: list) -> None:
+            return
         try:
-            self._set_status("保存到数据库...")
-            book = repository.add_book(book)
-            for ch in chapters:
-                ch.book_id = book.id
-            repository.add_chapters(chapters)
-            self.dismiss(book)
+            book = repository.import_book(book, chapters, progress=on_progress)
         except Exception as e:
-            self._on_parse_error(f"保存失败: {e}")
+            self.app.call_from_thread(self._on_parse_error, f"保存失败: {e}")
+            return
+        self.app.call_from_thread(self.dismiss, book)
 
     def _on_parse_error(self, msg: str) -> None:
         self._set_status(msg, error=True)
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+from functools import partial
+from typing import TYPE_CHECKING
+
+from textual import work
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
-from textual.widgets import Button, DataTable, Footer, Header, Label
+from textual.widgets import Button, Footer, Header, Input, Label
+from textual.worker import get_current_worker
 
+from novel_tui.core.integrity import FileCheck, FileStatus, scan_files
 from novel_tui.db import repository
 from novel_tui.db.models import Book
-from novel_tui.screens.add_book import AddBookModal
 from novel_tui.widgets.book_table import BookTable
 
+if TYPE_CHECKING:
+    from novel_tui.screens.library_search import LibraryHit
+
 
 class ConfirmDeleteModal(ModalScreen[bool]):
     """Confirmation dialog for deleting a book."""
@@ -40,37 +49,118 @@ class ConfirmDeleteModal(ModalScreen[bool]):
 class BookListScreen(Screen):
     """Main book shelf screen."""
 
+    AUTO_FOCUS = "#book-table"
+
     BINDINGS = [
         ("a", "add_book", "添加书籍"),
         ("d", "delete_book", "删除书籍"),
+        ("slash", "library_search", "全库搜索"),
+        ("f", "filter_books", "按书名筛选"),
+        Binding("escape", "clear_filter", "清除筛选", show=False),
         ("q", "quit", "退出"),
     ]
 
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._filter: str = ""  # title prefix
+
     def compose(self) -> ComposeResult:
         yield Header()
+        yield Input(placeholder="输入书名开头筛选，Enter 返回列表，Esc 清除", id="book-filter")
         yield BookTable(id="book-table")
         yield Label("书架为空，按 [bold]a[/bold] 添加书籍", id="empty-label")
         yield Footer()
 
     def on_mount(self) -> None:
         self._refresh_books()
+        self.call_after_refresh(self._after_first_paint)
+
+    def _after_first_paint(self) -> None:
+        self.app.startup.mark("first paint")
+        # Only once the shelf is on screen
+        self._scan_library()
 
     def on_screen_resume(self) -> None:
-        self._refresh_books()
+        if self.app.progress.idle:
+            self._refresh_books()
+        else:
+            # Back from reading: show the shelf once its position is written
+            self._refresh_after_save()
 
-    def _refresh_books(self) -> None:
-        books = repository.get_all_books()
+    @work(thread=True, exclusive=True, group="shelf-refresh")
+    def _refresh_after_save(self) -> None:
+        self.app.progress.flush(timeout=5.0)
+        self.app.call_from_thread(self._refresh_books)
+
+    def _refresh_books(self, *, reset: bool = False) -> None:
+        """Reload the visible rows; the filter's query only counts matches."""
+        count = repository.count_books(self._filter)
         table = self.query_one("#book-table", BookTable)
         empty_label = self.query_one("#empty-label", Label)
-        table.load_books(books)
-        if books:
-            table.display = True
-            empty_label.display = False
-        else:
-            table.display = False
-            empty_label.display = True
+        table.load(count, partial(repository.get_books, title_prefix=self._filter), reset=reset)
+        # An empty filter result still shows the (empty) table
+        empty = count == 0 and not self._filter
+        table.display = not empty
+        empty_label.display = empty
+
+    @work(thread=True, exclusive=True, group="integrity-scan")
+    def _scan_library(self) -> None:
+        """Mark the books whose file went missing or changed since it was added."""
+        worker = get_current_worker()
+        entries = repository.get_file_stats()
+        unknown = {book_id for book_id, _, _, mtime in entries if not mtime}
+        problems = 0
+
+        def on_batch(checks: list[FileCheck]) -> None:
+            nonlocal problems
+            statuses = {c.book_id: c.status for c in checks if c.status is not FileStatus.OK}
+            # Books added before mtimes were kept get theirs from this scan
+            mtimes = {
+                c.book_id: c.mtime
+                for c in checks
+                if c.status is FileStatus.OK and c.book_id in unknown
+            }
+            if mtimes:
+                repository.set_file_mtimes(mtimes)
+            if statuses and not worker.is_cancelled:
+                problems += len(statuses)
+                self.app.call_from_thread(self._mark_files, statuses)
+
+        scan_files(entries, on_batch, is_cancelled=lambda: worker.is_cancelled)
+        if problems and not worker.is_cancelled:
+            self.app.call_from_thread(
+                self.notify, f"{problems} 本书的文件已丢失或改动", severity="warning"
+            )
+
+    def _mark_files(self, statuses: dict[int, FileStatus]) -> None:
+        self.query_one("#book-table", BookTable).set_file_status(statuses)
+
+    def action_filter_books(self) -> None:
+        filter_input = self.query_one("#book-filter", Input)
+        filter_input.add_class("visible")
+        filter_input.focus()
+
+    def action_clear_filter(self) -> None:
+        filter_input = self.query_one("#book-filter", Input)
+        if not filter_input.has_class("visible"):
+            return
+        filter_input.remove_class("visible")
+        filter_input.value = ""
+        self.query_one("#book-table", BookTable).focus()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != "book-filter":
+            return
+        self._filter = event.value.strip()
+        self._refresh_books(reset=True)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "book-filter":
+            self.query_one("#book-table", BookTable).focus()
 
     def action_add_book(self) -> None:
+        from novel_tui.screens.add_book import AddBookModal
+
         def on_dismiss(result: Book | None) -> None:
             if result is not None:
                 self.notify(f"已添加《{result.title}》({result.chapter_count} 章)")
@@ -93,17 +183,34 @@ class BookListScreen(Screen):
 
         self.app.push_screen(ConfirmDeleteModal(book.title), callback=on_confirm)
 
-    def action_open_book(self) -> None:
-        table = self.query_one("#book-table", BookTable)
-        book = table.get_selected_book()
-        if book is None:
-            self.notify("未找到选中书籍", severity="warning")
-            return
+    def on_book_table_selected(self, event: BookTable.Selected) -> None:
         from novel_tui.screens.reading import ReadingScreen
+        book = event.book
+        status = self.query_one("#book-table", BookTable).file_status(book.id)
+        if status is FileStatus.MISSING:
+            self.notify(f"找不到文件：{book.file_path}", severity="error")
+            return
+        if status is FileStatus.MODIFIED:
+            self.notify(f"《{book.title}》的文件已改动，章节位置可能不准确", severity="warning")
         self.app.push_screen(ReadingScreen(book))
 
-    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-        self.action_open_book()
+    def action_library_search(self) -> None:
+        from novel_tui.screens.library_search import LibrarySearchScreen
+
+        def on_dismiss(hit: LibraryHit | None) -> None:
+            if hit is None:
+                return
+            from novel_tui.screens.reading import ReadingScreen
+            self.app.push_screen(
+                ReadingScreen(
+                    hit.book,
+                    start_chapter=hit.result.chapter_idx,
+                    start_offset=hit.result.char_offset,
+                    highlight=hit.query,
+                )
+            )
+
+        self.app.push_screen(LibrarySearchScreen(), callback=on_dismiss)
 
     def action_quit(self) -> None:
         self.app.exit()
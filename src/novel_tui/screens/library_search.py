@@ -0,0 +1,138 @@
+"""Library-wide search modal screen."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, Label, OptionList
+from textual.widgets.option_list import Option
+from textual.worker import Worker, get_current_worker
+
+from novel_tui.core.library_search import BookHits, LibrarySearcher
+from novel_tui.core.search import SearchResult
+from novel_tui.db import repository
+from novel_tui.db.models import Book, ChapterTable
+
+
+@dataclass
+class LibraryHit:
+    """The search hit chosen by the user."""
+
+    book: Book
+    result: SearchResult
+    query: str
+
+
+class LibrarySearchScreen(ModalScreen[LibraryHit | None]):
+    """Modal for searching every book in the library."""
+
+    BINDINGS = [("escape", "cancel", "取消")]
+
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._hits: dict[str, tuple[Book, SearchResult]] = {}
+        self._query: str = ""
+        self._matched_books: int = 0
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="library-search-container"):
+            yield Label("全库搜索", id="library-search-title")
+            yield Input(placeholder="输入关键词, Enter 搜索", id="library-search-input")
+            yield Label("", id="library-search-status")
+            yield OptionList(id="library-search-results")
+
+    def on_mount(self) -> None:
+        self.query_one("#library-search-input", Input).focus()
+
+    def action_cancel(self) -> None:
+        self.workers.cancel_group(self, "library-search")
+        self.dismiss(None)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id != "library-search-input":
+            return
+        event.stop()
+        query = event.value.strip()
+        if not query:
+            return
+        self._query = query
+        self._hits.clear()
+        self._matched_books = 0
+        self.query_one("#library-search-results", OptionList).clear_options()
+        self._set_status("正在搜索...")
+        normalize = repository.get_settings().normalize_search
+        self._run_search(query, repository.get_all_books(), normalize)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        hit = self._hits.get(event.option_id or "")
+        if hit is None:
+            return
+        self.workers.cancel_group(self, "library-search")
+        book, result = hit
+        self.dismiss(LibraryHit(book, result, self._query))
+
+    @work(thread=True, exclusive=True, group="library-search")
+    def _run_search(self, query: str, books: list[Book], normalize: bool) -> None:
+        worker = get_current_worker()
+
+        def load_chapters(book: Book) -> ChapterTable:
+            return repository.get_chapters(book.id)
+
+        def on_book(hits: BookHits) -> None:
+            self.app.call_from_thread(self._add_book_hits, worker, query, hits)
+
+        searcher = LibrarySearcher(books, load_chapters)
+        matched = searcher.search(
+            query, on_book, normalize=normalize, is_cancelled=lambda: worker.is_cancelled
+        )
+        if not worker.is_cancelled:
+            self.app.call_from_thread(
+                self._on_search_done, worker, query, matched, len(books)
+            )
+
+    def _is_stale(self, worker: Worker, query: str) -> bool:
+        """Whether a callback comes from a search that was superseded meanwhile."""
+        return worker.is_cancelled or query != self._query
+
+    def _add_book_hits(self, worker: Worker, query: str, hits: BookHits) -> None:
+        if self._is_stale(worker, query):
+            return
+        options = self.query_one("#library-search-results", OptionList)
+        book = hits.book
+        more = "+" if hits.truncated else ""
+        options.add_option(
+            Option(
+                Text.assemble((f"《{book.title}》", "bold"), f" {len(hits.results)}{more} 处"),
+                disabled=True,
+            )
+        )
+        for n, result in enumerate(hits.results):
+            option_id = f"{book.id}:{n}"
+            self._hits[option_id] = (book, result)
+            options.add_option(
+                Option(
+                    Text.assemble(
+                        "  ", (result.chapter_title, "dim"), "  ", result.context
+                    ),
+                    id=option_id,
+                )
+            )
+        self._matched_books += 1
+        self._set_status(f"正在搜索... 已在 {self._matched_books} 本书中找到")
+
+    def _on_search_done(self, worker: Worker, query: str, matched: int, total: int) -> None:
+        if self._is_stale(worker, query):
+            return
+        if matched:
+            self._set_status(f"共 {total} 本书，{matched} 本包含匹配")
+            self.query_one("#library-search-results", OptionList).focus()
+        else:
+            self._set_status("无结果")
+
+    def _set_status(self, text: str) -> None:
+        self.query_one("#library-search-status", Label).update(text)
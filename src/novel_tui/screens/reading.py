@@ -2,23 +2,53 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import replace
+from itertools import chain
+
 from textual.app import ComposeResult
-from textual.containers import Horizontal, Vertical
+from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen, Screen
 from textual.timer import Timer
-from textual.widgets import Button, Footer, Input, Label
+from textual.widgets import Button, Checkbox, Footer, Input, Label
 from textual import work
+from textual.worker import Worker, get_current_worker
 
+from novel_tui.core.layout import LayoutIndex
+from novel_tui.core.pages import PageGeometry, PageTable, page_source, paginate
+from novel_tui.core.paragraphs import ParagraphStore
 from novel_tui.core.reader import BookReader
-from novel_tui.core.search import BookSearcher, SearchResult
+from novel_tui.core.search import (
+    BookSearcher,
+    FoldCache,
+    SearchCache,
+    SearchKey,
+    SearchResult,
+    dump_results,
+    load_results,
+)
+from novel_tui.core.wrap import wrap
 from novel_tui.db import repository
-from novel_tui.db.models import Book, Chapter, UserSettings
+from novel_tui.db.models import Book, ChapterTable, UserSettings
 from novel_tui.widgets.chapter_sidebar import ChapterSidebar
 from novel_tui.widgets.content_view import ContentView
 from novel_tui.widgets.search_bar import SearchBar
 from novel_tui.widgets.status_bar import StatusBar
 
 
+# Minimum seconds between running hit-count updates from a search
+_PROGRESS_INTERVAL = 0.1
+
+# Paginated mode: seconds the page geometry must hold still before the book
+# is paginated for it, and between batches of newly paginated chapters
+_PAGE_TABLE_DELAY = 0.5
+_PAGE_BATCH_INTERVAL = 0.5
+
+# Seconds between progress saves while reading (also saved on every
+# chapter change and on leaving)
+_SAVE_INTERVAL = 5
+
+
 class SettingsModal(ModalScreen[UserSettings | None]):
     """Settings modal for reading preferences."""
 
@@ -30,19 +60,68 @@ class SettingsModal(ModalScreen[UserSettings | None]):
 
     def compose(self) -> ComposeResult:
         with Vertical(id="settings-container"):
-            yield Label("阅读设置")
-            yield Label("段落间距 (0/1/2):")
-            yield Input(
-                value=str(self._settings.line_spacing),
-                id="line-spacing-input",
-                type="integer",
-            )
-            yield Label("每行最大字符数:")
-            yield Input(
-                value=str(self._settings.max_width),
-                id="max-width-input",
-                type="integer",
-            )
+            yield Label("阅读设置", id="settings-title")
+            # The fields scroll; the buttons stay in view on small terminals
+            with VerticalScroll(id="settings-fields"):
+                yield Label("段落间距 (0/1/2):")
+                yield Input(
+                    value=str(self._settings.line_spacing),
+                    id="line-spacing-input",
+                    type="integer",
+                )
+                yield Label("每行最大宽度 (终端列数, 汉字占 2 列):")
+                yield Input(
+                    value=str(self._settings.max_width),
+                    id="max-width-input",
+                    type="integer",
+                )
+                yield Checkbox(
+                    "实时搜索 (输入时自动搜索)",
+                    value=self._settings.live_search,
+                    id="live-search-input",
+                )
+                yield Checkbox(
+                    "搜索忽略繁简与全半角",
+                    value=self._settings.normalize_search,
+                    id="normalize-search-input",
+                )
+                yield Checkbox(
+                    "连续阅读 (滚动跨越章节)",
+                    value=self._settings.continuous_scroll,
+                    id="continuous-scroll-input",
+                )
+                yield Checkbox(
+                    "翻页模式 (整页翻动, 显示页码)",
+                    value=self._settings.paginated,
+                    id="paginated-input",
+                )
+                yield Label("自动滚动速度 (字/秒, 按行计速时为行/秒):")
+                yield Input(
+                    value=str(self._settings.auto_scroll_speed),
+                    id="auto-scroll-speed-input",
+                    type="integer",
+                )
+                yield Checkbox(
+                    "自动滚动按行计速",
+                    value=self._settings.auto_scroll_by_rows,
+                    id="auto-scroll-by-rows-input",
+                )
+                yield Checkbox(
+                    "低带宽模式 (远程 SSH 阅读时减少刷新数据量)",
+                    value=self._settings.low_bandwidth,
+                    id="low-bandwidth-input",
+                )
+                yield Label("滚动刷新上限 (帧/秒):")
+                yield Input(
+                    value=str(self._settings.scroll_fps),
+                    id="scroll-fps-input",
+                    type="integer",
+                )
+                yield Checkbox(
+                    "滚轮加速 (快速滚动时一次滚动多行)",
+                    value=self._settings.wheel_acceleration,
+                    id="wheel-acceleration-input",
+                )
             with Horizontal(id="settings-btn-row"):
                 yield Button("保存", variant="primary", id="btn-save-settings")
                 yield Button("取消", id="btn-cancel-settings")
@@ -52,9 +131,33 @@ class SettingsModal(ModalScreen[UserSettings | None]):
             try:
                 spacing = int(self.query_one("#line-spacing-input", Input).value)
                 width = int(self.query_one("#max-width-input", Input).value)
+                fps = int(self.query_one("#scroll-fps-input", Input).value)
+                speed = int(self.query_one("#auto-scroll-speed-input", Input).value)
                 spacing = max(0, min(2, spacing))
                 width = max(40, min(200, width))
-                settings = UserSettings(line_spacing=spacing, max_width=width)
+                fps = max(10, min(240, fps))
+                speed = max(1, min(200, speed))
+                live = self.query_one("#live-search-input", Checkbox).value
+                normalize = self.query_one("#normalize-search-input", Checkbox).value
+                continuous = self.query_one("#continuous-scroll-input", Checkbox).value
+                acceleration = self.query_one("#wheel-acceleration-input", Checkbox).value
+                paginated = self.query_one("#paginated-input", Checkbox).value
+                by_rows = self.query_one("#auto-scroll-by-rows-input", Checkbox).value
+                low_bandwidth = self.query_one("#low-bandwidth-input", Checkbox).value
+                settings = replace(
+                    self._settings,
+                    line_spacing=spacing,
+                    max_width=width,
+                    live_search=live,
+                    normalize_search=normalize,
+                    continuous_scroll=continuous,
+                    scroll_fps=fps,
+                    wheel_acceleration=acceleration,
+                    paginated=paginated,
+                    auto_scroll_speed=speed,
+                    auto_scroll_by_rows=by_rows,
+                    low_bandwidth=low_bandwidth,
+                )
                 repository.save_settings(settings)
                 self.dismiss(settings)
             except ValueError:
@@ -76,22 +179,54 @@ class ReadingScreen(Screen):
         ("right", "next_chapter", "下一章"),
         ("t", "toggle_sidebar", "目录"),
         ("slash", "open_search", "搜索"),
+        ("f", "open_find", "查找"),
         ("n", "next_result", "下一个"),
         ("shift+n", "prev_result", "上一个"),
         ("s", "open_settings", "设置"),
     ]
 
-    def __init__(self, book: Book, **kwargs: object) -> None:
+    def __init__(
+        self,
+        book: Book,
+        *,
+        start_chapter: int | None = None,
+        start_offset: int = 0,
+        highlight: str = "",
+        **kwargs: object,
+    ) -> None:
         super().__init__(**kwargs)
         self._book_id: int = book.id  # type: ignore[assignment]
         self._book: Book = book
-        self._chapters: list[Chapter] = []
+        self._chapters = ChapterTable(self._book_id)
         self._current_chapter_idx: int = 0
         self._reader: BookReader | None = None
         self._settings = UserSettings()
         self._search_results: list[SearchResult] = []
         self._search_idx: int = 0
+        # Restored results: parked just before _search_idx, which n moves
+        # onto and N moves one back from
+        self._search_parked: bool = False
+        self._search_query: str = ""
+        # Query of the full-text search running now; callbacks of any other
+        # are stale
+        self._search_pending: str = ""
+        self._search_normalize: bool = False
+        self._search_cache = SearchCache()
+        self._fold_cache = FoldCache()
+        # Find mode: jump match-by-match without building the full result list
+        self._find_query: str = ""
+        self._find_cursor: tuple[int, int] | None = None  # (chapter_idx, char_offset)
         self._save_timer: Timer | None = None
+        # Kept for saving the position on unmount, when queries find nothing
+        self._content: ContentView | None = None
+        # Where to open instead of the saved progress (e.g. a library search hit)
+        self._start_chapter = start_chapter
+        self._start_offset = start_offset
+        self._highlight = highlight
+        # Paginated mode: the page on screen and the book's page table
+        self._page: tuple[int, int] | None = None  # (chapter_idx, page)
+        self._page_table: PageTable | None = None
+        self._page_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield ChapterSidebar(id="chapter-sidebar")
@@ -113,26 +248,111 @@ class ReadingScreen(Screen):
 
         # Apply format settings
         content = self.query_one("#content-view", ContentView)
+        self._content = content
         content.set_format(self._settings.max_width, self._settings.line_spacing)
+        content.set_scroll_options(
+            self._settings.scroll_fps, self._settings.wheel_acceleration
+        )
+        content.set_paginated(self._settings.paginated)
+        content.set_auto_scroll_speed(
+            self._settings.auto_scroll_speed, self._settings.auto_scroll_by_rows
+        )
+        self._apply_low_bandwidth()
+        self.query_one("#search-bar", SearchBar).live = self._settings.live_search
 
         # Restore saved position — load content first (fast)
         self._current_chapter_idx = self._book.read_chapter_idx
+        if self._start_chapter is not None:
+            self._current_chapter_idx = self._start_chapter
         if self._current_chapter_idx >= len(self._chapters):
             self._current_chapter_idx = 0
         self._load_chapter(self._current_chapter_idx)
+        self._apply_continuous_scroll()
+        self._restore_last_search()
+        if self._start_chapter is not None:
+            content.scroll_to_char_offset(self._start_offset)
+        elif self._book.read_chapter_idx == self._current_chapter_idx:
+            # Only the screen at the saved paragraph gets laid out
+            content.scroll_to_char_offset(self._book.read_position)
+        if self._highlight:
+            content.set_search_highlight(
+                self._highlight, normalize=self._settings.normalize_search
+            )
 
         # Build sidebar after first paint so it doesn't block reading
         self.set_timer(0.1, self._deferred_load_sidebar)
+        self.call_after_refresh(self.app.startup.mark, "first paint")
+
+        # Auto-save timer; saving only queues a write, and an unchanged
+        # position is not written at all
+        self._save_timer = self.set_interval(_SAVE_INTERVAL, self._save_progress)
 
-        # Auto-save timer (30 seconds)
-        self._save_timer = self.set_interval(30, self._save_progress)
+    def _apply_low_bandwidth(self) -> None:
+        low = self._settings.low_bandwidth
+        self.query_one("#content-view", ContentView).set_low_bandwidth(low, self.app.output)
+        self._apply_ansi_color()
+        if not low:
+            self.query_one("#status-bar", StatusBar).update_bandwidth(None)
+
+    def _apply_continuous_scroll(self) -> None:
+        content = self.query_one("#content-view", ContentView)
+        if self._settings.continuous_scroll and self._reader is not None:
+            content.set_chapter_loader(self._read_chapter_text, len(self._chapters))
+        else:
+            content.set_chapter_loader(None, len(self._chapters))
+
+    def _read_chapter_text(self, idx: int) -> str:
+        """Chapter loader for continuous mode; called from a worker thread."""
+        assert self._reader is not None
+        return self._reader.read_chapter(self._chapters[idx])
 
     def _deferred_load_sidebar(self) -> None:
         sidebar = self.query_one("#chapter-sidebar", ChapterSidebar)
         sidebar.load_chapters(self._chapters, self._current_chapter_idx)
 
+    def _restore_last_search(self) -> None:
+        """Seed the search cache with the last query so `n` works immediately."""
+        if not self._reader:
+            return
+        payload = repository.get_last_search(self._book_id)
+        loaded = load_results(payload) if payload else None
+        if loaded is None:
+            return
+        key, results = loaded
+        try:
+            if key.identity != self._reader.identity():
+                return
+        except FileNotFoundError:
+            return
+        self._search_cache.put(key, results)
+        self._search_query = key.query
+        self._search_normalize = key.normalize
+        self._search_results = results
+        # Park just before the first hit at or after the current chapter
+        self._search_idx = len(results)
+        for i, r in enumerate(results):
+            if r.chapter_idx >= self._current_chapter_idx:
+                self._search_idx = i
+                break
+        self._search_parked = True
+
+    def _apply_ansi_color(self) -> None:
+        # Pass ANSI colours through untouched, so the view's default colours
+        # cost a few bytes instead of full colour codes on every row.  This
+        # filters all of the app's output, so it is only on while the reader
+        # (or a modal over it) is showing.
+        self.app.ansi_color = True if self._settings.low_bandwidth else None
+
+    def on_screen_resume(self) -> None:
+        self._apply_ansi_color()
+
+    def on_screen_suspend(self) -> None:
+        if not isinstance(self.app.screen, ModalScreen):
+            self.app.ansi_color = None
+
     def on_unmount(self) -> None:
         self._save_progress()
+        self.app.ansi_color = None
         if self._save_timer:
             self._save_timer.stop()
 
@@ -143,35 +363,36 @@ class ReadingScreen(Screen):
         if idx < 0 or idx >= len(self._chapters):
             return
 
-        self._current_chapter_idx = idx
-        chapter = self._chapters[idx]
-
-        try:
-            text = self._reader.read_chapter(chapter)
-        except FileNotFoundError:
-            self.notify("文件不存在，可能已被移动或删除", severity="error")
-            return
-
         content = self.query_one("#content-view", ContentView)
-        content.set_content(text)
-        content.scroll_home(animate=False)
+        # In continuous mode neighbouring chapters are usually loaded already
+        if not content.show_chapter(idx):
+            try:
+                text = self._reader.read_chapter(self._chapters[idx])
+            except FileNotFoundError:
+                self.notify("文件不存在，可能已被移动或删除", severity="error")
+                return
+            content.set_content(text, idx)
         content.focus()
+        self._show_chapter_status(idx)
 
+    def _show_chapter_status(self, idx: int) -> None:
+        """Point the status bar and sidebar at chapter ``idx``."""
+        changed = idx != self._current_chapter_idx
+        self._current_chapter_idx = idx
         # Update status bar
         status = self.query_one("#status-bar", StatusBar)
-        status.update_status(chapter.title, idx, len(self._chapters))
+        status.update_status(self._chapters.title(idx), idx, len(self._chapters))
 
         # Update sidebar
         sidebar = self.query_one("#chapter-sidebar", ChapterSidebar)
         sidebar.highlight_chapter(idx)
+        if changed:
+            self._save_progress()
 
     def _save_progress(self) -> None:
-        """Save current reading position."""
-        repository.update_read_progress(
-            self._book_id,
-            self._current_chapter_idx,
-            0,
-        )
+        """Save current reading position (written behind, see ProgressWriter)."""
+        position = self._content.top_char_offset() if self._content else 0
+        self.app.progress.save(self._book_id, self._current_chapter_idx, position)
 
     def action_go_back(self) -> None:
         search_bar = self.query_one("#search-bar", SearchBar)
@@ -182,7 +403,7 @@ class ReadingScreen(Screen):
             self._search_results = []
             return
         self._save_progress()
-        self.app.pop_screen()
+        self.app.close_book()
 
     def action_prev_chapter(self) -> None:
         if self._current_chapter_idx > 0:
@@ -200,24 +421,43 @@ class ReadingScreen(Screen):
         search_bar = self.query_one("#search-bar", SearchBar)
         search_bar.show()
 
+    def action_open_find(self) -> None:
+        search_bar = self.query_one("#search-bar", SearchBar)
+        search_bar.show(find=True)
+
     def action_open_settings(self) -> None:
         def on_settings(result: UserSettings | None) -> None:
             if result is not None:
                 self._settings = result
                 content = self.query_one("#content-view", ContentView)
                 content.set_format(result.max_width, result.line_spacing)
+                content.set_scroll_options(result.scroll_fps, result.wheel_acceleration)
+                content.set_paginated(result.paginated)
+                content.set_auto_scroll_speed(result.auto_scroll_speed, result.auto_scroll_by_rows)
+                self._apply_low_bandwidth()
+                if not result.paginated:
+                    self._stop_pagination()
+                self.query_one("#search-bar", SearchBar).live = result.live_search
+                self._apply_continuous_scroll()
 
         self.app.push_screen(SettingsModal(self._settings), callback=on_settings)
 
     def action_next_result(self) -> None:
         if not self._search_results:
+            if self._find_query:
+                self._find_step(self._find_query, backward=False)
             return
-        self._search_idx = (self._search_idx + 1) % len(self._search_results)
+        step = 0 if self._search_parked else 1
+        self._search_parked = False
+        self._search_idx = (self._search_idx + step) % len(self._search_results)
         self._navigate_to_result()
 
     def action_prev_result(self) -> None:
         if not self._search_results:
+            if self._find_query:
+                self._find_step(self._find_query, backward=True)
             return
+        self._search_parked = False
         self._search_idx = (self._search_idx - 1) % len(self._search_results)
         self._navigate_to_result()
 
@@ -231,11 +471,134 @@ class ReadingScreen(Screen):
 
         # Scroll to the matching position within the chapter
         content = self.query_one("#content-view", ContentView)
+        content.set_search_highlight(self._search_query, normalize=self._search_normalize)
         content.scroll_to_char_offset(result.char_offset)
 
         search_bar = self.query_one("#search-bar", SearchBar)
         search_bar.update_results(len(self._search_results), self._search_idx + 1)
 
+    def on_content_view_chapter_changed(self, event: ContentView.ChapterChanged) -> None:
+        if event.chapter_idx != self._current_chapter_idx:
+            self._show_chapter_status(event.chapter_idx)
+
+    def on_content_view_layout_progress(self, event: ContentView.LayoutProgress) -> None:
+        self.query_one("#status-bar", StatusBar).update_layout(event.percent)
+
+    def on_content_view_auto_scroll_status(self, event: ContentView.AutoScrollStatus) -> None:
+        status = self.query_one("#status-bar", StatusBar)
+        if not event.running:
+            status.update_auto_scroll(None)
+            return
+        stats = event.stats
+        status.update_auto_scroll(
+            f"{event.speed} {'行' if event.by_rows else '字'}/秒",
+            stats.percentile(95) * 1000 if len(stats) else None,
+            stats.budget * 1000,
+            stats.late_ratio,
+        )
+
+    def on_content_view_bytes_written(self, event: ContentView.BytesWritten) -> None:
+        self.query_one("#status-bar", StatusBar).update_bandwidth(event.count)
+
+    def on_content_view_auto_scroll_reached_end(
+        self, event: ContentView.AutoScrollReachedEnd
+    ) -> None:
+        if event.chapter_idx == self._current_chapter_idx:
+            self.action_next_chapter()
+
+    # ── paginated mode ──
+
+    def on_content_view_page_changed(self, event: ContentView.PageChanged) -> None:
+        self._page = (event.chapter_idx, event.page)
+        table = self._page_table
+        if table is None or table.geometry != event.geometry:
+            # Wait for resizing to settle before paginating the whole book
+            self._stop_pagination()
+            self._page_timer = self.set_timer(
+                _PAGE_TABLE_DELAY, lambda: self._start_pagination(event.geometry)
+            )
+        self._show_page_status()
+
+    def _start_pagination(self, geometry: PageGeometry) -> None:
+        self._page_timer = None
+        if not self._settings.paginated or self._reader is None:
+            return
+        table = PageTable(geometry, len(self._chapters))
+        self._page_table = table
+        self._content.set_page_table(table)
+        self._paginate_book(table, self._current_chapter_idx)
+
+    def _stop_pagination(self) -> None:
+        if self._page_timer is not None:
+            self._page_timer.stop()
+            self._page_timer = None
+        self.workers.cancel_group(self, "pages")
+        self._page_table = None
+        if self._content is not None:
+            self._content.set_page_table(None)
+        if not self._settings.paginated:
+            self._page = None
+            self._show_page_status()
+
+    @work(thread=True, exclusive=True, group="pages")
+    def _paginate_book(self, table: PageTable, current: int) -> None:
+        """Fill in the page table: cached chapters, then the current one, then the rest."""
+        worker = get_current_worker()
+        assert self._reader is not None
+        try:
+            source = page_source(self._reader.identity())
+        except OSError:
+            return
+        cached = repository.get_page_tables(self._book_id, table.geometry, source)
+        if cached:
+            self.app.call_from_thread(self._add_pages, table, cached)
+        width, spacing, height = table.geometry
+        batch = {}
+        last = time.monotonic()
+        for idx in chain([current], range(len(self._chapters))):
+            if worker.is_cancelled:
+                return
+            if idx in cached or idx in batch:
+                continue
+            try:
+                text = self._reader.read_chapter(self._chapters[idx])
+            except OSError:
+                return
+            layout = LayoutIndex(ParagraphStore(text), width, spacing, wrap)
+            batch[idx] = paginate(layout, height)
+            now = time.monotonic()
+            if now - last >= _PAGE_BATCH_INTERVAL:
+                repository.save_page_tables(self._book_id, table.geometry, source, batch)
+                self.app.call_from_thread(self._add_pages, table, batch)
+                batch, last = {}, now
+        if batch and not worker.is_cancelled:
+            repository.save_page_tables(self._book_id, table.geometry, source, batch)
+            self.app.call_from_thread(self._add_pages, table, batch)
+
+    def _add_pages(self, table: PageTable, pages: dict) -> None:
+        if table is not self._page_table:
+            return
+        for idx, starts in pages.items():
+            table.put(idx, starts)
+        self._show_page_status()
+
+    def _show_page_status(self) -> None:
+        status = self.query_one("#status-bar", StatusBar)
+        if self._page is None:
+            status.update_page(None)
+            return
+        chapter_idx, page = self._page
+        table = self._page_table
+        if table is None:
+            status.update_page(page)
+            return
+        status.update_page(
+            page,
+            table.count(chapter_idx),
+            table.book_page(chapter_idx, page),
+            table.total,
+        )
+
     def on_chapter_sidebar_chapter_selected(self, event: ChapterSidebar.ChapterSelected) -> None:
         self._load_chapter(event.chapter_idx)
         # Auto-hide sidebar after selection
@@ -243,34 +606,179 @@ class ReadingScreen(Screen):
         sidebar.toggle()
 
     def on_search_bar_search_requested(self, event: SearchBar.SearchRequested) -> None:
-        self._do_search(event.query)
+        self._find_query = ""
+        self._search_pending = event.query
+        if not event.query:
+            # Live search with the input cleared
+            self.workers.cancel_group(self, "search")
+            self._search_results = []
+            self._search_idx = 0
+            self._search_parked = False
+            self.query_one("#search-bar", SearchBar).update_results(0, 0)
+            self.query_one("#content-view", ContentView).clear_search_highlight()
+            return
+        self._do_search(event.query, live=event.live)
+
+    def on_search_bar_find_requested(self, event: SearchBar.FindRequested) -> None:
+        self._search_results = []
+        self._search_pending = ""
+        self._find_query = event.query
+        self._find_cursor = None
+        self._find_step(event.query, backward=False)
 
     def on_search_bar_search_closed(self, event: SearchBar.SearchClosed) -> None:
+        self.workers.cancel_group(self, "search")
         content = self.query_one("#content-view", ContentView)
         content.clear_search_highlight()
         self._search_results = []
         self._search_idx = 0
+        self._search_parked = False
+        self._search_pending = ""
+        self._find_query = ""
+        self._find_cursor = None
+
+    def _find_step(self, query: str, *, backward: bool) -> None:
+        """Jump to the next/previous match from the find cursor.
+
+        The first step starts at the top of the page (inclusive); later steps
+        continue from the previous hit, like vim's `n`/`N`.
+        """
+        if self._find_cursor is None:
+            content = self.query_one("#content-view", ContentView)
+            chapter_idx, offset = self._current_chapter_idx, content.top_char_offset()
+        else:
+            chapter_idx, offset = self._find_cursor
+            if not backward:
+                offset += 1
+        self._do_find(query, chapter_idx, offset, backward)
+
+    @work(thread=True, exclusive=True, group="find")
+    def _do_find(self, query: str, chapter_idx: int, offset: int, backward: bool) -> None:
+        """Scan lazily from a position until the first match."""
+        if not self._reader:
+            return
+        worker = get_current_worker()
+        searcher = BookSearcher(self._reader, self._chapters, folds=self._fold_cache)
+        result = searcher.find_next(
+            query,
+            chapter_idx,
+            offset,
+            backward=backward,
+            normalize=self._settings.normalize_search,
+        )
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(self._on_find_done, worker, query, result)
 
-    @work(thread=True)
-    def _do_search(self, query: str) -> None:
-        """Perform full-text search in background."""
+    def _on_find_done(
+        self, worker: Worker, query: str, result: SearchResult | None
+    ) -> None:
+        if worker.is_cancelled or query != self._find_query:
+            return  # superseded or closed meanwhile
+        search_bar = self.query_one("#search-bar", SearchBar)
+        content = self.query_one("#content-view", ContentView)
+        if result is None:
+            search_bar.update_find_status("无结果")
+            content.clear_search_highlight()
+            content.focus()
+            return
+
+        self._find_cursor = (result.chapter_idx, result.char_offset)
+        if result.chapter_idx != self._current_chapter_idx:
+            self._load_chapter(result.chapter_idx)
+        content.set_search_highlight(query, normalize=self._settings.normalize_search)
+        content.scroll_to_char_offset(result.char_offset)
+        search_bar.update_find_status(result.chapter_title[:12])
+        content.focus()
+
+    @work(thread=True, exclusive=True, group="search")
+    def _do_search(self, query: str, live: bool = False) -> None:
+        """Perform full-text search in background.
+
+        Exclusive: starting a new search cancels the previous one, which
+        stops at its next chapter boundary.  The current chapter is scanned
+        first so its highlights show up before the rest of the book is done.
+        """
         if not self._reader:
             return
-        searcher = BookSearcher(self._reader, self._chapters)
-        results = searcher.search(query)
-        self.app.call_from_thread(self._on_search_done, query, results)
+        worker = get_current_worker()
+        found = 0
+        last_report: float | None = None
+
+        def on_progress(hits: list[SearchResult]) -> None:
+            nonlocal found, last_report
+            found += len(hits)
+            now = time.monotonic()
+            if last_report is not None and now - last_report < _PROGRESS_INTERVAL:
+                return
+            if not worker.is_cancelled:
+                self.app.call_from_thread(
+                    self._on_search_progress, worker, query, found, last_report is None
+                )
+            last_report = now
+
+        normalize = self._settings.normalize_search
+        searcher = BookSearcher(
+            self._reader, self._chapters, self._search_cache, self._fold_cache
+        )
+        results = searcher.search(
+            query,
+            normalize=normalize,
+            start_chapter=self._current_chapter_idx,
+            on_progress=on_progress,
+            is_cancelled=lambda: worker.is_cancelled,
+        )
+        if worker.is_cancelled:
+            return
+        try:
+            key = SearchKey(query, False, normalize, self._reader.identity())
+            payload = dump_results(key, results)
+        except FileNotFoundError:
+            payload = None
+        self.app.call_from_thread(
+            self._on_search_done, worker, query, results, payload, live
+        )
+
+    def _is_stale_search(self, worker: Worker, query: str) -> bool:
+        return worker.is_cancelled or query != self._search_pending
+
+    def _on_search_progress(
+        self, worker: Worker, query: str, found: int, first: bool
+    ) -> None:
+        """Show the running hit count; highlight as soon as the first chapter is in."""
+        if self._is_stale_search(worker, query):
+            return  # superseded, cleared or closed meanwhile
+        self.query_one("#search-bar", SearchBar).update_running_count(found)
+        if first:
+            self.query_one("#content-view", ContentView).set_search_highlight(
+                query, normalize=self._settings.normalize_search
+            )
 
-    def _on_search_done(self, query: str, results: list[SearchResult]) -> None:
+    def _on_search_done(
+        self,
+        worker: Worker,
+        query: str,
+        results: list[SearchResult],
+        payload: str | None,
+        live: bool = False,
+    ) -> None:
         """Handle search results."""
+        if self._is_stale_search(worker, query):
+            return
+        self._search_query = query
+        self._search_normalize = self._settings.normalize_search
         self._search_results = results
         self._search_idx = 0
+        self._search_parked = False
+        # With too many results to keep, the previous query is dropped
+        repository.save_last_search(self._book_id, payload)
 
         search_bar = self.query_one("#search-bar", SearchBar)
         content = self.query_one("#content-view", ContentView)
 
         if results:
             search_bar.update_results(len(results), 1)
-            content.set_search_highlight(query)
+            content.set_search_highlight(query, normalize=self._search_normalize)
             # Navigate to first result in or after current chapter
             for i, r in enumerate(results):
                 if r.chapter_idx >= self._current_chapter_idx:
@@ -281,5 +789,6 @@ class ReadingScreen(Screen):
             search_bar.update_results(0, 0)
             content.clear_search_highlight()
 
-        # Move focus back to content so n/N keys work
-        content.focus()
+        # Move focus back to content so n/N keys work, unless still typing
+        if not live:
+            content.focus()
@@ -1,45 +1,258 @@
-"""Book list DataTable widget."""
+"""Book list table widget."""
 
 from __future__ import annotations
 
-from textual.widgets import DataTable
+from collections.abc import Callable
 
+from rich.style import Style
+from rich.text import Text
+from textual.binding import Binding
+from textual.cache import LRUCache
+from textual.events import Click
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from novel_tui.core.integrity import FileStatus
 from novel_tui.db.models import Book
 
+# Returns up to ``limit`` books from ``offset`` on, in display order
+BookFetcher = Callable[[int, int], list[Book]]
+
+# Rows fetched per query, and fetched blocks kept around
+_BLOCK_ROWS = 64
+_CACHED_BLOCKS = 16
+
+# (heading, width in cells); the title takes whatever is left
+_COLUMNS = (("书名", 0), ("章节数", 8), ("字数", 8), ("进度", 16), ("添加时间", 12), ("上次阅读", 18))
+_TITLE_MIN_WIDTH = 12
+
+# Title prefix, and component class, of books whose file is not as added
+_STATUS_MARKS = {
+    FileStatus.MISSING: ("✗ ", "book-table--missing"),
+    FileStatus.MODIFIED: ("! ", "book-table--changed"),
+    FileStatus.APPENDED: ("+ ", "book-table--changed"),
+}
+
+
+class BookTable(ScrollView, can_focus=True):
+    """The library as a table, fetching only the rows on screen.
+
+    Books come from a :data:`BookFetcher` in blocks as they scroll into
+    view, so the shelf opens as fast with 20,000 books as with 20.  The
+    first line is a fixed header.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "上移", show=False),
+        Binding("down", "cursor_down", "下移", show=False),
+        Binding("pageup", "page_up", "上翻页", show=False),
+        Binding("pagedown", "page_down", "下翻页", show=False),
+        Binding("home", "first", "顶部", show=False),
+        Binding("end", "last", "底部", show=False),
+        Binding("enter", "select", "打开", show=False),
+    ]
+
+    COMPONENT_CLASSES = {
+        "book-table--header",
+        "book-table--cursor",
+        "book-table--even-row",
+        "book-table--missing",
+        "book-table--changed",
+    }
 
-class BookTable(DataTable):
-    """DataTable displaying the book library."""
+    class Selected(Message):
+        """Posted when a book is chosen with Enter or a second click."""
+
+        def __init__(self, book: Book) -> None:
+            super().__init__()
+            self.book = book
 
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
-        self.cursor_type = "row"
-        self.zebra_stripes = True
-        self._books: list[Book] = []
-
-    def on_mount(self) -> None:
-        self.add_columns("书名", "章节数", "字数", "进度", "添加时间", "上次阅读")
-
-    def load_books(self, books: list[Book]) -> None:
-        """Refresh the table with the given book list."""
-        self._books = books
-        self.clear()
-        for book in books:
-            word_str = self._format_count(book.word_count)
-            progress = self._format_progress(book)
-            added = book.added_at.strftime("%Y-%m-%d")
-            last_read = book.last_read_at.strftime("%Y-%m-%d %H:%M") if book.last_read_at else "—"
-            self.add_row(book.title, str(book.chapter_count), word_str, progress, added, last_read, key=str(book.id))
+        self._count: int = 0
+        self._fetch: BookFetcher | None = None
+        self._blocks: LRUCache[int, list[Book]] = LRUCache(_CACHED_BLOCKS)
+        self._cursor: int = 0
+        self._file_status: dict[int, FileStatus] = {}
+
+    @property
+    def row_count(self) -> int:
+        return self._count
+
+    @property
+    def cursor_row(self) -> int:
+        return self._cursor
+
+    def load(self, count: int, fetch: BookFetcher, *, reset: bool = False) -> None:
+        """Show ``count`` books from ``fetch``.
+
+        Only the rows on screen are fetched again, and only those that now
+        show a different book (or different details) are repainted; ``reset``
+        moves the cursor back to the top.
+        """
+        before = [self._row_state(row) for row in self._visible_rows()]
+        self._blocks.clear()
+        self._fetch = fetch
+        if count != self._count:
+            self._count = count
+            self.virtual_size = Size(0, count + 1)
+        if reset:
+            self._cursor = 0
+            self.scroll_to(y=0, animate=False, immediate=True)
+        self._cursor = max(min(self._cursor, count - 1), 0)
+        for y, row in enumerate(self._visible_rows(), 1):
+            if y > len(before) or self._row_state(row) != before[y - 1]:
+                self.refresh(Region(0, y, self.size.width, 1))
+        self._scroll_to_cursor()
 
     def get_selected_book(self) -> Book | None:
         """Get the currently selected book."""
-        if not self._books or self.row_count == 0:
+        return self._book(self._cursor)
+
+    def file_status(self, book_id: int | None) -> FileStatus:
+        return self._file_status.get(book_id, FileStatus.OK)
+
+    def set_file_status(self, statuses: dict[int, FileStatus]) -> None:
+        """Mark books whose file is missing or changed; repaints only those."""
+        changed = {
+            book_id
+            for book_id, status in statuses.items()
+            if self.file_status(book_id) is not status
+        }
+        for book_id in changed:
+            if statuses[book_id] is FileStatus.OK:
+                del self._file_status[book_id]
+            else:
+                self._file_status[book_id] = statuses[book_id]
+        for y, row in enumerate(self._visible_rows(), 1):
+            book = self._book(row)
+            if book is not None and book.id in changed:
+                self.refresh(Region(0, y, self.size.width, 1))
+
+    # ── rows ──
+
+    def _visible_rows(self) -> range:
+        top = round(self.scroll_y)
+        return range(top, min(top + max(self.size.height - 1, 0), self._count))
+
+    def _book(self, row: int) -> Book | None:
+        if not 0 <= row < self._count or self._fetch is None:
             return None
-        row_key, _ = self.coordinate_to_cell_key(self.cursor_coordinate)
-        key_value = row_key.value if hasattr(row_key, "value") else str(row_key)
-        for book in self._books:
-            if str(book.id) == key_value:
-                return book
-        return None
+        block_no, pos = divmod(row, _BLOCK_ROWS)
+        block = self._blocks.get(block_no)
+        if block is None:
+            block = self._fetch(block_no * _BLOCK_ROWS, _BLOCK_ROWS)
+            self._blocks[block_no] = block
+        return block[pos] if pos < len(block) else None
+
+    def _row_state(self, row: int) -> tuple[Book | None, bool]:
+        return self._book(row), row == self._cursor
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        if y == 0:
+            style = self.get_component_rich_style("book-table--header")
+            return self._render_cells([name for name, _ in _COLUMNS], width, style)
+        row = round(self.scroll_y) + y - 1
+        book = self._book(row)
+        if book is None:
+            return Strip.blank(width, self.rich_style)
+        if row == self._cursor:
+            style = self.get_component_rich_style("book-table--cursor")
+        elif row % 2:
+            style = self.get_component_rich_style("book-table--even-row")
+        else:
+            style = self.rich_style
+        title = Text(book.title, no_wrap=True)
+        mark = _STATUS_MARKS.get(self.file_status(book.id))
+        if mark is not None:
+            prefix, component = mark
+            title = Text(prefix + book.title, no_wrap=True)
+            title.stylize(self.get_component_rich_style(component, partial=True))
+        cells = [
+            title,
+            str(book.chapter_count),
+            self._format_count(book.word_count),
+            self._format_progress(book),
+            book.added_at.strftime("%Y-%m-%d"),
+            book.last_read_at.strftime("%Y-%m-%d %H:%M") if book.last_read_at else "—",
+        ]
+        return self._render_cells(cells, width, style)
+
+    def _render_cells(self, cells: list[str | Text], width: int, style: Style) -> Strip:
+        fixed = sum(w + 1 for _, w in _COLUMNS[1:])
+        widths = [max(width - fixed - 1, _TITLE_MIN_WIDTH)] + [w for _, w in _COLUMNS[1:]]
+        text = Text(" ", style=style, no_wrap=True)
+        for cell, cell_width in zip(cells, widths):
+            part = Text(cell, no_wrap=True) if isinstance(cell, str) else cell
+            part.truncate(cell_width, overflow="ellipsis", pad=True)
+            text.append_text(part)
+            text.append(" ")
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(0, width, style)
+
+    # ── cursor ──
+
+    def _move_cursor(self, row: int) -> None:
+        row = max(min(row, self._count - 1), 0)
+        if row == self._cursor:
+            return
+        old, self._cursor = self._cursor, row
+        for r in (old, row):
+            y = r - round(self.scroll_y) + 1
+            if 1 <= y < self.size.height:
+                self.refresh(Region(0, y, self.size.width, 1))
+        self._scroll_to_cursor()
+
+    def _scroll_to_cursor(self) -> None:
+        rows = max(self.size.height - 1, 1)
+        top = round(self.scroll_y)
+        if self._cursor < top:
+            self.scroll_to(y=self._cursor, animate=False, immediate=True)
+        elif self._cursor >= top + rows:
+            self.scroll_to(y=self._cursor - rows + 1, animate=False, immediate=True)
+
+    def _page_rows(self) -> int:
+        return max(self.size.height - 2, 1)
+
+    def action_cursor_up(self) -> None:
+        self._move_cursor(self._cursor - 1)
+
+    def action_cursor_down(self) -> None:
+        self._move_cursor(self._cursor + 1)
+
+    def action_page_up(self) -> None:
+        self._move_cursor(self._cursor - self._page_rows())
+
+    def action_page_down(self) -> None:
+        self._move_cursor(self._cursor + self._page_rows())
+
+    def action_first(self) -> None:
+        self._move_cursor(0)
+
+    def action_last(self) -> None:
+        self._move_cursor(self._count - 1)
+
+    def action_select(self) -> None:
+        book = self.get_selected_book()
+        if book is not None:
+            self.post_message(self.Selected(book))
+
+    def on_click(self, event: Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None or offset.y == 0:
+            return
+        row = round(self.scroll_y) + offset.y - 1
+        if row >= self._count:
+            return
+        if row == self._cursor:
+            self.action_select()
+        else:
+            self._move_cursor(row)
+
+    # ── formatting ──
 
     @staticmethod
     def _format_count(n: int) -> str:
@@ -7,7 +7,7 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Label, ListView, ListItem
 
-from novel_tui.db.models import Chapter
+from novel_tui.db.models import ChapterTable
 
 
 class ChapterSidebar(Widget):
@@ -22,7 +22,7 @@ class ChapterSidebar(Widget):
 
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
-        self._chapters: list[Chapter] = []
+        self._chapters = ChapterTable(0)
         self._current_idx: int = 0
         self._items: list[ListItem] = []
 
@@ -30,23 +30,23 @@ class ChapterSidebar(Widget):
         yield Label("目录", id="sidebar-title")
         yield ListView(id="chapter-list")
 
-    def load_chapters(self, chapters: list[Chapter], current_idx: int = 0) -> None:
+    def load_chapters(self, chapters: ChapterTable, current_idx: int = 0) -> None:
         """Build the list once. Only called on screen mount."""
         self._chapters = chapters
         self._current_idx = current_idx
         list_view = self.query_one("#chapter-list", ListView)
         list_view.clear()
         self._items = []
-        for ch in chapters:
-            prefix = "  " if ch.level == 2 else ""
-            marker = "▶ " if ch.index == current_idx else "  "
-            label_text = f"{marker}{prefix}{ch.title}"
-            item = ListItem(Label(label_text), name=str(ch.index))
-            if ch.level == 1:
+        for idx, level in enumerate(chapters.levels):
+            prefix = "  " if level == 2 else ""
+            marker = "▶ " if idx == current_idx else "  "
+            label_text = f"{marker}{prefix}{chapters.title(idx)}"
+            item = ListItem(Label(label_text), name=str(idx))
+            if level == 1:
                 item.add_class("level-1")
             else:
                 item.add_class("level-2")
-            if ch.index == current_idx:
+            if idx == current_idx:
                 item.add_class("current")
             self._items.append(item)
             list_view.append(item)
@@ -68,10 +68,9 @@ class ChapterSidebar(Widget):
             new.query_one(Label).update(self._make_label(idx, current=True))
 
     def _make_label(self, idx: int, *, current: bool) -> str:
-        ch = self._chapters[idx]
-        prefix = "  " if ch.level == 2 else ""
+        prefix = "  " if self._chapters.levels[idx] == 2 else ""
         marker = "▶ " if current else "  "
-        return f"{marker}{prefix}{ch.title}"
+        return f"{marker}{prefix}{self._chapters.title(idx)}"
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.item.name is not None:
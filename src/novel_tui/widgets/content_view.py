@@ -2,19 +2,96 @@
 
 from __future__ import annotations
 
-import textwrap
+import asyncio
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
 
+from rich.style import Style
 from rich.text import Text
-from textual.events import MouseScrollDown, MouseScrollUp
+from textual import work
+from textual.cache import LRUCache
+from textual.binding import Binding
+from textual.events import Key, MouseScrollDown, MouseScrollUp
+from textual.geometry import Region
+from textual.message import Message
+from textual.strip import Strip
+from textual.timer import Timer
 from textual.widget import Widget
 
+from novel_tui.core.chapter_window import ChapterWindow
+from novel_tui.core.layout import LayoutIndex
+from novel_tui.core.pages import PageGeometry, PageIndex, PageTable
+from novel_tui.core.paragraphs import ParagraphStore
+from novel_tui.core.perf import FrameStats, OutputMeter
+from novel_tui.core.search import find_all, match_form
+from novel_tui.core.wrap import wrap
+
 # Left/right padding (characters)
 _PAD = 4
 _PAD_STR = " " * _PAD
 
+# Layouts kept per chapter, e.g. when resizing back and forth
+_MAX_LAYOUTS = 4
+
+# Rendered rows kept; a few screens' worth on a large terminal
+_STRIP_CACHE_SIZE = 1024
+
+# Blank rows between two chapters in continuous mode
+_CHAPTER_GAP = 3
+
+# Background layout: paragraphs per step, and seconds of work per turn of
+# the event loop
+_LAYOUT_CHUNK = 256
+_LAYOUT_SLICE = 0.008
+
+# Mouse wheel acceleration: ticks closer together than this (seconds) form a
+# burst, and every few ticks of a burst scroll one more line, up to a cap
+_WHEEL_BURST = 0.05
+_WHEEL_RAMP = 4
+_WHEEL_MAX_STEP = 8
+
+# Auto-scroll: speed limits (characters or rows per second) and how often
+# the frame-time summary is posted (seconds)
+_AUTO_MIN_SPEED = 1
+_AUTO_MAX_SPEED = 200
+_AUTO_REPORT_INTERVAL = 1.0
+
+# Marks the end of the rows below the viewport
+_NO_ROW = object()
+
+_HIGHLIGHT_STYLE = Style.parse("black on yellow")
+
+# Returns the text of the chapter with the given index (may run in a thread)
+ChapterLoader = Callable[[int], str]
+
+
+@dataclass
+class _Pane:
+    """One loaded chapter: its paragraphs, layouts, pages and highlight matches."""
+
+    index: int
+    paragraphs: ParagraphStore
+    layouts: dict[tuple[int, int], LayoutIndex] = field(default_factory=dict)
+    pages: dict[PageGeometry, PageIndex] = field(default_factory=dict)
+    highlight_starts: array[int] = field(default_factory=lambda: array("I"))
+    # Match form of the text by normalize flag, kept across highlight queries
+    search_texts: dict[bool, str] = field(default_factory=dict)
+
 
 class ContentView(Widget, can_focus=True):
-    """Custom viewer: scrolls by logical line, wraps by column width."""
+    """Custom viewer: scrolls by logical line, wraps by terminal cell width.
+
+    In continuous mode (see :meth:`set_chapter_loader`) the neighbouring
+    chapters are loaded in the background and scrolling runs on across
+    chapter boundaries.  In paginated mode (see :meth:`set_paginated`) the
+    view shows one page at a time and every scroll flips whole pages.
+    Auto-scroll moves the text up a row at a time (or a page at a time when
+    paginated) at a set reading speed until any key is pressed.
+    """
 
     BINDINGS = [
         ("up", "scroll_up_line", "上滚"),
@@ -23,183 +100,943 @@ class ContentView(Widget, can_focus=True):
         ("pagedown", "page_down", "下翻页"),
         ("home", "scroll_home_action", "顶部"),
         ("end", "scroll_end", "底部"),
+        ("a", "toggle_auto_scroll", "自动滚动"),
+        Binding("plus", "auto_scroll_faster", "加速", show=False),
+        Binding("minus", "auto_scroll_slower", "减速", show=False),
     ]
 
+    class ChapterChanged(Message):
+        """Posted when scrolling brings another chapter under the top line."""
+
+        def __init__(self, chapter_idx: int) -> None:
+            super().__init__()
+            self.chapter_idx = chapter_idx
+
+    class LayoutProgress(Message):
+        """Posted while a large chapter is laid out; ``percent`` is None when done."""
+
+        def __init__(self, percent: int | None) -> None:
+            super().__init__()
+            self.percent = percent
+
+    class AutoScrollStatus(Message):
+        """Posted when auto-scroll starts, stops or changes speed, and
+        periodically while it runs with its frame timings."""
+
+        def __init__(
+            self, running: bool, speed: int, by_rows: bool, stats: FrameStats
+        ) -> None:
+            super().__init__()
+            self.running = running
+            self.speed = speed
+            self.by_rows = by_rows
+            self.stats = stats
+
+    class AutoScrollReachedEnd(Message):
+        """Posted when auto-scroll reaches the end of a chapter with more to come."""
+
+        def __init__(self, chapter_idx: int) -> None:
+            super().__init__()
+            self.chapter_idx = chapter_idx
+
+    class BytesWritten(Message):
+        """Posted in low-bandwidth mode after a scroll with the bytes the
+        frame that repainted it came to on the terminal."""
+
+        def __init__(self, count: int) -> None:
+            super().__init__()
+            self.count = count
+
+    class PageChanged(Message):
+        """Posted in paginated mode when the page or the page geometry changes."""
+
+        def __init__(self, chapter_idx: int, page: int, geometry: PageGeometry) -> None:
+            super().__init__()
+            self.chapter_idx = chapter_idx
+            self.page = page
+            self.geometry = geometry
+
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
         self._max_width: int = 80
         self._line_spacing: int = 1
-        self._lines: list[str] = []  # logical lines (paragraphs)
-        self._line_char_offsets: list[int] = []  # char offset per logical line
-        self._top_line: int = 0
+        # Only the current chapter until continuous mode is turned on
+        self._window: ChapterWindow[_Pane] = ChapterWindow(behind=0, ahead=0)
+        self._chapter: int = 0  # chapter under the top line
+        self._top_line: int = 0  # paragraph of that chapter on the top line
+        self._top_sub: int = 0  # rows of it scrolled off the top (auto-scroll)
+        self._loader: ChapterLoader | None = None
+        self._loading: set[int] = set()
+        self._generation: int = 0  # bumped whenever loaded text goes stale
+        self._strips: LRUCache[tuple, Strip] = LRUCache(_STRIP_CACHE_SIZE)
         self._highlight_query: str = ""
+        self._highlight_normalize: bool = False
+        self._layout_percent: int | None = None
+        # Rows of the viewport as (chapter, paragraph, wrapped row), or None
+        # for blank rows; rebuilt when the top line or the layout changes
+        self._frame: list[tuple[_Pane, int, int] | None] = []
+        self._frame_key: tuple | None = None
+        self._frame_rows: Iterator[tuple[_Pane, int, int] | None] = iter(())
+        # Scroll input is summed here and applied at most once per frame
+        self._pending_scroll: int = 0
+        self._scroll_timer: Timer | None = None
+        self._frame_interval: float = 1 / 60
+        self._last_scroll: float = 0.0
+        self._wheel_acceleration: bool = False
+        self._wheel_streak: int = 0
+        self._wheel_time: float = 0.0
+        self._paginated: bool = False
+        self._page_table: PageTable | None = None
+        self._reported_page: tuple[int, int, PageGeometry] | None = None
+        # Auto-scroll: characters (or rows) per second, and the time owed
+        # to scrolling since the last tick
+        self._auto_speed: int = 10
+        self._auto_by_rows: bool = False
+        self._auto_timer: Timer | None = None
+        self._auto_budget: float = 0.0
+        self._auto_last: float = 0.0
+        self._auto_reported: float = 0.0
+        self._auto_waiting: bool = False  # at the end, next chapter requested
+        self._auto_stats = FrameStats(self._frame_interval)
+        # Low-bandwidth mode: the key of what each row shows on the terminal,
+        # so a scroll only repaints rows that differ
+        self._low_bandwidth: bool = False
+        self._painted: dict[int, tuple] = {}
+        self._meter: OutputMeter | None = None
 
     # ── public API ──
 
-    def set_content(self, text: str) -> None:
-        paragraphs = text.split("\n")
-        self._lines = []
-        self._line_char_offsets = []
-        pos = 0
-        for p in paragraphs:
-            stripped = p.strip()
-            if stripped:
-                self._lines.append(stripped)
-                self._line_char_offsets.append(pos)
-            pos += len(p) + 1  # +1 for \n
-        self._top_line = 0
+    @property
+    def current_chapter(self) -> int:
+        """Index of the chapter under the top line."""
+        return self._chapter
+
+    @property
+    def page_geometry(self) -> PageGeometry:
+        """(wrap width, line spacing, height) that page numbers depend on."""
+        return (self._wrap_width(), self._line_spacing, self.size.height)
+
+    def set_content(self, text: str, chapter_idx: int = 0) -> None:
+        """Show ``text`` as chapter ``chapter_idx``, scrolled to the top."""
+        self._generation += 1
+        self._window.clear()
+        self._loading.clear()
+        self._strips.clear()
+        self._window.count = max(self._window.count, chapter_idx + 1)
+        pane = _Pane(chapter_idx, ParagraphStore(text))
+        self._update_highlight_spans(pane)
+        self._window.put(chapter_idx, pane)
+        self._chapter = chapter_idx
+        self._top_line = self._top_sub = 0
+        self._frame_key = None
+        self._auto_waiting = False
+        self._cancel_scroll()
+        self._fill_window()
+        self.refresh()
+        self._report_page()
+
+    def set_chapter_loader(self, loader: ChapterLoader | None, count: int = 0) -> None:
+        """Turn continuous mode on (with a loader for ``count`` chapters) or off."""
+        self._loader = loader
+        self._window.count = max(count, self._chapter + 1)
+        self._generation += 1
+        self._loading.clear()
+        if loader is None:
+            self._window.behind = self._window.ahead = 0
+        else:
+            self._window.behind, self._window.ahead = 1, 2
+        self._frame_key = None
+        self._fill_window()
         self.refresh()
 
+    def show_chapter(self, chapter_idx: int) -> bool:
+        """Scroll to the top of an already loaded chapter.
+
+        Returns False if the chapter is not in the window, in which case the
+        caller should load it with :meth:`set_content`.
+        """
+        if chapter_idx not in self._window:
+            return False
+        self._set_position(chapter_idx, 0)
+        return True
+
     def set_format(self, max_width: int, line_spacing: int) -> None:
         self._max_width = max_width
         self._line_spacing = line_spacing
         self.refresh()
+        self._report_page()
 
-    def scroll_home(self, animate: bool = False) -> None:
-        self._top_line = 0
+    def set_low_bandwidth(
+        self, low_bandwidth: bool, meter: OutputMeter | None = None
+    ) -> None:
+        """Trade looks for fewer bytes per repaint.
+
+        Rows are written as single style runs in the terminal's default
+        colours, and scrolling repaints only the rows whose content changed.
+        With ``meter`` the size of each such repaint is posted as
+        :class:`BytesWritten`.
+        """
+        self._meter = meter if low_bandwidth else None
+        if low_bandwidth == self._low_bandwidth:
+            return
+        self._low_bandwidth = low_bandwidth
+        self.set_class(low_bandwidth, "-low-bandwidth")
+        self._painted.clear()
+        self._strips.clear()
         self.refresh()
 
-    def set_search_highlight(self, query: str) -> None:
+    @property
+    def auto_scrolling(self) -> bool:
+        return self._auto_timer is not None
+
+    def set_auto_scroll_speed(self, speed: int, by_rows: bool = False) -> None:
+        """Auto-scroll at ``speed`` characters a second, or rows with ``by_rows``."""
+        self._auto_speed = max(_AUTO_MIN_SPEED, min(_AUTO_MAX_SPEED, speed))
+        self._auto_by_rows = by_rows
+        self._report_auto_scroll()
+
+    def start_auto_scroll(self) -> None:
+        if self._auto_timer is not None:
+            return
+        self._cancel_scroll()
+        self._auto_budget = 0.0
+        self._auto_last = self._auto_reported = time.monotonic()
+        self._auto_stats.reset()
+        self._auto_timer = self.set_interval(self._frame_interval, self._auto_scroll_tick)
+        self._report_auto_scroll()
+
+    def stop_auto_scroll(self) -> None:
+        if self._auto_timer is None:
+            return
+        self._auto_timer.stop()
+        self._auto_timer = None
+        self._auto_waiting = False
+        self._report_auto_scroll()
+
+    def set_paginated(self, paginated: bool) -> None:
+        """Switch between page-flip and line-scrolling modes."""
+        if paginated == self._paginated:
+            return
+        self._paginated = paginated
+        self._reported_page = None
+        self._cancel_scroll()
+        self._frame_key = None
+        self.refresh()
+        self._report_page()
+
+    def set_page_table(self, table: PageTable | None) -> None:
+        """Use page starts already computed for the book, where they match."""
+        self._page_table = table
+
+    def set_scroll_options(self, fps: int, wheel_acceleration: bool = False) -> None:
+        """Cap line scrolling at ``fps`` updates a second; optionally speed up
+        the mouse wheel while it is spun quickly."""
+        self._frame_interval = 1 / max(fps, 1)
+        self._wheel_acceleration = wheel_acceleration
+        self._auto_stats = FrameStats(self._frame_interval)
+        if self._auto_timer is not None:
+            self.stop_auto_scroll()
+            self.start_auto_scroll()
+
+    def scroll_home(self, animate: bool = False) -> None:
+        self._set_position(self._chapter, 0)
+
+    def set_search_highlight(self, query: str, *, normalize: bool = False) -> None:
+        if (query, normalize) == (self._highlight_query, self._highlight_normalize):
+            return
         self._highlight_query = query
+        self._highlight_normalize = normalize
+        for idx in self._window.span(self._chapter):
+            pane = self._window.get(idx)
+            if pane is not None:
+                self._update_highlight_spans(pane)
         self.refresh()
 
     def clear_search_highlight(self) -> None:
-        self._highlight_query = ""
-        self.refresh()
+        self.set_search_highlight("")
 
     def scroll_to_char_offset(self, char_offset: int) -> None:
         """Scroll so that the logical line containing char_offset is visible."""
-        target_line = 0
-        for i, off in enumerate(self._line_char_offsets):
-            if off <= char_offset:
-                target_line = i
-            else:
-                break
-        self._top_line = target_line
-        self.refresh()
+        pane = self._pane()
+        if pane is not None:
+            self._set_position(self._chapter, bisect_right(pane.paragraphs.starts, char_offset) - 1)
+
+    def top_char_offset(self) -> int:
+        """Char offset (within the chapter text) of the top visible line."""
+        pane = self._pane()
+        if pane is None or not pane.paragraphs.starts:
+            return 0
+        return pane.paragraphs.starts[self._top_line]
 
     # ── internal ──
 
+    def _pane(self) -> _Pane | None:
+        return self._window.get(self._chapter)
+
+    def _neighbour(self, chapter_idx: int) -> _Pane | None:
+        """A loaded chapter that scrolling may run into, if any."""
+        return self._window.get(chapter_idx) if self._loader is not None else None
+
+    def _update_highlight_spans(self, pane: _Pane) -> None:
+        """Find every match of the highlight query in the chapter, once."""
+        query, normalize = self._highlight_query, self._highlight_normalize
+        if not query:
+            pane.highlight_starts = array("I")
+            return
+        text = pane.paragraphs.text
+        search_text = pane.search_texts.get(normalize)
+        if search_text is None:
+            search_text = pane.search_texts[normalize] = match_form(text, normalize=normalize)
+        pane.highlight_starts = find_all(
+            text, query, normalize=normalize, search_text=search_text
+        )
+
     def _wrap_width(self) -> int:
         avail = self.size.width - _PAD * 2
         if avail <= 0:
             avail = 80
         return min(self._max_width, avail) if self._max_width > 0 else avail
 
-    def _wrap_line(self, line: str, width: int) -> list[str]:
-        return textwrap.wrap(line, width=width) or [""]
+    def _layout(self, pane: _Pane) -> LayoutIndex:
+        """Layout index of a chapter for the current width and spacing.
+
+        Built on first use after a resize or format change, so a burst of
+        resize events costs nothing until the next paint.
+        """
+        key = (self._wrap_width(), self._line_spacing)
+        layout = pane.layouts.get(key)
+        if layout is None:
+            layout = LayoutIndex(pane.paragraphs, key[0], key[1], wrap)
+            pane.layouts[key] = layout
+            while len(pane.layouts) > _MAX_LAYOUTS:
+                pane.layouts.pop(next(iter(pane.layouts)))
+            if pane.index == self._chapter:
+                # Paint what is needed now, lay out the rest behind it
+                self.call_later(self._layout_in_background)
+        return layout
+
+    def _pages(self, pane: _Pane) -> PageIndex:
+        """Page index of a chapter for the current page geometry."""
+        geometry = self.page_geometry
+        pages = pane.pages.get(geometry)
+        if pages is None:
+            table = self._page_table
+            starts = None
+            if table is not None and table.geometry == geometry:
+                starts = table.get(pane.index)
+            pages = PageIndex(self._layout(pane), geometry[2], starts)
+            pane.pages[geometry] = pages
+            while len(pane.pages) > _MAX_LAYOUTS:
+                pane.pages.pop(next(iter(pane.pages)))
+        return pages
+
+    def _report_page(self) -> None:
+        if not self._paginated or (pane := self._pane()) is None:
+            return
+        page = (self._chapter, self._pages(pane).page_of(self._top_line), self.page_geometry)
+        if page != self._reported_page:
+            self._reported_page = page
+            self.post_message(self.PageChanged(*page))
+
+    @work(exclusive=True, group="layout")
+    async def _layout_in_background(self) -> None:
+        """Fill in the current chapter's layout a slice at a time."""
+        while (pane := self._pane()) is not None:
+            layout = self._layout(pane)
+            if layout.complete:
+                break
+            deadline = time.perf_counter() + _LAYOUT_SLICE
+            while not layout.complete and time.perf_counter() < deadline:
+                layout.ensure(layout.laid_out + _LAYOUT_CHUNK)
+            if not layout.complete:
+                self._report_layout(layout.laid_out * 100 // len(layout))
+            # Let input and repaints through between slices
+            await asyncio.sleep(0)
+        self._report_layout(None)
+
+    def _report_layout(self, percent: int | None) -> None:
+        if percent != self._layout_percent:
+            self._layout_percent = percent
+            self.post_message(self.LayoutProgress(percent))
+
+    def _paragraphs_after(self, pane: _Pane, idx: int) -> Iterator[tuple[_Pane, int, int]]:
+        """Paragraphs from ``idx`` on, running into the next loaded chapters.
+
+        Yields (chapter, paragraph, rows) where rows counts the paragraph's
+        text, its spacing and any gap before the next chapter.
+        """
+        while True:
+            layout = self._layout(pane)
+            for i in range(idx, len(pane.paragraphs)):
+                yield pane, i, layout.height(i)
+            nxt = self._neighbour(pane.index + 1)
+            if nxt is None:
+                return
+            if pane.paragraphs:
+                # The gap follows the chapter's last paragraph
+                yield pane, -1, _CHAPTER_GAP
+            pane, idx = nxt, 0
+
+    def _paragraphs_before(self, pane: _Pane, idx: int) -> Iterator[tuple[_Pane, int, int]]:
+        """Like :meth:`_paragraphs_after`, walking backwards from before ``idx``."""
+        while True:
+            layout = self._layout(pane)
+            for i in range(idx - 1, -1, -1):
+                yield pane, i, layout.height(i)
+            prev = self._neighbour(pane.index - 1)
+            if prev is None:
+                return
+            if prev.paragraphs:
+                yield prev, -1, _CHAPTER_GAP
+            pane, idx = prev, len(prev.paragraphs)
+
+    def _rows_after(
+        self, pane: _Pane, idx: int, skip: int = 0, end: int | None = None
+    ) -> Iterator[tuple[_Pane, int, int] | None]:
+        """Viewport rows from paragraph ``idx`` on, less its first ``skip``.
+
+        With ``end`` the rows stop before that paragraph of the same chapter.
+        """
+        for p, i, rows in self._paragraphs_after(pane, idx):
+            if end is not None and (p is not pane or not 0 <= i < end):
+                return
+            entries: list[tuple[_Pane, int, int] | None] = []
+            if i >= 0:
+                text_rows = len(self._layout(p).rows(i))
+                entries.extend((p, i, sub) for sub in range(text_rows))
+                rows -= text_rows
+            entries.extend([None] * rows)
+            yield from entries[skip:]
+            skip = 0
+
+    def _frame_state(self) -> tuple:
+        return (
+            self._chapter,
+            self._top_line,
+            self._top_sub,
+            self._wrap_width(),
+            self._line_spacing,
+            self.size.height,
+            self._paginated,
+        )
+
+    def _viewport(self) -> list[tuple[_Pane, int, int] | None]:
+        """What each row of the viewport shows.
+
+        Built by walking forward from the top paragraph, so it only lays out
+        what is on screen, however deep into the chapter the top line is.  In
+        paginated mode the frame is the page holding the top line, and stops
+        where the next page begins.
+        """
+        pane = self._pane()
+        key = self._frame_state()
+        if key == self._frame_key:
+            return self._frame
+        frame: list[tuple[_Pane, int, int] | None] = []
+        if pane is not None:
+            top, end = self._top_line, None
+            if self._paginated:
+                pages = self._pages(pane)
+                page = pages.page_of(top)
+                top, end = pages.start(page) or 0, pages.end(page)
+            rows = self._rows_after(pane, top, self._top_sub, end)
+            frame = list(islice(rows, self.size.height))
+            # Kept so scrolling by one row only computes the row it exposes
+            self._frame_rows = rows
+        self._frame = frame
+        self._frame_key = key
+        return frame
+
+    def _scroll_row(self) -> bool:
+        """Scroll down by one visual row; False at the end of what is loaded.
+
+        The frame is shifted rather than rebuilt, so only the newly exposed
+        bottom row is laid out and rendered.
+        """
+        pane = self._pane()
+        if pane is None or not pane.paragraphs:
+            return False
+        frame = self._viewport()
+        # Rows of the top paragraph, plus the chapter gap if one follows
+        blocks = self._paragraphs_after(pane, self._top_line)
+        _, _, rows = next(blocks)
+        nxt = next(blocks, None)
+        if nxt is not None and nxt[1] < 0:
+            rows += nxt[2]
+            nxt = next(blocks, None)
+        if self._top_sub + 1 < rows:
+            self._top_sub += 1
+        elif nxt is None:
+            return False
+        else:
+            chapter_idx = nxt[0].index
+            self._top_line, self._top_sub = nxt[1], 0
+            if chapter_idx != self._chapter:
+                self._chapter = chapter_idx
+                self._fill_window()
+                self.post_message(self.ChapterChanged(chapter_idx))
+        if self._frame_key is not None:
+            del frame[:1]
+            row = next(self._frame_rows, _NO_ROW)
+            if row is not _NO_ROW:
+                frame.append(row)
+            self._frame_key = self._frame_state()
+        self._refresh_view()
+        return True
+
+    # ── chapter window ──
+
+    def _fill_window(self) -> None:
+        """Evict chapters behind the reader and start loading the ones ahead."""
+        self._window.evict(self._chapter)
+        if self._loader is None:
+            return
+        for idx in self._window.missing(self._chapter):
+            if idx not in self._loading:
+                self._loading.add(idx)
+                key = (self._wrap_width(), self._line_spacing)
+                self._load_pane(idx, self._loader, self._generation, key)
+
+    @work(thread=True, group="chapter-window")
+    def _load_pane(
+        self, idx: int, loader: ChapterLoader, generation: int, key: tuple[int, int]
+    ) -> None:
+        try:
+            text = loader(idx)
+        except (OSError, IndexError):
+            self.app.call_from_thread(self._load_failed, idx, generation)
+            return
+        pane = _Pane(idx, ParagraphStore(text))
+        # Lay it out here so crossing into it later costs nothing
+        layout = LayoutIndex(pane.paragraphs, key[0], key[1], wrap)
+        layout.ensure(len(layout))
+        pane.layouts[key] = layout
+        self.app.call_from_thread(self._add_pane, pane, generation)
+
+    def _load_failed(self, idx: int, generation: int) -> None:
+        if generation != self._generation:
+            return
+        # Tried again the next time the window moves; auto-scroll waiting
+        # for it gives up at its next tick
+        self._loading.discard(idx)
+
+    def _add_pane(self, pane: _Pane, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._loading.discard(pane.index)
+        if pane.index not in self._window.span(self._chapter) or pane.index in self._window:
+            return
+        self._update_highlight_spans(pane)
+        self._window.put(pane.index, pane)
+        self._frame_key = None
+        self._refresh_view()
 
     # ── rendering ──
 
-    def render(self) -> Text:
-        if not self._lines:
-            return Text("")
+    def render_line(self, y: int) -> Strip:
+        """Render one row of the viewport from the strip cache."""
+        width = self.size.width
+        rich_style = self.rich_style
+        frame = self._viewport()
+        entry = frame[y] if y < len(frame) else None
+        key = self._row_key(entry, width, rich_style)
+        if entry is None:
+            # Spacing, the gap between chapters, or past the end
+            strip = Strip.blank(width, None if self._low_bandwidth else rich_style)
+        elif (strip := self._strips.get(key)) is None:
+            pane, idx, sub = entry
+            layout = self._layout(pane)
+            start = pane.paragraphs.starts[idx] + layout.row_start(idx, sub)
+            strip = self._render_row(pane, layout.rows(idx)[sub], start, width, rich_style)
+            self._strips[key] = strip
+        if self._low_bandwidth:
+            self._painted[y] = key
+        return strip
 
-        height = self.size.height
-        width = self._wrap_width()
-
-        rows: list[str] = []
-        line_idx = self._top_line
-
-        while len(rows) < height and line_idx < len(self._lines):
-            wrapped = self._wrap_line(self._lines[line_idx], width)
-            for vl in wrapped:
-                rows.append(_PAD_STR + vl)
-            # spacing between logical lines
-            if line_idx < len(self._lines) - 1:
-                for _ in range(self._line_spacing):
-                    rows.append("")
-            line_idx += 1
-
-        rows = rows[:height]
-        while len(rows) < height:
-            rows.append("")
-
-        result = Text("\n".join(rows))
-        if self._highlight_query:
-            result.highlight_words(
-                [self._highlight_query], style="black on yellow", case_sensitive=False
-            )
-        return result
+    def _row_key(
+        self, entry: tuple[_Pane, int, int] | None, width: int, rich_style: Style
+    ) -> tuple:
+        """Everything a rendered row depends on; blank rows share one key."""
+        if entry is None:
+            return (width, rich_style)
+        pane, idx, sub = entry
+        return (
+            pane.index,
+            idx,
+            sub,
+            self._layout(pane).width,
+            width,
+            self._highlight_query,
+            self._highlight_normalize,
+            rich_style,
+        )
+
+    def _refresh_view(self) -> None:
+        """Repaint after the view moved.
+
+        In low-bandwidth mode only runs of rows that now show something else
+        are repainted, the nearest Textual gets to a terminal scroll region.
+        """
+        if not self._low_bandwidth or not self._painted:
+            self.refresh()
+            return
+        width, rich_style = self.size.width, self.rich_style
+        frame = self._viewport()
+        changed = [
+            y
+            for y in range(self.size.height)
+            if self._painted.get(y)
+            != self._row_key(frame[y] if y < len(frame) else None, width, rich_style)
+        ]
+        if not changed:
+            return
+        start = prev = changed[0]
+        for y in changed[1:] + [-1]:
+            if y != prev + 1:
+                self.refresh(Region(0, start, width, prev - start + 1))
+                start = y
+            prev = y
+        if self._meter is not None:
+            self._meter.measure_next_frame(self._report_bytes)
+
+    def _report_bytes(self, count: int) -> None:
+        self.post_message(self.BytesWritten(count))
+
+    def _render_row(
+        self, pane: _Pane, row: str, start: int, width: int, rich_style: Style
+    ) -> Strip:
+        """Render a wrapped row that begins at chapter offset ``start``."""
+        text = Text(_PAD_STR + row, no_wrap=True)
+        if not self._low_bandwidth:
+            text.stylize(rich_style)
+        starts = pane.highlight_starts
+        if starts:
+            # Only the matches overlapping this row, found by bisect
+            length = len(self._highlight_query)
+            end = start + len(row)
+            lo = bisect_left(starts, start - length + 1)
+            hi = bisect_left(starts, end, lo)
+            for pos in starts[lo:hi]:
+                text.stylize(
+                    _HIGHLIGHT_STYLE,
+                    _PAD + max(pos - start, 0),
+                    _PAD + min(pos + length - start, len(row)),
+                )
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        if self._low_bandwidth:
+            # Unstyled padding merges into the text's own run
+            return strip.crop_extend(0, width, None).simplify()
+        return strip.crop_extend(0, width, rich_style)
 
     # ── scrolling ──
 
-    def _visible_line_count(self) -> int:
-        """How many logical lines fit on the current page."""
-        height = self.size.height
-        width = self._wrap_width()
-        visual = 0
-        count = 0
-        idx = self._top_line
-        while idx < len(self._lines):
-            h = len(self._wrap_line(self._lines[idx], width))
-            space = self._line_spacing if idx < len(self._lines) - 1 else 0
-            if visual + h + space > height and count > 0:
-                break
-            visual += h + space
-            count += 1
-            idx += 1
-        return max(count, 1)
+    def _set_position(self, chapter_idx: int, line: int) -> None:
+        # Any jump supersedes line scrolling that has not been applied yet
+        self._cancel_scroll()
+        pane = self._window.get(chapter_idx)
+        if pane is None:
+            return
+        line = max(0, min(line, len(pane.paragraphs) - 1))
+        if (chapter_idx, line, 0) == (self._chapter, self._top_line, self._top_sub):
+            return
+        changed = chapter_idx != self._chapter
+        self._chapter = chapter_idx
+        self._top_line = line
+        self._top_sub = 0
+        if changed:
+            self._fill_window()
+            self.post_message(self.ChapterChanged(chapter_idx))
+        self._refresh_view()
+        self._report_page()
 
     def action_scroll_down_line(self) -> None:
-        if self._top_line < len(self._lines) - 1:
-            self._top_line += 1
-            self.refresh()
+        self._queue_scroll(1)
 
     def action_scroll_up_line(self) -> None:
-        if self._top_line > 0:
-            self._top_line -= 1
-            self.refresh()
+        self._queue_scroll(-1)
+
+    def _queue_scroll(self, delta: int) -> None:
+        """Add ``delta`` lines to the pending scroll.
+
+        When idle the scroll is applied at once; otherwise input is summed
+        until the next frame, so key repeat and wheel bursts never queue more
+        repaints than the frame-rate cap allows.
+        """
+        self._pending_scroll += delta
+        if self._scroll_timer is not None:
+            return
+        wait = self._last_scroll + self._frame_interval - time.monotonic()
+        if wait <= 0:
+            self._flush_scroll()
+        else:
+            self._scroll_timer = self.set_timer(wait, self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Apply the pending scroll in one step."""
+        delta = self._pending_scroll
+        self._cancel_scroll()
+        self._last_scroll = time.monotonic()
+        if delta:
+            self._scroll_lines(delta)
+
+    def _cancel_scroll(self) -> None:
+        self._pending_scroll = 0
+        if self._scroll_timer is not None:
+            self._scroll_timer.stop()
+            self._scroll_timer = None
+
+    def _scroll_lines(self, delta: int) -> None:
+        """Move the top line by ``delta`` paragraphs, across loaded chapters."""
+        if self._paginated:
+            self._flip_pages(delta)
+            return
+        pane = self._pane()
+        if pane is None:
+            return
+        if delta < 0 and self._top_sub:
+            # Back to the start of a paragraph auto-scroll left part-way
+            delta += 1
+        line = self._top_line
+        while delta > 0:
+            step = min(delta, len(pane.paragraphs) - 1 - line)
+            if step > 0:
+                line += step
+                delta -= step
+            elif (after := self._neighbour(pane.index + 1)) is not None:
+                pane, line = after, 0
+                delta -= 1
+            else:
+                break
+        while delta < 0:
+            step = min(-delta, line)
+            if step > 0:
+                line -= step
+                delta += step
+            elif (before := self._neighbour(pane.index - 1)) is not None:
+                pane, line = before, len(before.paragraphs) - 1
+                delta += 1
+            else:
+                break
+        self._set_position(pane.index, line)
+
+    def _flip_pages(self, delta: int) -> None:
+        """Turn ``delta`` pages, running into loaded neighbouring chapters."""
+        pane = self._pane()
+        if pane is None:
+            return
+        pages = self._pages(pane)
+        page = pages.page_of(self._top_line) + delta
+        while True:
+            if page < 0:
+                prev = self._neighbour(pane.index - 1)
+                if prev is None:
+                    page = 0
+                    break
+                pane, pages = prev, self._pages(prev)
+                page += len(pages)
+            elif pages.start(page) is None:
+                nxt = self._neighbour(pane.index + 1)
+                if nxt is None:
+                    page = len(pages) - 1
+                    break
+                page -= len(pages)
+                pane, pages = nxt, self._pages(nxt)
+            else:
+                break
+        self._set_position(pane.index, pages.start(page) or 0)
 
     def action_page_down(self) -> None:
-        page = self._visible_line_count()
-        new_top = min(self._top_line + page, len(self._lines) - 1)
-        if new_top != self._top_line:
-            self._top_line = new_top
-            self.refresh()
+        """Advance past every paragraph that fits entirely on this page."""
+        if self._pending_scroll:
+            self._flush_scroll()
+        if self._paginated:
+            self._flip_pages(1)
+            return
+        pane = self._pane()
+        if pane is None:
+            return
+        height = self.size.height
+        used = 0
+        target = None
+        for p, idx, rows in self._paragraphs_after(pane, self._top_line):
+            if idx >= 0:
+                target = (p.index, idx)
+                if used + len(self._layout(p).rows(idx)) > height:
+                    break
+            used += rows
+        if target is not None and target > (self._chapter, self._top_line):
+            self._set_position(*target)
+        else:
+            self._scroll_lines(1)
 
     def action_page_up(self) -> None:
+        """Go back by as many whole paragraphs as fit on one page."""
+        if self._pending_scroll:
+            self._flush_scroll()
+        if self._paginated:
+            self._flip_pages(-1)
+            return
+        pane = self._pane()
+        if pane is None:
+            return
         height = self.size.height
-        width = self._wrap_width()
-        visual = 0
-        idx = self._top_line - 1
-        while idx >= 0:
-            h = len(self._wrap_line(self._lines[idx], width))
-            space = self._line_spacing
-            if visual + h + space > height:
-                idx += 1
+        used = 0
+        target = None
+        for p, idx, rows in self._paragraphs_before(pane, self._top_line):
+            used += rows
+            if used > height:
                 break
-            visual += h + space
-            idx -= 1
-        self._top_line = max(0, idx)
-        self.refresh()
+            if idx >= 0:
+                target = (p.index, idx)
+        if target is not None:
+            self._set_position(*target)
+        else:
+            self._scroll_lines(-1)
 
     def action_scroll_home_action(self) -> None:
-        self._top_line = 0
-        self.refresh()
+        self._set_position(self._chapter, 0)
 
     def action_scroll_end(self) -> None:
-        height = self.size.height
-        width = self._wrap_width()
-        visual = 0
-        idx = len(self._lines) - 1
-        while idx >= 0:
-            h = len(self._wrap_line(self._lines[idx], width))
-            space = self._line_spacing if idx < len(self._lines) - 1 else 0
-            if visual + h + space > height:
-                idx += 1
+        """Scroll so the chapter's last paragraph ends at the bottom of the view.
+
+        Walks back from the end, so only the last screenful is laid out.
+        """
+        pane = self._pane()
+        if pane is None or not pane.paragraphs:
+            return
+        if self._paginated:
+            pages = self._pages(pane)
+            self._set_position(self._chapter, pages.start(len(pages) - 1) or 0)
+            return
+        layout = self._layout(pane)
+        last = len(pane.paragraphs) - 1
+        used = layout.height(last)
+        top = last
+        while top > 0 and used + layout.height(top - 1) <= self.size.height:
+            top -= 1
+            used += layout.height(top)
+        self._set_position(self._chapter, top)
+
+    def on_resize(self) -> None:
+        self._report_page()
+
+    # ── auto-scroll ──
+
+    def action_toggle_auto_scroll(self) -> None:
+        # Stopping is handled by on_key, like any other key
+        self.start_auto_scroll()
+
+    def action_auto_scroll_faster(self) -> None:
+        step = max(1, self._auto_speed // 5)
+        self.set_auto_scroll_speed(self._auto_speed + step, self._auto_by_rows)
+
+    def action_auto_scroll_slower(self) -> None:
+        step = max(1, self._auto_speed // 5)
+        self.set_auto_scroll_speed(self._auto_speed - step, self._auto_by_rows)
+
+    def on_key(self, event: Key) -> None:
+        """Any key but the speed keys pauses auto-scroll, and does nothing else."""
+        if self._auto_timer is not None and event.key not in ("plus", "minus"):
+            self.stop_auto_scroll()
+            event.stop()
+            event.prevent_default()
+
+    def _auto_scroll_tick(self) -> None:
+        """Scroll as far as the time since the last tick pays for."""
+        started = time.perf_counter()
+        now = time.monotonic()
+        # Never catch up more than a second, e.g. after the app was suspended
+        self._auto_budget = min(self._auto_budget + now - self._auto_last, 1.0)
+        self._auto_last = now
+        moved = False
+        while self._auto_budget >= (cost := self._auto_cost()):
+            if not self._auto_step():
+                self._auto_budget = 0.0
+                self._auto_scroll_at_end()
                 break
-            visual += h + space
-            idx -= 1
-        self._top_line = max(0, idx)
-        self.refresh()
+            self._auto_budget -= cost
+            moved = True
+        if moved:
+            # Measure through to the repaint the scroll caused
+            self.call_after_refresh(
+                lambda: self._auto_stats.add(time.perf_counter() - started)
+            )
+        if now - self._auto_reported >= _AUTO_REPORT_INTERVAL:
+            self._auto_reported = now
+            self._report_auto_scroll()
+
+    def _auto_cost(self) -> float:
+        """Seconds of reading time the next auto-scroll step stands for."""
+        pane = self._pane()
+        if pane is None:
+            return 1.0
+        if self._paginated:
+            if self._auto_by_rows:
+                return self.size.height / self._auto_speed
+            pages = self._pages(pane)
+            page = pages.page_of(self._top_line)
+            start, end = pages.start(page) or 0, pages.end(page)
+            chars = pane.paragraphs.ends[end - 1] - pane.paragraphs.starts[start] if end else 0
+            return max(chars, 1) / self._auto_speed
+        if self._auto_by_rows:
+            return 1 / self._auto_speed
+        # Scrolling the top row away takes as long as reading it
+        frame = self._viewport()
+        chars = 1
+        if frame and frame[0] is not None:
+            p, idx, sub = frame[0]
+            chars = max(len(self._layout(p).rows(idx)[sub]), 1)
+        return chars / self._auto_speed
+
+    def _auto_step(self) -> bool:
+        if not self._paginated:
+            return self._scroll_row()
+        before = (self._chapter, self._top_line)
+        self._flip_pages(1)
+        return (self._chapter, self._top_line) != before
+
+    def _auto_scroll_at_end(self) -> None:
+        nxt = self._chapter + 1
+        if nxt >= self._window.count:
+            self.stop_auto_scroll()
+        elif self._loader is None:
+            if not self._auto_waiting:
+                self._auto_waiting = True
+                self.post_message(self.AutoScrollReachedEnd(self._chapter))
+        elif nxt not in self._loading and nxt not in self._window:
+            # Continuous mode, and the next chapter failed to load
+            self.stop_auto_scroll()
+        # Otherwise the next chapter is still loading; keep waiting
+
+    def _report_auto_scroll(self) -> None:
+        self.post_message(
+            self.AutoScrollStatus(
+                self._auto_timer is not None,
+                self._auto_speed,
+                self._auto_by_rows,
+                self._auto_stats,
+            )
+        )
 
     # ── mouse wheel ──
 
     def on_mouse_scroll_down(self, event: MouseScrollDown) -> None:
-        self.action_scroll_down_line()
+        self._queue_scroll(self._wheel_step(1))
         event.stop()
 
     def on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
-        self.action_scroll_up_line()
+        self._queue_scroll(-self._wheel_step(-1))
         event.stop()
+
+    def _wheel_step(self, direction: int) -> int:
+        """Lines to scroll for one wheel tick."""
+        if not self._wheel_acceleration:
+            return 1
+        now = time.monotonic()
+        same_burst = now - self._wheel_time < _WHEEL_BURST
+        if same_burst and (self._wheel_streak >= 0) == (direction > 0):
+            self._wheel_streak += direction
+        else:
+            self._wheel_streak = direction
+        self._wheel_time = now
+        return min(1 + (abs(self._wheel_streak) - 1) // _WHEEL_RAMP, _WHEEL_MAX_STEP)
@@ -5,14 +5,27 @@ from __future__ import annotations
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Input, Label
 
 
+# Quiet period after the last keystroke before a live search starts
+_DEBOUNCE_SECONDS = 0.25
+
+
 class SearchBar(Widget):
     """Inline search bar with result navigation."""
 
     class SearchRequested(Message):
+        def __init__(self, query: str, live: bool = False) -> None:
+            super().__init__()
+            self.query = query
+            self.live = live  # True if sent while typing, not on Enter
+
+    class FindRequested(Message):
+        """Posted in find mode: jump to the next match instead of listing all."""
+
         def __init__(self, query: str) -> None:
             super().__init__()
             self.query = query
@@ -29,21 +42,37 @@ class SearchBar(Widget):
         super().__init__(**kwargs)
         self._result_count: int = 0
         self._current_result: int = 0
+        self._find_mode: bool = False
+        self._find_status: str = ""
+        self._searching: bool = False
+        self._debounce_timer: Timer | None = None
+        # Search as you type (debounced) instead of only on Enter
+        self.live: bool = False
 
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Input(placeholder="搜索...", id="search-input")
             yield Label("", id="search-count")
 
-    def show(self) -> None:
-        """Show the search bar and focus input."""
+    def show(self, *, find: bool = False) -> None:
+        """Show the search bar and focus input.
+
+        In find mode Enter jumps to the next match from the reading position
+        instead of running a full-book search.
+        """
+        self._find_mode = find
         self.add_class("visible")
-        self.query_one("#search-input", Input).focus()
+        inp = self.query_one("#search-input", Input)
+        inp.placeholder = "查找..." if find else "搜索..."
+        inp.focus()
 
     def hide(self) -> None:
         """Hide the search bar."""
         self.remove_class("visible")
+        self._cancel_debounce()
+        self._searching = False
         self.query_one("#search-input", Input).value = ""
+        self._find_status = ""
         self._update_count_label()
         self.post_message(self.SearchClosed())
 
@@ -51,20 +80,62 @@ class SearchBar(Widget):
         """Update the result count display."""
         self._result_count = total
         self._current_result = current
+        self._find_status = ""
+        self._searching = False
+        self._update_count_label()
+
+    def update_running_count(self, found: int) -> None:
+        """Show the number of hits found so far by a search in progress."""
+        self._result_count = found
+        self._searching = True
+        self._update_count_label()
+
+    def update_find_status(self, status: str) -> None:
+        """Show where the last find-mode jump landed."""
+        self._result_count = 0
+        self._find_status = status
         self._update_count_label()
 
     def _update_count_label(self) -> None:
         label = self.query_one("#search-count", Label)
-        if self._result_count > 0:
+        if self._searching:
+            label.update(f"{self._result_count}…")
+        elif self._result_count > 0:
             label.update(f"{self._current_result}/{self._result_count}")
+        elif self._find_status:
+            label.update(self._find_status)
         elif self.has_class("visible") and self.query_one("#search-input", Input).value:
             label.update("无结果")
         else:
             label.update("")
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != "search-input" or not self.live or self._find_mode:
+            return
+        if not self.is_visible:
+            return  # cleared by hide()
+        self._cancel_debounce()
+        self._debounce_timer = self.set_timer(
+            _DEBOUNCE_SECONDS, lambda: self._request_live(event.value.strip())
+        )
+
+    def _request_live(self, query: str) -> None:
+        self._debounce_timer = None
+        self.post_message(self.SearchRequested(query, live=True))
+
+    def _cancel_debounce(self) -> None:
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
+        self._cancel_debounce()
         if event.input.id == "search-input" and event.value.strip():
-            self.post_message(self.SearchRequested(event.value.strip()))
+            query = event.value.strip()
+            if self._find_mode:
+                self.post_message(self.FindRequested(query))
+            else:
+                self.post_message(self.SearchRequested(query))
 
     @property
     def is_visible(self) -> bool:
@@ -14,6 +14,10 @@ class StatusBar(Widget):
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Label("", id="status-chapter")
+            yield Label("", id="status-layout")
+            yield Label("", id="status-auto")
+            yield Label("", id="status-bytes")
+            yield Label("", id="status-page")
             yield Label("", id="status-progress")
 
     def update_status(
@@ -30,3 +34,52 @@ class StatusBar(Widget):
         self.query_one("#status-progress", Label).update(
             f"[{chapter_idx + 1}/{total_chapters}] {percent:.1f}% "
         )
+
+    def update_layout(self, percent: int | None) -> None:
+        """Show how much of a large chapter has been laid out, or clear it."""
+        self.query_one("#status-layout", Label).update(
+            "" if percent is None else f"排版 {percent}% "
+        )
+
+    def update_page(
+        self,
+        page: int | None,
+        count: int | None = None,
+        book_page: int | None = None,
+        book_total: int | None = None,
+    ) -> None:
+        """Show the page number in paginated mode, or clear it.
+
+        The chapter's page count and the book-wide numbers are left out until
+        they are known; the book total shows as … while it is being counted.
+        """
+        if page is None:
+            self.query_one("#status-page", Label).update("")
+            return
+        text = f"第 {page + 1}/{count} 页" if count else f"第 {page + 1} 页"
+        if book_page is not None:
+            total = "…" if book_total is None else f"{book_total:,}"
+            text += f" · 全书 {book_page + 1:,}/{total}"
+        self.query_one("#status-page", Label).update(text + " ")
+
+    def update_auto_scroll(
+        self,
+        speed: str | None,
+        p95_ms: float | None = None,
+        budget_ms: float = 0.0,
+        late_ratio: float = 0.0,
+    ) -> None:
+        """Show auto-scroll speed and frame times against the budget, or clear it."""
+        if speed is None:
+            self.query_one("#status-auto", Label).update("")
+            return
+        text = f"自动 {speed}"
+        if p95_ms is not None:
+            text += f" · 帧 {p95_ms:.1f}/{budget_ms:.1f}ms 超时 {late_ratio:.0%}"
+        self.query_one("#status-auto", Label).update(text + " ")
+
+    def update_bandwidth(self, count: int | None) -> None:
+        """Show the bytes the last scroll repainted (low-bandwidth mode), or clear it."""
+        self.query_one("#status-bytes", Label).update(
+            "" if count is None else f"{count / 1024:.1f}KB/帧 "
+        )
@@ -0,0 +1,31 @@
+"""Tests for the sliding chapter window."""
+
+from novel_tui.core.chapter_window import ChapterWindow
+
+
+def test_span_is_clamped():
+    window: ChapterWindow[str] = ChapterWindow(10, behind=1, ahead=2)
+    assert window.span(5) == range(4, 8)
+    assert window.span(0) == range(0, 3)
+    assert window.span(9) == range(8, 10)
+
+
+def test_missing_is_nearest_first_and_forward_biased():
+    window: ChapterWindow[str] = ChapterWindow(10, behind=1, ahead=2)
+    assert window.missing(5) == [5, 6, 4, 7]
+    window.put(5, "five")
+    window.put(6, "six")
+    assert window.missing(5) == [4, 7]
+    assert window.missing(0) == [0, 1, 2]
+
+
+def test_evict_keeps_memory_bounded():
+    window: ChapterWindow[str] = ChapterWindow(100, behind=1, ahead=2)
+    for center in range(50):
+        for idx in window.missing(center):
+            window.put(idx, str(idx))
+        window.evict(center)
+        assert len(window) <= 4
+    assert 49 in window and 48 in window and 51 in window
+    assert 47 not in window
+    assert window.get(50) == "50"
@@ -0,0 +1,58 @@
+"""Tests for the per-thread connection pool."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from novel_tui.db import repository
+from novel_tui.db.connection import get_connection, reset_connection, writing
+from novel_tui.db.models import Book
+
+
+@pytest.fixture(autouse=True)
+def _fresh_db(tmp_path):
+    reset_connection()
+    get_connection(tmp_path / "test.db")
+    yield
+    reset_connection()
+
+
+def _in_thread(fn):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_each_thread_reads_through_its_own_connection():
+    main = get_connection()
+    assert get_connection() is main
+    assert _in_thread(lambda: id(get_connection())) != id(main)
+
+
+def test_readers_are_query_only():
+    with pytest.raises(sqlite3.OperationalError):
+        get_connection().execute("DELETE FROM books")
+
+
+def test_finished_threads_hand_their_reader_back():
+    first = _in_thread(lambda: id(get_connection()))
+    assert _in_thread(lambda: id(get_connection())) == first
+
+
+def test_workers_read_while_a_write_is_open():
+    book = repository.add_book(Book(title="Book", file_path="/tmp/a.txt"))
+    with writing() as conn:
+        conn.execute("UPDATE books SET title = 'Renamed' WHERE id = ?", (book.id,))
+        # Not committed yet: a worker reads the last committed state
+        assert _in_thread(lambda: repository.get_book(book.id).title) == "Book"
+    assert _in_thread(lambda: repository.get_book(book.id).title) == "Renamed"
+
+
+def test_failed_write_rolls_back():
+    with pytest.raises(RuntimeError), writing() as conn:
+        conn.execute("INSERT INTO books (title, file_path) VALUES ('A', '/tmp/a.txt')")
+        raise RuntimeError
+    assert repository.count_books() == 0
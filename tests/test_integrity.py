@@ -0,0 +1,63 @@
+"""Tests for the library integrity scan."""
+
+import os
+
+from novel_tui.core.integrity import FileStatus, check_file, scan_files
+
+
+def _entry(path, book_id=1, mtime=None):
+    st = os.stat(path)
+    return (book_id, str(path), st.st_size, st.st_mtime_ns if mtime is None else mtime)
+
+
+def test_unchanged_file_is_ok(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    check = check_file(_entry(path))
+    assert check.status is FileStatus.OK
+    assert check.mtime == os.stat(path).st_mtime_ns
+
+
+def test_missing_modified_and_appended(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    entry = _entry(path)
+    ns = entry[3]
+
+    os.utime(path, ns=(ns + 10**9, ns + 10**9))
+    assert check_file(entry).status is FileStatus.MODIFIED
+    path.write_bytes(b"hello world")
+    assert check_file(entry).status is FileStatus.APPENDED
+    path.write_bytes(b"hi")
+    assert check_file(entry).status is FileStatus.MODIFIED
+    path.unlink()
+    assert check_file(entry).status is FileStatus.MISSING
+
+
+def test_unknown_mtime_compares_size_only(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    assert check_file(_entry(path, mtime=0)).status is FileStatus.OK
+
+
+def test_scan_reports_every_file_in_batches(tmp_path):
+    entries = []
+    for i in range(10):
+        path = tmp_path / f"{i}.txt"
+        path.write_bytes(b"x" * i)
+        entries.append(_entry(path, book_id=i))
+    entries.append((99, str(tmp_path / "gone.txt"), 1, 1))
+
+    batches = []
+    scan_files(entries, batches.append, max_workers=4, batch_size=4)
+    assert [len(b) for b in batches] == [4, 4, 3]
+    statuses = {c.book_id: c.status for b in batches for c in b}
+    assert statuses.pop(99) is FileStatus.MISSING
+    assert set(statuses.values()) == {FileStatus.OK}
+
+
+def test_cancelled_scan_stops(tmp_path):
+    entries = [(i, str(tmp_path / f"{i}.txt"), 0, 0) for i in range(10)]
+    batches = []
+    scan_files(entries, batches.append, batch_size=1, is_cancelled=lambda: True)
+    assert batches == []
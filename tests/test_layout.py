@@ -0,0 +1,81 @@
+"""Tests for the wrapped-line layout index."""
+
+import textwrap
+
+from novel_tui.core.layout import LayoutIndex
+
+
+def _wrap(line: str, width: int) -> list[str]:
+    return textwrap.wrap(line, width=width) or [""]
+
+
+def _make(paragraphs: list[str], width: int = 10, spacing: int = 1) -> LayoutIndex:
+    return LayoutIndex(paragraphs, width, spacing, _wrap)
+
+
+def test_heights_and_offsets():
+    # 1 row, 2 rows, 3 rows; one spacing row between paragraphs
+    layout = _make(["a" * 5, "b" * 15, "c" * 25])
+    assert [layout.height(i) for i in range(3)] == [2, 3, 3]
+    assert [layout.text_rows(i) for i in range(3)] == [1, 2, 3]
+    layout.ensure(3)
+    assert list(layout.offsets) == [0, 2, 5, 8]
+    assert layout.complete
+
+
+def test_layout_is_lazy():
+    calls: list[str] = []
+
+    def wrap(line: str, width: int) -> list[str]:
+        calls.append(line)
+        return _wrap(line, width)
+
+    layout = LayoutIndex([str(i) for i in range(10_000)], 10, 0, wrap)
+    assert layout.height(5) == 1
+    layout.ensure(50)
+    assert not layout.complete
+    assert len(calls) == 50
+
+
+def test_rows_are_cached():
+    calls: list[str] = []
+
+    def wrap(line: str, width: int) -> list[str]:
+        calls.append(line)
+        return _wrap(line, width)
+
+    layout = LayoutIndex(["x" * 30], 10, 0, wrap)
+    assert layout.rows(0) == ["x" * 10] * 3
+    layout.rows(0)
+    assert len(calls) == 1
+    assert layout.height(0) == 3
+
+
+def test_empty():
+    layout = _make([])
+    layout.ensure(3)
+    assert layout.complete
+    assert list(layout.offsets) == [0]
+
+
+def test_laid_out_grows_in_chunks():
+    layout = LayoutIndex([str(i) for i in range(1000)], 10, 0, _wrap)
+    assert layout.laid_out == 0
+    layout.ensure(256)
+    assert layout.laid_out == 256
+    layout.ensure(layout.laid_out + 10_000)
+    assert layout.laid_out == 1000
+    assert layout.complete
+
+
+def test_row_starts_skip_dropped_spaces():
+    calls: list[str] = []
+
+    def wrap(line: str, width: int) -> list[str]:
+        calls.append(line)
+        return _wrap(line, width)
+
+    layout = LayoutIndex(["hello  world foo"], 6, 0, wrap)
+    assert layout.rows(0) == ["hello", "world", "foo"]
+    assert [layout.row_start(0, sub) for sub in range(3)] == [0, 7, 13]
+    assert len(calls) == 1
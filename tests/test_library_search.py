@@ -0,0 +1,102 @@
+"""Tests for library-wide search."""
+
+import tempfile
+import threading
+from pathlib import Path
+
+from novel_tui.core.library_search import LibrarySearcher
+from novel_tui.db.models import Book, Chapter
+
+
+def _make_book(content: str, book_id: int) -> tuple[Book, list[Chapter]]:
+    f = tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode="wb")
+    raw = content.encode("utf-8")
+    f.write(raw)
+    f.close()
+    book = Book(title=f"Book {book_id}", file_path=f.name, file_size=len(raw), id=book_id)
+    chapters = [Chapter(book_id=book_id, index=0, title="Ch1", byte_offset=0, length=len(raw))]
+    return book, chapters
+
+
+def _searcher(books: dict[int, tuple[Book, list[Chapter]]], **kwargs) -> LibrarySearcher:
+    return LibrarySearcher(
+        [b for b, _ in books.values()],
+        lambda book: books[book.id][1],
+        **kwargs,
+    )
+
+
+def test_library_search_groups_by_book():
+    books = {
+        1: _make_book("萧炎在此。萧炎又来了。", 1),
+        2: _make_book("没有匹配。", 2),
+        3: _make_book("这里也有萧炎。", 3),
+    }
+    found = []
+    matched = _searcher(books).search("萧炎", found.append)
+
+    assert matched == 2
+    by_book = {hits.book.id: hits for hits in found}
+    assert set(by_book) == {1, 3}
+    assert [r.char_offset for r in by_book[1].results] == [0, 5]
+    assert not by_book[1].truncated
+
+
+def test_library_search_caps_hits_per_book():
+    books = {1: _make_book("啊" * 20, 1)}
+    found = []
+    _searcher(books, max_hits_per_book=5).search("啊", found.append)
+
+    assert len(found[0].results) == 5
+    assert found[0].truncated
+
+
+def test_library_search_schedules_small_books_first():
+    books = {
+        1: _make_book("萧炎" + "字" * 1000, 1),
+        2: _make_book("萧炎", 2),
+    }
+    order = []
+    lock = threading.Lock()
+
+    def load(book):
+        with lock:
+            order.append(book.id)
+        return books[book.id][1]
+
+    LibrarySearcher([b for b, _ in books.values()], load, max_workers=1).search(
+        "萧炎", lambda _hits: None
+    )
+    assert order == [2, 1]
+
+
+def test_library_search_skips_missing_files():
+    book, chapters = _make_book("萧炎", 1)
+    Path(book.file_path).unlink()
+    found = []
+    matched = LibrarySearcher([book], lambda _b: chapters).search("萧炎", found.append)
+    assert matched == 0
+    assert found == []
+
+
+def test_library_search_cancelled():
+    books = {1: _make_book("萧炎", 1)}
+    found = []
+    matched = _searcher(books).search("萧炎", found.append, is_cancelled=lambda: True)
+    assert matched == 0
+    assert found == []
+
+
+def test_library_search_skips_unreadable_books(tmp_path):
+    books = {
+        1: _make_book("萧炎在此。", 1),
+        2: _make_book("萧炎也在。", 2),
+    }
+    # A directory where the file was: open() raises IsADirectoryError
+    books[2][0].file_path = str(tmp_path)
+    books[3] = (Book(title="Gone", file_path=str(tmp_path / "gone.txt"), id=3), books[1][1])
+    found = []
+    matched = _searcher(books).search("萧炎", found.append)
+
+    assert matched == 1
+    assert [hits.book.id for hits in found] == [1]
@@ -0,0 +1,34 @@
+"""Tests for search character folding."""
+
+from novel_tui.core.normalize import FOLD_TABLE, fold
+
+
+def test_fold_traditional_to_simplified():
+    assert fold("蕭炎與藥老") == "萧炎与药老"
+    assert fold("萧炎与药老") == "萧炎与药老"
+
+
+def test_fold_fullwidth_and_case():
+    assert fold("ＡＢＣ１２３！") == "abc123!"
+    assert fold("ABC") == "abc"
+    assert fold("ＡＢＣ", case_sensitive=True) == "ABC"
+    assert fold("　") == " "
+
+
+def test_fold_lowercases_every_script():
+    assert fold("ÉCOLE Привет ΣΟΦΙΑ") == "école привет σοφια"
+    assert fold("ÉCOLE Привет", case_sensitive=True) == "ÉCOLE Привет"
+    assert fold("İstanbul") == "istanbul"
+
+
+def test_fold_preserves_length():
+    text = "第一章　蕭炎ＡＢＣ，Hello！\n　　鬥氣大陸"
+    assert len(fold(text)) == len(text)
+    every = "".join(map(chr, range(0x110000)))
+    assert len(fold(every)) == len(every)
+
+
+def test_fold_table_is_one_to_one_and_idempotent():
+    assert all(isinstance(v, int) for v in FOLD_TABLE.values())
+    # Folding twice changes nothing: no target is itself folded further
+    assert not set(FOLD_TABLE.values()) & {k for k, v in FOLD_TABLE.items() if k != v}
@@ -0,0 +1,70 @@
+"""Tests for paginated-mode page tables."""
+
+import textwrap
+from array import array
+
+from novel_tui.core.layout import LayoutIndex
+from novel_tui.core.pages import PageIndex, PageTable, paginate
+
+
+def _wrap(line: str, width: int) -> list[str]:
+    return textwrap.wrap(line, width=width) or [""]
+
+
+def _make(paragraphs: list[str], width: int = 10, spacing: int = 1) -> LayoutIndex:
+    return LayoutIndex(paragraphs, width, spacing, _wrap)
+
+
+def test_paginate_fills_pages_with_whole_paragraphs():
+    # 1, 2, 3, 1 text rows; one spacing row between paragraphs
+    layout = _make(["a" * 5, "b" * 15, "c" * 25, "d"])
+    # 5 rows: a + gap + b(2) + gap fill 5, c(3) would overflow
+    assert list(paginate(layout, 5)) == [0, 2]
+    assert list(paginate(layout, 100)) == [0]
+    # Paragraphs taller than a page get a page each
+    assert list(paginate(layout, 1)) == [0, 1, 2, 3]
+
+
+def test_page_index_is_lazy():
+    layout = _make(["x"] * 100, spacing=0)
+    pages = PageIndex(layout, 10)
+    assert pages.page_of(25) == 2
+    assert not pages.complete
+    assert pages.start(3) == 30
+    assert pages.end(3) == 40
+    assert len(pages) == 10
+    assert pages.start(10) is None
+    assert pages.end(9) == 100
+
+
+def test_empty_chapter_has_one_page():
+    pages = PageIndex(_make([]), 10)
+    assert len(pages) == 1
+    assert pages.page_of(0) == 0
+    assert pages.end(0) == 0
+
+
+def test_page_index_from_cached_starts():
+    layout = _make(["x"] * 20, spacing=0)
+    pages = PageIndex(layout, 5, array("I", [0, 5, 10, 15]))
+    assert pages.complete
+    assert pages.page_of(12) == 2
+    assert len(pages) == 4
+
+
+def test_page_table_numbers_fill_in_progressively():
+    table = PageTable((40, 1, 20), 3)
+    table.put(2, array("I", [0, 7]))
+    assert table.count(2) == 2
+    assert table.book_page(0, 0) == 0
+    assert table.book_page(2, 1) is None
+    assert table.total is None
+
+    table.put(0, array("I", [0, 4, 9]))
+    assert table.book_page(1, 0) == 3
+    assert table.book_page(2, 1) is None
+
+    table.put(1, array("I", [0]))
+    assert table.book_page(2, 1) == 5
+    assert table.total == 6
+    assert table.complete
@@ -0,0 +1,39 @@
+"""Tests for the array-backed paragraph store."""
+
+from novel_tui.core.paragraphs import ParagraphStore
+
+
+def _split(text: str) -> tuple[list[str], list[int]]:
+    """Reference implementation: strip every line, drop blank ones."""
+    lines, offsets = [], []
+    pos = 0
+    for p in text.split("\n"):
+        if p.strip():
+            lines.append(p.strip())
+            offsets.append(pos + len(p) - len(p.lstrip()))
+        pos += len(p) + 1
+    return lines, offsets
+
+
+def test_matches_strip_and_split():
+    text = "第一章 开始\r\n\n　　萧炎看着 少女。\n   \n\t英文 words here \n　　最后一段"
+    store = ParagraphStore(text)
+    lines, offsets = _split(text)
+    assert list(store) == lines
+    assert list(store.starts) == offsets
+    assert store[1] == "萧炎看着 少女。"
+    assert store[-1] == "最后一段"
+    assert store[1:3] == lines[1:3]
+
+
+def test_offsets_point_into_text():
+    text = "  a\n\nbb  \n"
+    store = ParagraphStore(text)
+    assert len(store) == 2
+    for i, p in enumerate(store):
+        assert text[store.starts[i] : store.ends[i]] == p
+
+
+def test_empty():
+    assert len(ParagraphStore("")) == 0
+    assert len(ParagraphStore("\n \n　\n")) == 0
@@ -0,0 +1,68 @@
+"""Tests for frame timing instrumentation."""
+
+from novel_tui.core.perf import FrameStats, OutputMeter, StartupTimes
+
+
+def test_counts_late_frames():
+    stats = FrameStats(budget=0.016)
+    for t in (0.002, 0.010, 0.020, 0.005):
+        stats.add(t)
+    assert stats.frames == 4
+    assert stats.late == 1
+    assert stats.late_ratio == 0.25
+
+
+def test_percentile_over_recent_frames():
+    stats = FrameStats(budget=1.0, size=10)
+    assert stats.percentile(95) == 0.0
+    for i in range(100):
+        stats.add(i / 100)
+    # Only the last 10 frames are kept
+    assert len(stats) == 10
+    assert stats.percentile(0) == 0.90
+    assert stats.percentile(50) == 0.95
+    assert stats.percentile(100) == 0.99
+    assert stats.frames == 100
+
+
+def test_reset():
+    stats = FrameStats(budget=0.001)
+    stats.add(0.5)
+    stats.reset()
+    assert stats.frames == stats.late == len(stats) == 0
+    assert stats.late_ratio == 0.0
+
+
+def test_startup_marks_keep_the_first_time():
+    times = StartupTimes(start=0.0)
+    times.marks["imports"] = 0.1
+    times.mark("first paint")
+    first = times.marks["first paint"]
+    times.mark("first paint")
+    assert times.marks["first paint"] == first
+    assert list(times.marks) == ["imports", "first paint"]
+
+
+def test_startup_report_against_target():
+    times = StartupTimes(start=0.0)
+    times.marks.update({"imports": 0.2, "first paint": 0.25})
+    report = times.report(target=0.3).splitlines()
+    assert report[1] == "first paint    250.0 ms  (+50.0)"
+    assert report[-1].endswith("ok")
+    assert times.report(target=0.2).endswith("over")
+    assert "target" not in StartupTimes().report()
+
+
+def test_output_meter_reports_the_next_frame_only():
+    meter = OutputMeter()
+    meter.add("ignored")
+    counts = []
+    meter.measure_next_frame(counts.append)
+    meter.measure_next_frame(counts.append)
+    meter.end_frame()  # a display that wrote nothing
+    meter.add("ab")
+    meter.add("萧")
+    meter.end_frame()
+    meter.add("later")
+    meter.end_frame()
+    assert counts == [5]
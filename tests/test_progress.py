@@ -0,0 +1,77 @@
+"""Tests for the write-behind progress writer."""
+
+import time
+
+import pytest
+
+from novel_tui.db import repository
+from novel_tui.db.connection import get_connection, reset_connection
+from novel_tui.db.models import Book
+from novel_tui.db.progress import ProgressWriter
+
+
+@pytest.fixture(autouse=True)
+def _fresh_db(tmp_path):
+    reset_connection()
+    get_connection(tmp_path / "test.db")
+    yield
+    reset_connection()
+
+
+def _add_books(n: int) -> list[int]:
+    return [
+        repository.add_book(Book(title=f"Book {i}", file_path=f"/tmp/{i}.txt")).id
+        for i in range(n)
+    ]
+
+
+def test_latest_position_per_book_is_written():
+    a, b = _add_books(2)
+    writer = ProgressWriter(delay=60)
+    writer.save(a, 1, 100)
+    writer.save(a, 2, 200)
+    writer.save(b, 5, 50)
+    assert not writer.idle
+    assert writer.flush(timeout=5)
+    assert writer.idle
+
+    book_a, book_b = repository.get_book(a), repository.get_book(b)
+    assert (book_a.read_chapter_idx, book_a.read_position) == (2, 200)
+    assert (book_b.read_chapter_idx, book_b.read_position) == (5, 50)
+    assert book_a.last_read_at is not None
+    writer.close()
+
+
+def test_unchanged_position_is_not_written_again():
+    (a,) = _add_books(1)
+    writer = ProgressWriter(delay=60)
+    writer.save(a, 1, 100)
+    writer.flush(timeout=5)
+    writer.save(a, 1, 100)
+    assert writer.idle
+    writer.save(a, 1, 101)
+    assert not writer.idle
+    writer.close()
+
+
+def test_close_writes_pending_positions():
+    (a,) = _add_books(1)
+    writer = ProgressWriter(delay=60)
+    writer.save(a, 3, 30)
+    writer.close()
+    assert repository.get_book(a).read_chapter_idx == 3
+    # Saves after closing are ignored
+    writer.save(a, 4, 40)
+    assert writer.idle
+
+
+def test_flush_with_nothing_pending_keeps_coalescing():
+    (a,) = _add_books(1)
+    writer = ProgressWriter(delay=60)
+    assert writer.flush(timeout=5)
+    writer.save(a, 2, 20)
+    time.sleep(0.2)
+    # Still waiting to coalesce, not written straight away
+    assert not writer.idle
+    assert repository.get_book(a).read_chapter_idx == 0
+    writer.close()
@@ -1,11 +1,14 @@
 """Tests for database repository."""
 
+import sqlite3
 import tempfile
+from array import array
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from novel_tui.db.connection import get_connection, reset_connection
+from novel_tui.db.connection import SCHEMA_VERSION, get_connection, reset_connection, writing
 from novel_tui.db.models import Book, Chapter, UserSettings
 from novel_tui.db import repository
 
@@ -52,6 +55,110 @@ def test_get_all_books():
     assert len(books) == 2
 
 
+def test_get_books_shelf_order_and_window():
+    old = repository.add_book(_make_book(file_path="/tmp/a.txt", added_at=datetime(2024, 1, 1)))
+    new = repository.add_book(_make_book(file_path="/tmp/b.txt", added_at=datetime(2024, 6, 1)))
+    read = repository.add_book(_make_book(file_path="/tmp/c.txt", added_at=datetime(2023, 1, 1)))
+    repository.update_read_progress(read.id, chapter_idx=1, position=0)
+
+    assert [b.id for b in repository.get_books(0, 10)] == [read.id, new.id, old.id]
+    assert [b.id for b in repository.get_books(1, 1)] == [new.id]
+    assert repository.count_books() == 3
+    assert repository.get_book(old.id).added_at == datetime(2024, 1, 1)
+
+
+def test_last_read_book():
+    assert repository.get_last_read_book() is None
+    a = repository.add_book(_make_book(file_path="/tmp/a.txt"))
+    b = repository.add_book(_make_book(file_path="/tmp/b.txt"))
+    with writing() as conn:
+        conn.execute("UPDATE books SET last_read_at = 100 WHERE id = ?", (a.id,))
+        conn.execute("UPDATE books SET last_read_at = 200 WHERE id = ?", (b.id,))
+    assert repository.get_last_read_book().id == b.id
+
+
+def test_title_prefix_filter():
+    for i, title in enumerate(["三体", "三体II 黑暗森林", "球状闪电", "Abc_1", "abc%2"]):
+        repository.add_book(_make_book(file_path=f"/tmp/{i}.txt", title=title))
+
+    assert {b.title for b in repository.get_books(0, -1, "三体")} == {"三体", "三体II 黑暗森林"}
+    assert repository.count_books("三体I") == 1
+    # ASCII case is ignored, LIKE wildcards are literal
+    assert repository.count_books("ABC") == 2
+    assert [b.title for b in repository.get_books(0, -1, "abc%")] == ["abc%2"]
+    assert [b.title for b in repository.get_books(0, -1, "abc_")] == ["Abc_1"]
+
+
+def test_text_timestamps_are_migrated(tmp_path):
+    reset_connection()
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """CREATE TABLE books (
+               id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+               file_path TEXT NOT NULL UNIQUE, file_size INTEGER NOT NULL DEFAULT 0,
+               encoding TEXT NOT NULL DEFAULT 'utf-8',
+               word_count INTEGER NOT NULL DEFAULT 0,
+               chapter_count INTEGER NOT NULL DEFAULT 0,
+               added_at TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+               last_read_at TEXT, read_position INTEGER NOT NULL DEFAULT 0,
+               read_chapter_idx INTEGER NOT NULL DEFAULT 0);
+           CREATE TABLE chapters (id INTEGER PRIMARY KEY, book_id INTEGER NOT NULL,
+               idx INTEGER NOT NULL, title TEXT NOT NULL, level INTEGER NOT NULL,
+               byte_offset INTEGER NOT NULL, length INTEGER NOT NULL);
+           INSERT INTO books (title, file_path, added_at, last_read_at)
+           VALUES ('Old', '/tmp/old.txt', '2024-03-01 08:30:00', '2024-03-02 21:00:00');
+           INSERT INTO chapters (book_id, idx, title, level, byte_offset, length)
+           VALUES (1, 0, 'Ch1', 2, 0, 10);"""
+    )
+    conn.commit()
+    conn.close()
+
+    get_connection(db_path)
+    book = repository.get_book(1)
+    assert book.added_at == datetime(2024, 3, 1, 8, 30)
+    assert book.last_read_at == datetime(2024, 3, 2, 21, 0)
+    assert book.file_mtime == 0
+    # The rebuilt books table kept its chapter index
+    assert [c.title for c in repository.get_chapters(1)] == ["Ch1"]
+    assert get_connection().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_mtime_column_is_added(tmp_path):
+    reset_connection()
+    db_path = tmp_path / "v2.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """CREATE TABLE books (
+               id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+               file_path TEXT NOT NULL UNIQUE, file_size INTEGER NOT NULL DEFAULT 0,
+               encoding TEXT NOT NULL DEFAULT 'utf-8',
+               word_count INTEGER NOT NULL DEFAULT 0,
+               chapter_count INTEGER NOT NULL DEFAULT 0,
+               added_at INTEGER NOT NULL, last_read_at INTEGER,
+               read_position INTEGER NOT NULL DEFAULT 0,
+               read_chapter_idx INTEGER NOT NULL DEFAULT 0);
+           INSERT INTO books (title, file_path, added_at) VALUES ('Old', '/tmp/old.txt', 0);
+           PRAGMA user_version = 2;"""
+    )
+    conn.close()
+
+    get_connection(db_path)
+    assert repository.get_book(1).file_mtime == 0
+    assert get_connection().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_file_stats_and_mtimes():
+    book = repository.add_book(_make_book(file_mtime=123))
+    other = repository.add_book(_make_book(file_path="/tmp/b.txt"))
+    assert sorted(repository.get_file_stats()) == [
+        (book.id, "/tmp/test.txt", 1000, 123),
+        (other.id, "/tmp/b.txt", 1000, 0),
+    ]
+    repository.set_file_mtimes({other.id: 456})
+    assert repository.get_book(other.id).file_mtime == 456
+
+
 def test_delete_book():
     book = repository.add_book(_make_book())
     repository.delete_book(book.id)
@@ -83,6 +190,75 @@ def test_add_and_get_chapters():
     assert fetched[1].title == "Chapter 2"
 
 
+def test_import_book_stores_book_and_chapters_together():
+    chapters = [
+        Chapter(book_id=0, index=i, title=f"Chapter {i}", byte_offset=i * 10, length=10)
+        for i in range(3)
+    ]
+    book = repository.import_book(_make_book(chapter_count=3), iter(chapters))
+
+    assert book.id is not None
+    table = repository.get_chapters(book.id)
+    assert [c.title for c in table] == ["Chapter 0", "Chapter 1", "Chapter 2"]
+    assert table[2].book_id == book.id
+    assert chapters[0].book_id == 0
+
+
+def test_failed_import_leaves_no_book():
+    repository.add_book(_make_book())
+    with pytest.raises(sqlite3.IntegrityError):
+        # Same file_path: the book insert fails, so nothing is kept
+        repository.import_book(_make_book(), [Chapter(book_id=0, index=0, title="A", byte_offset=0)])
+    assert repository.count_books() == 1
+
+
+def test_chapter_table_and_title_windows():
+    book = repository.add_book(_make_book())
+    chapters = [
+        Chapter(book_id=book.id, index=i, title=f"第{i}章", byte_offset=i * 100, length=100)
+        for i in range(10)
+    ]
+    chapters[0].level = 1
+    repository.add_chapters(chapters)
+
+    table = repository.get_chapters(book.id)
+    assert len(table) == 10
+    assert list(table.levels[:2]) == [1, 2]
+    assert table[7] == chapters[7]
+    assert table[-1] == chapters[9]
+    assert table[8:] == chapters[8:]
+    assert table.chapter_at(0) == 0
+    assert table.chapter_at(799) == 7
+    assert table.chapter_at(800) == 8
+
+    assert repository.get_chapter_titles(book.id, 3, 6) == ["第3章", "第4章", "第5章"]
+    assert repository.get_chapter_titles(book.id, 0, 1) == ["第0章"]
+    assert repository.get_chapter_titles(book.id, 8) == ["第8章", "第9章"]
+    assert repository.get_chapter_titles(book.id, 10) == []
+    assert len(repository.get_chapter_titles(book.id)) == 10
+
+
+def test_legacy_chapter_rows_are_packed(tmp_path):
+    book = repository.add_book(_make_book())
+    with writing() as conn:
+        conn.executescript(
+            f"""CREATE TABLE chapters (id INTEGER PRIMARY KEY, book_id INTEGER NOT NULL,
+                   idx INTEGER NOT NULL, title TEXT NOT NULL, level INTEGER NOT NULL,
+                   byte_offset INTEGER NOT NULL, length INTEGER NOT NULL);
+                INSERT INTO chapters (book_id, idx, title, level, byte_offset, length)
+                VALUES ({book.id}, 1, 'Ch2', 2, 10, 5), ({book.id}, 0, 'Vol1', 1, 0, 10);
+                PRAGMA user_version = 0;"""
+        )
+    reset_connection()
+    get_connection(tmp_path / "test.db")
+
+    fetched = repository.get_chapters(book.id)
+    assert [(c.title, c.level, c.byte_offset, c.length) for c in fetched] == [
+        ("Vol1", 1, 0, 10),
+        ("Ch2", 2, 10, 5),
+    ]
+
+
 def test_cascade_delete():
     book = repository.add_book(_make_book())
     chapters = [
@@ -91,7 +267,7 @@ def test_cascade_delete():
     repository.add_chapters(chapters)
 
     repository.delete_book(book.id)
-    assert repository.get_chapters(book.id) == []
+    assert len(repository.get_chapters(book.id)) == 0
 
 
 def test_settings():
@@ -105,3 +281,81 @@ def test_settings():
     loaded = repository.get_settings()
     assert loaded.line_spacing == 2
     assert loaded.max_width == 100
+
+
+def test_last_search_roundtrip():
+    book = repository.add_book(_make_book())
+    assert repository.get_last_search(book.id) is None
+
+    repository.save_last_search(book.id, '{"query": "x"}')
+    assert repository.get_last_search(book.id) == '{"query": "x"}'
+    # Search payloads must not leak into reading settings
+    assert repository.get_settings().max_width == 80
+
+    # A result set too big to keep replaces the old one with nothing
+    repository.save_last_search(book.id, None)
+    assert repository.get_last_search(book.id) is None
+
+    repository.save_last_search(book.id, '{"query": "y"}')
+    repository.delete_book(book.id)
+    assert repository.get_last_search(book.id) is None
+
+
+def test_settings_bool_roundtrip():
+    repository.save_settings(UserSettings(live_search=True))
+    assert repository.get_settings().live_search is True
+
+    repository.save_settings(UserSettings(live_search=False))
+    assert repository.get_settings().live_search is False
+
+
+def test_scroll_settings_roundtrip():
+    repository.save_settings(UserSettings(scroll_fps=30, wheel_acceleration=True))
+    loaded = repository.get_settings()
+    assert loaded.scroll_fps == 30
+    assert loaded.wheel_acceleration is True
+
+
+def test_page_tables_keep_latest_geometry():
+    book = repository.add_book(_make_book())
+    tables = {0: array("I", [0, 12]), 1: array("I", [0])}
+    repository.save_page_tables(book.id, (80, 1, 24), "a", tables)
+    loaded = repository.get_page_tables(book.id, (80, 1, 24), "a")
+    assert {i: list(s) for i, s in loaded.items()} == {0: [0, 12], 1: [0]}
+
+    repository.save_page_tables(book.id, (60, 1, 24), "a", {0: array("I", [0, 9, 20])})
+    assert repository.get_page_tables(book.id, (80, 1, 24), "a") == {}
+    assert list(repository.get_page_tables(book.id, (60, 1, 24), "a")[0]) == [0, 9, 20]
+
+    repository.delete_book(book.id)
+    assert repository.get_page_tables(book.id, (60, 1, 24), "a") == {}
+
+
+def test_page_tables_without_source_are_dropped(tmp_path):
+    book = repository.add_book(_make_book())
+    with writing() as conn:
+        conn.executescript(
+            f"""DROP TABLE page_tables;
+                CREATE TABLE page_tables (book_id INTEGER NOT NULL, width INTEGER NOT NULL,
+                    spacing INTEGER NOT NULL, height INTEGER NOT NULL,
+                    chapter_idx INTEGER NOT NULL, starts BLOB NOT NULL,
+                    PRIMARY KEY (book_id, width, spacing, height, chapter_idx)) WITHOUT ROWID;
+                INSERT INTO page_tables VALUES ({book.id}, 80, 1, 24, 0, x'00000000');
+                PRAGMA user_version = 3;"""
+        )
+    reset_connection()
+
+    get_connection(tmp_path / "test.db")
+    assert repository.get_page_tables(book.id, (80, 1, 24), "a") == {}
+    repository.save_page_tables(book.id, (80, 1, 24), "a", {0: array("I", [0])})
+    assert list(repository.get_page_tables(book.id, (80, 1, 24), "a")) == [0]
+
+
+def test_page_tables_of_another_source_are_dropped():
+    book = repository.add_book(_make_book())
+    repository.save_page_tables(book.id, (80, 1, 24), "old", {0: array("I", [0, 12])})
+    assert repository.get_page_tables(book.id, (80, 1, 24), "new") == {}
+
+    repository.save_page_tables(book.id, (80, 1, 24), "new", {1: array("I", [0])})
+    assert repository.get_page_tables(book.id, (80, 1, 24), "old") == {}
+    assert list(repository.get_page_tables(book.id, (80, 1, 24), "new")) == [1]
@@ -0,0 +1,130 @@
+"""Pilot tests for UI behaviour that depends on workers and layout."""
+
+import asyncio
+import threading
+
+import pytest
+from textual.app import App
+from textual.widgets import Button, Checkbox, Input, OptionList
+
+from novel_tui.app import NovelApp
+from novel_tui.core.library_search import BookHits
+from novel_tui.core.search import SearchResult
+from novel_tui.db.connection import get_connection, reset_connection
+from novel_tui.db.models import Book, UserSettings
+from novel_tui.screens import library_search
+from novel_tui.screens.library_search import LibrarySearchScreen
+from novel_tui.screens.reading import SettingsModal
+from novel_tui.widgets.content_view import ContentView
+
+
+@pytest.fixture(autouse=True)
+def _fresh_db(tmp_path):
+    reset_connection()
+    get_connection(tmp_path / "test.db")
+    yield
+    reset_connection()
+
+
+class _ScreenApp(App):
+    def __init__(self, screen) -> None:
+        super().__init__()
+        self._first = screen
+
+    def on_mount(self) -> None:
+        self.push_screen(self._first)
+
+
+def test_superseded_library_search_is_not_listed(monkeypatch):
+    book = Book(id=1, title="书", file_path="/tmp/book.txt")
+    release = threading.Event()
+
+    class FakeSearcher:
+        def __init__(self, books, load_chapters) -> None:
+            pass
+
+        def search(self, query, on_book, **kwargs) -> int:
+            if query == "甲":
+                # Still running (and ignoring cancellation) when "乙" starts
+                release.wait(5)
+            hit = SearchResult(0, "第一章", 0, f"{query}的上下文")
+            on_book(BookHits(book, [hit], truncated=False))
+            return 1
+
+    monkeypatch.setattr(library_search, "LibrarySearcher", FakeSearcher)
+
+    async def run() -> list[str]:
+        screen = LibrarySearchScreen()
+        app = _ScreenApp(screen)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            search_input = screen.query_one("#library-search-input", Input)
+            for query in ("甲", "乙"):
+                search_input.value = query
+                await pilot.press("enter")
+            await pilot.pause()
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            options = screen.query_one("#library-search-results", OptionList)
+            return [
+                str(options.get_option_at_index(i).prompt)
+                for i in range(options.option_count)
+            ]
+
+    prompts = asyncio.run(run())
+    assert len(prompts) == 2  # the book header and its one hit
+    assert "乙的上下文" in prompts[1]
+    assert not any("甲" in p for p in prompts)
+
+
+def test_settings_buttons_fit_a_small_terminal():
+    async def run() -> None:
+        app = NovelApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            app.push_screen(SettingsModal(UserSettings()))
+            await pilot.pause()
+            screen = app.screen
+            for button in screen.query(Button):
+                assert screen.region.contains_region(button.region)
+            # The fields that do not fit are scrolled to, not cut off
+            last = screen.query(Checkbox).last()
+            last.scroll_visible(animate=False)
+            await pilot.pause()
+            fields = screen.query_one("#settings-fields")
+            assert fields.max_scroll_y > 0
+            assert fields.region.contains_region(last.region)
+            await pilot.click("#btn-cancel-settings")
+            await pilot.pause()
+            assert not isinstance(app.screen, SettingsModal)
+
+    asyncio.run(run())
+
+
+class _ContentApp(App):
+    def compose(self):
+        yield ContentView()
+
+
+def test_auto_scroll_stops_when_next_chapter_fails_to_load():
+    def loader(idx: int) -> str:
+        raise OSError("gone")
+
+    async def run() -> None:
+        app = _ContentApp()
+        async with app.run_test(size=(40, 10)) as pilot:
+            view = app.query_one(ContentView)
+            view.set_content("只有一段。", 0)
+            view.set_chapter_loader(loader, 3)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            view.set_auto_scroll_speed(200, by_rows=True)
+            view.start_auto_scroll()
+            for _ in range(20):
+                await pilot.pause(0.05)
+                if not view.auto_scrolling:
+                    break
+            assert not view.auto_scrolling
+
+    asyncio.run(run())
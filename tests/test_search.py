@@ -4,7 +4,16 @@ import tempfile
 from pathlib import Path
 
 from novel_tui.core.reader import BookReader
-from novel_tui.core.search import BookSearcher
+from novel_tui.core.search import (
+    BookSearcher,
+    FoldCache,
+    SearchCache,
+    SearchKey,
+    dump_results,
+    find_all,
+    load_results,
+    match_form,
+)
 from novel_tui.db.models import Chapter
 
 
@@ -58,3 +67,224 @@ def test_search_no_results():
     results = searcher.search("不存在的词")
 
     assert len(results) == 0
+
+
+def _single_chapter(content: str) -> tuple[BookReader, list[Chapter]]:
+    path = _make_file(content)
+    chapters = [Chapter(book_id=1, index=0, title="Ch1", byte_offset=0, length=len(content.encode("utf-8")))]
+    return BookReader(path, "utf-8"), chapters
+
+
+def test_search_cache_hit_skips_reading():
+    reader, chapters = _single_chapter("萧炎来了，萧薰儿也来了。")
+    cache = SearchCache()
+    searcher = BookSearcher(reader, chapters, cache)
+    assert len(searcher.search("萧")) == 2
+
+    reads = []
+    original = reader.read_chapter
+    reader.read_chapter = lambda ch: reads.append(ch) or original(ch)
+    assert len(searcher.search("萧")) == 2
+    assert reads == []
+
+
+def test_search_refines_cached_prefix():
+    content = "第一章\n萧炎来了，萧薰儿也来了。\n第二章\n没有人。"
+    path = _make_file(content)
+    part1 = "第一章\n萧炎来了，萧薰儿也来了。\n".encode("utf-8")
+    chapters = [
+        Chapter(book_id=1, index=0, title="第一章", byte_offset=0, length=len(part1)),
+        Chapter(book_id=1, index=1, title="第二章", byte_offset=len(part1), length=len(content.encode("utf-8")) - len(part1)),
+    ]
+    reader = BookReader(path, "utf-8")
+    searcher = BookSearcher(reader, chapters, SearchCache())
+    searcher.search("萧")
+
+    reads = []
+    original = reader.read_chapter
+    reader.read_chapter = lambda ch: reads.append(ch.index) or original(ch)
+    results = searcher.search("萧炎")
+    assert [(r.chapter_idx, r.char_offset) for r in results] == [(0, 4)]
+    # Chapter 2 had no candidates, so it is never read
+    assert reads == [0]
+
+
+def test_search_cache_evicts_lru():
+    reader, chapters = _single_chapter("abc")
+    cache = SearchCache(max_entries=2)
+    searcher = BookSearcher(reader, chapters, cache)
+    searcher.search("a")
+    searcher.search("b")
+    searcher.search("a")  # refresh "a"
+    searcher.search("c")
+    identity = reader.identity()
+    assert cache.get(SearchKey("a", False, False, identity)) is not None
+    assert cache.get(SearchKey("b", False, False, identity)) is None
+
+
+def test_search_cache_invalidated_by_file_change():
+    reader, chapters = _single_chapter("hello")
+    cache = SearchCache()
+    searcher = BookSearcher(reader, chapters, cache)
+    assert len(searcher.search("hello")) == 1
+
+    reader.file_path.write_bytes(b"world!")
+    assert searcher.search("hello") == []
+
+
+def test_dump_and_load_results():
+    reader, chapters = _single_chapter("萧炎来了")
+    results = BookSearcher(reader, chapters).search("萧炎")
+    key = SearchKey("萧炎", False, False, reader.identity())
+
+    loaded = load_results(dump_results(key, results))
+    assert loaded == (key, results)
+    assert load_results("not json") is None
+
+
+def _three_chapters() -> tuple[BookReader, list[Chapter]]:
+    parts = ["甲萧炎甲萧炎\n", "乙乙乙\n", "丙萧炎丙\n"]
+    path = _make_file("".join(parts))
+    chapters = []
+    offset = 0
+    for i, part in enumerate(parts):
+        length = len(part.encode("utf-8"))
+        chapters.append(Chapter(book_id=1, index=i, title=f"Ch{i}", byte_offset=offset, length=length))
+        offset += length
+    return BookReader(path, "utf-8"), chapters
+
+
+def test_find_next_forward_from_position():
+    searcher = BookSearcher(*_three_chapters())
+    r = searcher.find_next("萧炎", 0, 0)
+    assert (r.chapter_idx, r.char_offset) == (0, 1)
+    r = searcher.find_next("萧炎", 0, 2)
+    assert (r.chapter_idx, r.char_offset) == (0, 4)
+    # Skips chapter 1, which has no match
+    r = searcher.find_next("萧炎", 0, 5)
+    assert (r.chapter_idx, r.char_offset) == (2, 1)
+
+
+def test_find_next_wraps_around():
+    searcher = BookSearcher(*_three_chapters())
+    r = searcher.find_next("萧炎", 2, 2)
+    assert (r.chapter_idx, r.char_offset) == (0, 1)
+
+
+def test_find_next_backward():
+    searcher = BookSearcher(*_three_chapters())
+    r = searcher.find_next("萧炎", 0, 4, backward=True)
+    assert (r.chapter_idx, r.char_offset) == (0, 1)
+    # Wraps from the start of the book to the last match
+    r = searcher.find_next("萧炎", 0, 1, backward=True)
+    assert (r.chapter_idx, r.char_offset) == (2, 1)
+
+
+def test_find_next_stops_at_first_hit():
+    reader, chapters = _three_chapters()
+    reads = []
+    original = reader.read_chapter
+    reader.read_chapter = lambda ch: reads.append(ch.index) or original(ch)
+    BookSearcher(reader, chapters).find_next("萧炎", 0, 0)
+    assert reads == [0]
+
+
+def test_find_next_no_match():
+    searcher = BookSearcher(*_three_chapters())
+    assert searcher.find_next("不存在", 1, 0) is None
+
+
+def test_search_scans_start_chapter_first():
+    reader, chapters = _three_chapters()
+    reads = []
+    original = reader.read_chapter
+    reader.read_chapter = lambda ch: reads.append(ch.index) or original(ch)
+    progress = []
+    results = BookSearcher(reader, chapters).search(
+        "萧炎", start_chapter=2, on_progress=lambda hits: progress.append(len(hits))
+    )
+
+    assert reads == [2, 0, 1]
+    assert progress == [1, 2, 0]
+    # Results are still in book order
+    assert [(r.chapter_idx, r.char_offset) for r in results] == [(0, 1), (0, 4), (2, 1)]
+
+
+def test_cancelled_search_is_not_cached():
+    reader, chapters = _three_chapters()
+    cache = SearchCache()
+    searcher = BookSearcher(reader, chapters, cache)
+    results = searcher.search("萧炎", is_cancelled=lambda: True)
+
+    assert results == []
+    assert len(cache) == 0
+
+
+def test_search_normalized_matches_traditional_and_fullwidth():
+    reader, chapters = _single_chapter("蕭炎說：ＡＢＣ。萧炎又说abc。")
+    searcher = BookSearcher(reader, chapters)
+
+    assert len(searcher.search("萧炎")) == 1
+    hits = searcher.search("萧炎", normalize=True)
+    assert [r.char_offset for r in hits] == [0, 8]
+    hits = searcher.search("abc", normalize=True)
+    assert [r.char_offset for r in hits] == [4, 12]
+    # Offsets point into the original text
+    text = reader.read_chapter(chapters[0])
+    assert text[4:7] == "ＡＢＣ"
+
+
+def test_search_cache_keys_on_normalize():
+    reader, chapters = _single_chapter("蕭炎和萧炎")
+    searcher = BookSearcher(reader, chapters, SearchCache())
+    assert len(searcher.search("萧炎")) == 1
+    assert len(searcher.search("萧炎", normalize=True)) == 2
+
+
+def test_find_all_offsets():
+    text = "萧炎看着蕭炎，aAa"
+    assert list(find_all(text, "萧炎")) == [0]
+    assert list(find_all(text, "萧炎", normalize=True)) == [0, 4]
+    assert list(find_all(text, "aa")) == [7, 8]
+    assert list(find_all(text, "aa", case_sensitive=True)) == []
+    assert list(find_all(text, "a", limit=2)) == [7, 8]
+    assert list(find_all(text, "")) == []
+
+
+def test_fold_cache_shared_across_queries():
+    reader, chapters = _three_chapters()
+    folds = FoldCache()
+    BookSearcher(reader, chapters, folds=folds).search("萧炎", normalize=True)
+    assert len(folds) == 3
+
+    reads = []
+    original = reader.read_chapter
+    reader.read_chapter = lambda ch: reads.append(ch.index) or original(ch)
+    searcher = BookSearcher(reader, chapters, folds=folds)
+    assert len(searcher.search("甲", normalize=True)) == 2
+    r = searcher.find_next("丙", 1, 0, normalize=True)
+    assert (r.chapter_idx, r.char_offset) == (2, 0)
+    assert reads == []
+    # Another case mode is folded separately
+    searcher.search("甲")
+    assert reads == [0, 1, 2]
+
+
+def test_fold_cache_evicts_lru_and_follows_file():
+    reader, chapters = _three_chapters()
+    folds = FoldCache(max_entries=2)
+    BookSearcher(reader, chapters, folds=folds).search("萧炎")
+    assert len(folds) == 2
+    assert folds.get((0, False, False)) is None
+
+    reader.file_path.write_bytes("丁萧炎丁\n".encode("utf-8"))
+    assert BookSearcher(reader, chapters[:1], folds=folds).find_next("丁", 0, 0) is not None
+    assert folds.get((0, False, False)) == ("丁萧炎丁\n", "丁萧炎丁\n")
+    assert len(folds) == 1
+
+
+def test_find_all_with_kept_search_text():
+    text = "萧炎看着蕭炎，aAa"
+    search_text = match_form(text, normalize=True)
+    assert list(find_all(text, "萧炎", normalize=True, search_text=search_text)) == [0, 4]
+    assert list(find_all(text, "AA", normalize=True, search_text=search_text)) == [7, 8]
@@ -0,0 +1,53 @@
+"""Tests for display-width line wrapping."""
+
+from novel_tui.core.wrap import cell_width, char_width, wrap
+
+
+def test_cell_width():
+    assert cell_width("abc") == 3
+    assert cell_width("萧炎") == 4
+    assert cell_width("萧炎，ab！") == 10
+    assert char_width("中") == 2
+    assert char_width("a") == 1
+    assert char_width("“") == 1
+
+
+def test_wrap_by_cells():
+    rows = wrap("一二三四五六七八九十", 8)
+    assert rows == ["一二三四", "五六七八", "九十"]
+    assert all(cell_width(r) <= 8 for r in rows)
+
+
+def test_wrap_mixed_width():
+    text = "萧炎说“OK”然后走了，一路向北。" * 5
+    rows = wrap(text, 15)
+    assert "".join(rows) == text
+    assert all(cell_width(r) <= 15 for r in rows)
+
+
+def test_wrap_short_and_empty():
+    assert wrap("", 10) == [""]
+    assert wrap("短句", 10) == ["短句"]
+    assert wrap("hello", 5) == ["hello"]
+
+
+def test_wrap_no_closing_punctuation_at_line_start():
+    # A hard break would put "。" at the start of the second row
+    rows = wrap("一二三四。五六", 8)
+    assert rows == ["一二三", "四。五六"]
+
+
+def test_wrap_no_opening_punctuation_at_line_end():
+    rows = wrap("一二三「四五六」", 8)
+    assert rows == ["一二三", "「四五", "六」"]
+
+
+def test_wrap_latin_words():
+    assert wrap("hello world foo", 11) == ["hello world", "foo"]
+    assert wrap("hello world foo", 8) == ["hello", "world", "foo"]
+    # A word longer than the row is split
+    assert wrap("abcdefghij", 4) == ["abcd", "efgh", "ij"]
+
+
+def test_wrap_always_progresses():
+    assert wrap("中文", 1) == ["中", "文"]